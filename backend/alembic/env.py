@@ -33,6 +33,11 @@ from app.models.product import Product
 from app.models.store import Store
 from app.models.user_store import UserStore
 from app.models.stock import CurrentStock
+from app.models.stock_snapshot import StockSnapshot
+from app.models.reconciliation import ReconciliationRun
+from app.models.archived_partition import ArchivedPartition
+from app.models.sync_job import SyncJob
+from app.models.sync_session import SyncSession
 from app.models.transaction import InventoryTransaction
 
 target_metadata = Base.metadata
@@ -0,0 +1,32 @@
+"""add barcode trigram index
+
+Revision ID: 3d8a6f1c9e42
+Revises: b9e2f4c7d061
+Create Date: 2026-10-17 23:05:12.604381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8a6f1c9e42'
+down_revision: Union[str, None] = 'b9e2f4c7d061'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 제품 검색: 바코드 부분 일치(ILIKE '%q%')용 pg_trgm GIN 인덱스
+    # (pg_trgm 확장은 7c1e4a9d2f63에서 생성됨)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_products_barcode_trgm', 'products', ['barcode'], unique=False,
+        postgresql_using='gin', postgresql_ops={'barcode': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_products_barcode_trgm', table_name='products')
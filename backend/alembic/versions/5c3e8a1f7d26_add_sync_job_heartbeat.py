@@ -0,0 +1,31 @@
+"""add sync job heartbeat
+
+Revision ID: 5c3e8a1f7d26
+Revises: 8b5f2c7e3a19
+Create Date: 2026-10-18 09:12:37.481920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e8a1f7d26'
+down_revision: Union[str, None] = '8b5f2c7e3a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sync_jobs', sa.Column('claim_id', app.db.types.GUID(), nullable=True, comment='선점 토큰 (처리 중인 실행 식별)'))
+    op.add_column('sync_jobs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True, comment='처리 워커 마지막 생존 기록 시각'))
+    # 이미 RUNNING인 작업은 시작 시각을 마지막 생존 기록으로 간주 (복구 대상 판단 유지)
+    op.execute("UPDATE sync_jobs SET heartbeat_at = started_at WHERE status = 'RUNNING'")
+
+
+def downgrade() -> None:
+    op.drop_column('sync_jobs', 'heartbeat_at')
+    op.drop_column('sync_jobs', 'claim_id')
@@ -0,0 +1,35 @@
+"""add archived_partitions
+
+Revision ID: 6e2b9d4a1f87
+Revises: 3d8a6f1c9e42
+Create Date: 2026-10-17 23:31:45.270914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2b9d4a1f87'
+down_revision: Union[str, None] = '3d8a6f1c9e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'archived_partitions',
+        sa.Column('name', sa.String(length=63), nullable=False, comment='파티션 테이블 이름'),
+        sa.Column('range_start', sa.Date(), nullable=False, comment='파티션 범위 시작 (포함)'),
+        sa.Column('range_end', sa.Date(), nullable=False, comment='파티션 범위 끝 (미포함)'),
+        sa.Column('path', sa.Text(), nullable=False, comment='내보낸 gzip CSV 경로'),
+        sa.Column('dropped', sa.Boolean(), nullable=False, comment='분리 후 테이블 삭제 여부'),
+        sa.Column('archived_at', sa.DateTime(), nullable=False, comment='보관 시각'),
+        sa.PrimaryKeyConstraint('name', name=op.f('pk_archived_partitions')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('archived_partitions')
@@ -0,0 +1,39 @@
+"""add trigram search indexes to products
+
+Revision ID: 7c1e4a9d2f63
+Revises: 2b423957f08f
+Create Date: 2026-10-17 10:12:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a9d2f63'
+down_revision: Union[str, None] = '2b423957f08f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 제품 검색(GET /products?search=)용 인덱스
+    #   - name: ILIKE '%q%' / 유사도 연산자(%)용 pg_trgm GIN 인덱스
+    #   - barcode: LIKE 'q%' 접두어 검색용 varchar_pattern_ops B-tree
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_products_name_trgm', 'products', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_products_barcode_prefix', 'products', ['barcode'], unique=False,
+        postgresql_ops={'barcode': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_products_barcode_prefix', table_name='products')
+    op.drop_index('idx_products_name_trgm', table_name='products')
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 제거하지 않음
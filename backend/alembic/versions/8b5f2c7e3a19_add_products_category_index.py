@@ -0,0 +1,28 @@
+"""add products category index
+
+Revision ID: 8b5f2c7e3a19
+Revises: 6e2b9d4a1f87
+Create Date: 2026-10-17 23:58:06.148530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b5f2c7e3a19'
+down_revision: Union[str, None] = '6e2b9d4a1f87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /products?category_id=: 2b423957f08f에서 idx_products_category_id를 제거한 뒤
+    # 대체 인덱스가 없어 카테고리 필터가 products 전체를 읽고 있었음
+    op.create_index('idx_products_category_id', 'products', ['category_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_products_category_id', table_name='products')
@@ -0,0 +1,52 @@
+"""add status to current_stocks
+
+Revision ID: a3f0c8d51e27
+Revises: 7c1e4a9d2f63
+Create Date: 2026-10-17 11:02:18.554310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f0c8d51e27'
+down_revision: Union[str, None] = '7c1e4a9d2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 컬럼 추가 (기존 행 채우기 전이므로 NULL 허용)
+    op.add_column('current_stocks', sa.Column(
+        'status', sa.String(length=10), nullable=True,
+        comment='재고 상태 (LOW: 안전재고 미만, NORMAL: 안전재고 2배 미만, GOOD: 그 이상)'
+    ))
+
+    # 2. 기존 재고 행 채우기 (app.services.inventory.get_stock_status와 같은 기준)
+    op.execute("""
+        UPDATE current_stocks AS cs
+        SET status = CASE
+            WHEN cs.quantity < p.safety_stock THEN 'LOW'
+            WHEN cs.quantity < p.safety_stock * 2 THEN 'NORMAL'
+            ELSE 'GOOD'
+        END
+        FROM products AS p
+        WHERE p.id = cs.product_id
+    """)
+
+    # 3. NOT NULL 전환 및 인덱스 생성
+    op.alter_column('current_stocks', 'status', existing_type=sa.String(length=10), nullable=False)
+    op.create_index('idx_current_stocks_status_store', 'current_stocks', ['status', 'store_id'], unique=False)
+    op.create_index(
+        'idx_current_stocks_low', 'current_stocks', ['store_id'], unique=False,
+        postgresql_where=sa.text("status = 'LOW'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_current_stocks_low', table_name='current_stocks', postgresql_where=sa.text("status = 'LOW'"))
+    op.drop_index('idx_current_stocks_status_store', table_name='current_stocks')
+    op.drop_column('current_stocks', 'status')
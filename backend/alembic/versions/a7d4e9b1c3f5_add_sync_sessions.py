@@ -0,0 +1,39 @@
+"""add sync_sessions
+
+Revision ID: a7d4e9b1c3f5
+Revises: f1c6d8e2a7b4
+Create Date: 2026-10-17 18:05:12.734106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e9b1c3f5'
+down_revision: Union[str, None] = 'f1c6d8e2a7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_sessions',
+        sa.Column('id', app.db.types.GUID(), nullable=False, comment='세션 ID'),
+        sa.Column('total_chunks', sa.Integer(), nullable=True, comment='전체 청크 수 (클라이언트 신고, 선택)'),
+        sa.Column('acked_chunk', sa.Integer(), nullable=False, comment='반영을 마친 마지막 청크 번호 (0=없음)'),
+        sa.Column('synced_count', sa.Integer(), nullable=False, comment='성공 항목 수 (누적)'),
+        sa.Column('failed_count', sa.Integer(), nullable=False, comment='실패 항목 수 (누적)'),
+        sa.Column('last_result', sa.JSON(), nullable=True, comment='마지막 청크 처리 결과 (SyncResponse)'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='생성 시각'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, comment='마지막 청크 반영 시각'),
+        sa.Column('completed_at', sa.DateTime(), nullable=True, comment='완료 시각 (NULL=진행 중)'),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_sync_sessions')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_sessions')
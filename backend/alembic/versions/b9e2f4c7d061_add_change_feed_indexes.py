@@ -0,0 +1,41 @@
+"""add change feed indexes
+
+Revision ID: b9e2f4c7d061
+Revises: a7d4e9b1c3f5
+Create Date: 2026-10-17 18:41:27.519843
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e2f4c7d061'
+down_revision: Union[str, None] = 'a7d4e9b1c3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /sync/changes: 종류별 (변경 시각, 키) 순 조회
+    op.create_index(
+        'idx_products_changed', 'products',
+        [sa.text('coalesce(updated_at, created_at)'), 'id'], unique=False,
+    )
+    op.create_index(
+        'idx_current_stocks_updated', 'current_stocks',
+        ['updated_at', 'product_id', 'store_id'], unique=False,
+    )
+    # 파티션 테이블: 부모에 만들면 모든 월 파티션에 생성됨
+    op.create_index(
+        'idx_transactions_changed', 'inventory_transactions',
+        [sa.text('coalesce(synced_at, created_at)'), 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_transactions_changed', table_name='inventory_transactions')
+    op.drop_index('idx_current_stocks_updated', table_name='current_stocks')
+    op.drop_index('idx_products_changed', table_name='products')
@@ -0,0 +1,118 @@
+"""partition inventory_transactions by month
+
+Revision ID: c5d2e7f9a41b
+Revises: a3f0c8d51e27
+Create Date: 2026-10-17 13:40:07.912655
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d2e7f9a41b'
+down_revision: Union[str, None] = 'a3f0c8d51e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = 'inventory_transactions'
+LEGACY = 'inventory_transactions_unpartitioned'
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    'id, product_id, store_id, user_id, type, quantity, reason, note, '
+    'created_at, synced_at, local_id'
+)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _columns() -> list:
+    return [
+        sa.Column('id', app.db.types.GUID(), nullable=False, comment='트랜잭션 고유 식별자'),
+        sa.Column('product_id', app.db.types.GUID(), nullable=False, comment='제품 ID'),
+        sa.Column('store_id', app.db.types.GUID(), nullable=False, comment='매장/창고 ID'),
+        sa.Column('user_id', app.db.types.GUID(), nullable=True, comment='트랜잭션 작성자 ID (MVP 단계에서는 NULL 허용)'),
+        sa.Column('type', postgresql.ENUM(name='transaction_type', create_type=False), nullable=False, comment='트랜잭션 유형 (INBOUND/OUTBOUND/ADJUST)'),
+        sa.Column('quantity', sa.Integer(), nullable=False, comment='수량 변화 (양수=입고, 음수=출고/조정)'),
+        sa.Column('reason', postgresql.ENUM(name='adjust_reason', create_type=False), nullable=True, comment='조정 사유 (type=ADJUST일 때 필수)'),
+        sa.Column('note', sa.Text(), nullable=True, comment='비고 (자유 텍스트)'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='트랜잭션 발생 일시 (오프라인 시 로컬 시각)'),
+        sa.Column('synced_at', sa.DateTime(), nullable=True, comment='서버 동기화 완료 일시 (NULL=동기화 대기)'),
+        sa.Column('local_id', app.db.types.GUID(), nullable=True, comment='클라이언트 로컬 ID (오프라인 생성 ID)'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id']),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index('idx_transactions_product_created', TABLE, ['product_id', 'created_at'], unique=False)
+    op.create_index('idx_transactions_store_created', TABLE, ['store_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_inventory_transactions_created_at'), TABLE, ['created_at'], unique=False)
+
+
+def _drop_indexes() -> None:
+    op.drop_index(op.f('ix_inventory_transactions_created_at'), table_name=TABLE)
+    op.drop_index('idx_transactions_store_created', table_name=TABLE)
+    op.drop_index('idx_transactions_product_created', table_name=TABLE)
+
+
+def upgrade() -> None:
+    # 1. 기존 테이블을 옆으로 치우고 이름이 겹치는 인덱스/제약조건 제거
+    _drop_indexes()
+    op.drop_constraint('uq_inventory_transactions_local_id', TABLE, type_='unique')
+    op.execute(f'ALTER TABLE {TABLE} RENAME CONSTRAINT inventory_transactions_pkey TO {LEGACY}_pkey')
+    op.rename_table(TABLE, LEGACY)
+
+    # 2. created_at 기준 RANGE 파티션 테이블 생성
+    #    PK/UNIQUE에는 파티션 키가 포함되어야 하므로 (id, created_at), (local_id, created_at)
+    #    (오프라인 재전송은 같은 local_id + 같은 created_at이므로 중복 방지는 그대로 동작)
+    op.create_table(
+        TABLE,
+        *_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at', name='inventory_transactions_pkey'),
+        sa.UniqueConstraint('local_id', 'created_at', name='uq_inventory_transactions_local_id'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    _create_indexes()
+
+    # 3. 월별 파티션: 가장 오래된 데이터의 달 ~ 이번 달 + MONTHS_AHEAD, 그리고 기본 파티션
+    oldest = op.get_bind().execute(sa.text(f'SELECT min(created_at) FROM {LEGACY}')).scalar()
+    this_month = _add_months(datetime.utcnow().date(), 0)
+    month = _add_months((oldest or datetime.utcnow()).date(), 0)
+    while month <= _add_months(this_month, MONTHS_AHEAD):
+        op.execute(
+            f"CREATE TABLE {TABLE}_p{month:%Y%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+    # 4. 데이터 이동
+    op.execute(f'INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {LEGACY}')
+    op.drop_table(LEGACY)
+
+
+def downgrade() -> None:
+    # 분리(DETACH)되어 보관 중인 파티션의 데이터는 되돌리지 않음
+    op.create_table(
+        LEGACY,
+        *_columns(),
+        sa.PrimaryKeyConstraint('id', name=f'{LEGACY}_pkey'),
+    )
+    op.execute(f'INSERT INTO {LEGACY} ({COLUMNS}) SELECT {COLUMNS} FROM {TABLE}')
+
+    op.drop_table(TABLE)  # 파티션도 함께 삭제됨
+    op.rename_table(LEGACY, TABLE)
+    op.execute(f'ALTER TABLE {TABLE} RENAME CONSTRAINT {LEGACY}_pkey TO inventory_transactions_pkey')
+    op.create_unique_constraint('uq_inventory_transactions_local_id', TABLE, ['local_id'])
+    _create_indexes()
@@ -0,0 +1,40 @@
+"""add stock_snapshots
+
+Revision ID: d8e3f1a6b920
+Revises: c5d2e7f9a41b
+Create Date: 2026-10-17 15:12:44.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e3f1a6b920'
+down_revision: Union[str, None] = 'c5d2e7f9a41b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stock_snapshots',
+        sa.Column('product_id', app.db.types.GUID(), nullable=False, comment='제품 ID (복합 PK, FK)'),
+        sa.Column('store_id', app.db.types.GUID(), nullable=False, comment='매장 ID (복합 PK, FK)'),
+        sa.Column('taken_at', sa.DateTime(), nullable=False, comment='스냅샷 기준 시각 (created_at < taken_at 인 트랜잭션까지 반영)'),
+        sa.Column('quantity', sa.Integer(), nullable=False, comment='기준 시각의 재고 수량'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], name=op.f('fk_stock_snapshots_product_id_products')),
+        sa.ForeignKeyConstraint(['store_id'], ['stores.id'], name=op.f('fk_stock_snapshots_store_id_stores')),
+        sa.PrimaryKeyConstraint('product_id', 'store_id', 'taken_at', name=op.f('pk_stock_snapshots')),
+    )
+    op.create_index('idx_stock_snapshots_store_taken', 'stock_snapshots', ['store_id', 'taken_at'], unique=False)
+    op.create_index('idx_stock_snapshots_taken', 'stock_snapshots', ['taken_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_stock_snapshots_taken', table_name='stock_snapshots')
+    op.drop_index('idx_stock_snapshots_store_taken', table_name='stock_snapshots')
+    op.drop_table('stock_snapshots')
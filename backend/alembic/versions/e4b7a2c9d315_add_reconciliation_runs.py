@@ -0,0 +1,42 @@
+"""add reconciliation_runs
+
+Revision ID: e4b7a2c9d315
+Revises: d8e3f1a6b920
+Create Date: 2026-10-17 16:48:03.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7a2c9d315'
+down_revision: Union[str, None] = 'd8e3f1a6b920'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reconciliation_runs',
+        sa.Column('id', app.db.types.GUID(), nullable=False, comment='실행 ID'),
+        sa.Column('basis_at', sa.DateTime(), nullable=True, comment='기준 재고 스냅샷 시각 (NULL=전체 원장 합산)'),
+        sa.Column('repair', sa.Boolean(), nullable=False, comment='불일치 자동 보정 여부'),
+        sa.Column('last_product_id', app.db.types.GUID(), nullable=True, comment='마지막으로 확인한 재고 키 (제품 ID)'),
+        sa.Column('last_store_id', app.db.types.GUID(), nullable=True, comment='마지막으로 확인한 재고 키 (매장 ID)'),
+        sa.Column('checked_count', sa.Integer(), nullable=False, comment='확인한 재고 행 수'),
+        sa.Column('drift_count', sa.Integer(), nullable=False, comment='불일치 건수'),
+        sa.Column('repaired_count', sa.Integer(), nullable=False, comment='보정한 건수'),
+        sa.Column('started_at', sa.DateTime(), nullable=False, comment='시작 시각'),
+        sa.Column('finished_at', sa.DateTime(), nullable=True, comment='완료 시각 (NULL=진행 중 또는 중단)'),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_reconciliation_runs')),
+    )
+    op.create_index(op.f('ix_reconciliation_runs_started_at'), 'reconciliation_runs', ['started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_reconciliation_runs_started_at'), table_name='reconciliation_runs')
+    op.drop_table('reconciliation_runs')
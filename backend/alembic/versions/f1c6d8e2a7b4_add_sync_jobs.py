@@ -0,0 +1,41 @@
+"""add sync_jobs
+
+Revision ID: f1c6d8e2a7b4
+Revises: e4b7a2c9d315
+Create Date: 2026-10-17 17:32:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import app.db.types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d8e2a7b4'
+down_revision: Union[str, None] = 'e4b7a2c9d315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', app.db.types.GUID(), nullable=False, comment='작업 ID'),
+        sa.Column('status', sa.String(length=10), nullable=False, comment='작업 상태 (PENDING/RUNNING/DONE/FAILED)'),
+        sa.Column('item_count', sa.Integer(), nullable=False, comment='요청 트랜잭션 수'),
+        sa.Column('payload', sa.JSON(), nullable=False, comment='요청 본문 (SyncRequest)'),
+        sa.Column('result', sa.JSON(), nullable=True, comment='처리 결과 (SyncResponse)'),
+        sa.Column('error', sa.Text(), nullable=True, comment='실패 사유'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, comment='접수 시각'),
+        sa.Column('started_at', sa.DateTime(), nullable=True, comment='처리 시작 시각'),
+        sa.Column('finished_at', sa.DateTime(), nullable=True, comment='완료 시각'),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_sync_jobs')),
+    )
+    op.create_index('idx_sync_jobs_status_created', 'sync_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sync_jobs_status_created', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,8 +9,9 @@ from app.db.session import get_db
 # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
 # from app.api.deps import get_current_user
 # from app.models.user import User, UserRole
-from app.core.exceptions import ForbiddenException
-from app.schemas.admin import LowStockItemResponse
+from app.core.exceptions import BadRequestException, ForbiddenException
+from app.core.query_analyzer import slow_query_sampler
+from app.schemas.admin import LowStockItemResponse, SlowQueryResponse
 from app.schemas.common import ErrorResponse
 from app.services import report as report_service
 
@@ -24,7 +26,9 @@ router = APIRouter()
 
     - **권한**: ADMIN 전용
     - 현재 재고가 안전재고 미만인 항목만 반환
-    - 부족 수량(`shortage`)이 큰 순으로 정렬
+    - 부족 수량(`shortage`)이 큰 순으로 정렬 (같으면 제품명, 매장명 순)
+    - **필터**: `store_id`(매장), `category_id`(카테고리)
+    - **페이지네이션(선택)**: `limit`을 지정하면 `page`/`limit` 단위로 조회, 생략하면 전체
     """,
     responses={
         403: {
@@ -43,6 +47,10 @@ router = APIRouter()
     }
 )
 async def get_low_stock_alerts(
+    store_id: Optional[UUID] = Query(None, description="매장 ID"),
+    category_id: Optional[UUID] = Query(None, description="카테고리 ID"),
+    page: int = Query(1, ge=1, description="페이지 번호 (limit 지정 시)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="페이지당 항목 수 (생략 시 전체)"),
     db: AsyncSession = Depends(get_db)
     # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
     # current_user: User = Depends(get_current_user)
@@ -52,24 +60,33 @@ async def get_low_stock_alerts(
     # if current_user.role != UserRole.ADMIN:
     #     raise ForbiddenException("Only ADMIN can view alerts")
         
-    return await report_service.get_low_stock_items(db)
+    return await report_service.get_low_stock_items(
+        db, store_id=store_id, category_id=category_id, page=page, limit=limit
+    )
 
 
 @router.get(
     "/exports/low-stock",
-    summary="안전재고 미달 목록 엑셀 다운로드",
+    summary="안전재고 미달 목록 다운로드",
     description="""
-    안전재고 미만인 제품-매장 목록을 엑셀 파일로 다운로드합니다.
+    안전재고 미만인 제품-매장 목록을 파일로 다운로드합니다.
 
     - **권한**: ADMIN 전용
-    - 파일명: `low_stock_YYYYMMDD.xlsx`
-    - Excel 2007+ 형식 (.xlsx)
+    - **형식(`format`)**:
+        - `xlsx` (기본): Excel 2007+ 형식, 파일 생성이 끝난 뒤 전송 시작
+        - `csv`: UTF-8, 첫 줄 헤더. DB에서 읽는 대로 바로 전송
+        - `ndjson`: 행마다 JSON 객체 한 줄. DB에서 읽는 대로 바로 전송
+    - **필터**: `store_id`(매장), `category_id`(카테고리)
+    - 파일명: `low_stock_YYYYMMDD.{format}`
+    - 부족 수량이 큰 순으로 정렬
     """,
     responses={
         200: {
-            "description": "엑셀 파일 다운로드",
+            "description": "파일 다운로드",
             "content": {
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": {}
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": {},
+                "text/csv": {},
+                "application/x-ndjson": {}
             }
         },
         403: {
@@ -79,22 +96,138 @@ async def get_low_stock_alerts(
     }
 )
 async def export_low_stock(
+    format: str = Query("xlsx", regex=report_service.EXPORT_FORMAT_PATTERN, description="파일 형식 (xlsx | csv | ndjson)"),
+    store_id: Optional[UUID] = Query(None, description="매장 ID"),
+    category_id: Optional[UUID] = Query(None, description="카테고리 ID"),
     db: AsyncSession = Depends(get_db)
     # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
     # current_user: User = Depends(get_current_user)
 ):
-    """안전재고 미만 목록 엑셀 다운로드 (ADMIN)"""
+    """안전재고 미만 목록 다운로드 (ADMIN)"""
     # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
     # if current_user.role != UserRole.ADMIN:
     #     raise ForbiddenException("Only ADMIN can export data")
-        
-    items = await report_service.get_low_stock_items(db)
-    excel_file = report_service.generate_low_stock_excel(items)
 
-    filename = f"low_stock_{datetime.now().strftime('%Y%m%d')}.xlsx"
+    filename = f"low_stock_{datetime.now().strftime('%Y%m%d')}.{format}"
+
+    if format == "xlsx":
+        excel_file = await report_service.build_low_stock_excel(db, store_id, category_id)
+        body = report_service.iter_file_chunks(excel_file)
+    else:
+        stmt = report_service.low_stock_rows_query(store_id, category_id)
+        body = report_service.stream_export(db.bind, stmt, format)
+
+    return StreamingResponse(
+        body,
+        media_type=report_service.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+@router.get(
+    "/exports/transactions",
+    summary="트랜잭션 원장 다운로드",
+    description="""
+    입출고 트랜잭션 원장을 CSV 또는 NDJSON으로 스트리밍합니다.
+    야간 적재 등 대량 수집용이며, `/transactions` 목록 API를 페이지 단위로 순회하는 대신 사용합니다.
+
+    - **권한**: ADMIN 전용
+    - **기간(`start`, `end`)**: `start <= createdAt < end` (ISO 8601, 둘 다 선택)
+    - **매장(`store_id`)**: 특정 매장만 (선택)
+    - **형식(`format`)**: `csv` (기본, 첫 줄 헤더) | `ndjson`
+    - 정렬: `createdAt`, `id` 오름차순
+    - 파일명: `transactions_YYYYMMDD.{format}`
+    """,
+    responses={
+        200: {
+            "description": "파일 다운로드",
+            "content": {
+                "text/csv": {},
+                "application/x-ndjson": {}
+            }
+        },
+        400: {
+            "model": ErrorResponse,
+            "description": "잘못된 요청 파라미터 (기간 역전 등)"
+        },
+        403: {
+            "model": ErrorResponse,
+            "description": "권한 없음 (ADMIN 전용)"
+        }
+    }
+)
+async def export_transactions(
+    start: Optional[datetime] = Query(None, description="시작 일시 (포함)"),
+    end: Optional[datetime] = Query(None, description="종료 일시 (미포함)"),
+    store_id: Optional[UUID] = Query(None, description="매장 ID"),
+    format: str = Query("csv", regex=report_service.STREAM_FORMAT_PATTERN, description="파일 형식 (csv | ndjson)"),
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """트랜잭션 원장 다운로드 (ADMIN)"""
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # if current_user.role != UserRole.ADMIN:
+    #     raise ForbiddenException("Only ADMIN can export data")
+    if start and end and start >= end:
+        raise BadRequestException("start must be earlier than end")
+
+    stmt = report_service.transaction_ledger_query(start=start, end=end, store_id=store_id)
+    filename = f"transactions_{datetime.now().strftime('%Y%m%d')}.{format}"
 
     return StreamingResponse(
-        excel_file,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        report_service.stream_export(db.bind, stmt, format),
+        media_type=report_service.EXPORT_MEDIA_TYPES[format],
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
+
+
+@router.get(
+    "/diagnostics/slow-queries",
+    response_model=List[SlowQueryResponse],
+    summary="느린 쿼리 실행 계획 조회",
+    description="""
+    임계값(`SLOW_QUERY_THRESHOLD_MS`)을 넘은 쿼리와 자동 수집된 실행 계획을 조회합니다.
+
+    - **권한**: ADMIN 전용
+    - `SLOW_QUERY_EXPLAIN_ENABLED=true`이고 PostgreSQL일 때만 수집 (아니면 빈 목록)
+    - 쿼리 지문(파라미터 값을 무시한 SQL 형태)별로 하나씩, 최근에 관측된 순
+    - 최대 `SLOW_QUERY_BUFFER_SIZE`개까지 보관 (서버 프로세스별, 재시작 시 초기화)
+    - 실행 계획은 `EXPLAIN (FORMAT JSON)` 결과이며 ANALYZE 없이 수집됨 (실제 실행 없음)
+    - 바인드 파라미터 값은 기록하지 않음 (타입 이름만 `parameterTypes`로 제공)
+    """,
+    responses={
+        403: {
+            "model": ErrorResponse,
+            "description": "권한 없음 (ADMIN 전용)"
+        }
+    }
+)
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="최대 항목 수"),
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """느린 쿼리 실행 계획 조회 (ADMIN)"""
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # if current_user.role != UserRole.ADMIN:
+    #     raise ForbiddenException("Only ADMIN can view diagnostics")
+    return slow_query_sampler.records()[:limit]
+
+
+@router.delete(
+    "/diagnostics/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="느린 쿼리 기록 초기화",
+    description="""
+    수집된 느린 쿼리 기록을 비웁니다 (인덱스 추가 등 조치 후 재확인용).
+
+    - **권한**: ADMIN 전용
+    """,
+)
+async def clear_slow_queries(
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """느린 쿼리 기록 초기화 (ADMIN)"""
+    slow_query_sampler.clear()
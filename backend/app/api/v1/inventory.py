@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException
@@ -9,7 +10,9 @@ from app.db.session import get_db
 # from app.models.user import User
 from app.schemas.inventory import StockListResponse, StockItemResponse
 from app.schemas.common import ErrorResponse
+from app.core.counting import COUNT_MODE_PATTERN
 from app.services import inventory as inventory_service
+from app.services import snapshot as snapshot_service
 
 router = APIRouter()
 
@@ -23,6 +26,8 @@ router = APIRouter()
     - **매장 필터(`store_id`)**: 특정 매장의 재고만 조회
     - **카테고리 필터(`category_id`)**: 특정 카테고리의 제품만 조회
     - **상태 필터(`status`)**: LOW(안전재고 미달), NORMAL, GOOD 중 선택
+    - **커서(`cursor`)**: 응답의 `pagination.nextCursor`를 전달하면 OFFSET 없이 다음 페이지를 조회합니다. 지정 시 `page`는 무시됩니다.
+    - **건수(`count`)**: `exact`(기본, 정확한 건수), `estimate`(DB 통계 기반 추정치, 빠름), `none`(건수 생략, `total`/`totalPages`는 null)
     """,
     responses={
         400: {
@@ -46,6 +51,8 @@ async def list_stocks(
     store_id: Optional[str] = None,
     category_id: Optional[str] = None,
     status: Optional[str] = Query(None, regex="^(LOW|NORMAL|GOOD)$"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (pagination.nextCursor)"),
+    count: str = Query("exact", regex=COUNT_MODE_PATTERN, description="전체 건수 계산 방식 (exact | estimate | none)"),
     db: AsyncSession = Depends(get_db)
     # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
     # current_user: User = Depends(get_current_user)
@@ -75,17 +82,14 @@ async def list_stocks(
         limit=limit,
         store_id=s_id,
         category_id=c_id,
-        status=status
+        status=status,
+        cursor=cursor,
+        count=count
     )
     
-    # 응답 변환 (status 계산 포함)
+    # 응답 변환 (status는 current_stocks.status 컬럼 값 사용)
     items = []
     for stock in stocks:
-        stock_status = inventory_service.get_stock_status(
-            stock.quantity, 
-            stock.product.safety_stock
-        )
-        
         # Pydantic 모델로 변환 (status 주입)
         # StockItemResponse는 ORM 객체 + status 필드를 원함
         # dictionary로 만들어서 validate
@@ -93,12 +97,13 @@ async def list_stocks(
             "product": stock.product,
             "store": stock.store,
             "quantity": stock.quantity,
-            "status": stock_status,
+            "status": stock.status,
             "lastAlertedAt": stock.last_alerted_at
         }
         items.append(StockItemResponse.model_validate(item_dict))
 
-    total_pages = (total + limit - 1) // limit
+    total_pages = (total + limit - 1) // limit if total is not None else None
+    next_cursor = inventory_service.stock_cursor(stocks[-1]) if len(stocks) == limit else None
 
     return {
         "items": items,
@@ -106,10 +111,66 @@ async def list_stocks(
             "page": page,
             "limit": limit,
             "total": total,
-            "totalPages": total_pages
+            "totalPages": total_pages,
+            "nextCursor": next_cursor
         }
     }
 
+from app.schemas.inventory import StockAsOfResponse, StockAsOfItemResponse
+
+# /stocks/{product_id}보다 먼저 선언해야 "as-of"가 product_id로 매칭되지 않음
+@router.get(
+    "/stocks/as-of",
+    response_model=StockAsOfResponse,
+    summary="과거 시점 재고 조회",
+    description="""
+    매장의 특정 시점(`at`) 재고를 원장 기준으로 계산합니다.
+
+    - `at` 시각까지 발생한 트랜잭션이 반영된 수량입니다.
+    - 가장 가까운 재고 스냅샷에서 그 사이 트랜잭션만 더하거나 빼서 계산하므로 전체 이력을 합산하지 않습니다.
+    - **제품 필터(`product_id`)**: 특정 제품만 조회
+    """,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "잘못된 요청 파라미터"
+        }
+    }
+)
+async def get_stocks_as_of(
+    at: datetime = Query(..., description="조회 시점 (ISO 8601, 타임존 없으면 UTC)"),
+    store_id: str = Query(..., description="매장 ID"),
+    product_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """과거 시점 재고 조회"""
+    try:
+        s_id = UUID(store_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid store_id")
+
+    p_id = None
+    if product_id:
+        try:
+            p_id = UUID(product_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid product_id")
+
+    snapshot_at, rows = await snapshot_service.get_stocks_as_of(db, at, s_id, p_id)
+
+    return {
+        "at": at,
+        "snapshotAt": snapshot_at,
+        "items": [
+            StockAsOfItemResponse.model_validate(
+                {"product": product, "store": store, "quantity": quantity}
+            )
+            for product, store, quantity in rows
+        ],
+    }
+
 from app.schemas.inventory import ProductStockDetailResponse
 
 @router.get(
@@ -175,8 +236,6 @@ async def get_product_stock_detail(
     total_qty = 0
     
     for stock in stocks:
-        status = inventory_service.get_stock_status(stock.quantity, product.safety_stock)
-        
         # Pydantic 모델 변환
         # product 정보는 이미 조회했으므로 재사용
         # store는 joinedload로 로딩됨
@@ -184,7 +243,7 @@ async def get_product_stock_detail(
             "product": product,
             "store": stock.store,
             "quantity": stock.quantity,
-            "status": status,
+            "status": stock.status,
             "lastAlertedAt": stock.last_alerted_at
         }
         stock_items.append(StockItemResponse.model_validate(item_dict))
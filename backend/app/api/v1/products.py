@@ -1,14 +1,18 @@
+import json
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
 # from app.api.deps import get_current_user
 # from app.models.user import User
-from app.schemas.product import ProductCreate, ProductResponse, ProductListResponse
+from app.schemas.product import (
+    ProductCreate, ProductResponse, ProductListResponse, BarcodeBatchRequest, BarcodeBatchResponse
+)
 from app.schemas.common import ErrorResponse
+from app.core.counting import COUNT_MODE_PATTERN
 from app.services import product as product_service
 from app.core.exceptions import ForbiddenException
 
@@ -21,6 +25,7 @@ router = APIRouter()
     description="""
     바코드 번호로 제품 정보를 조회합니다.
     - **Unique Index**를 활용하여 대량의 데이터에서도 빠른 조회가 가능합니다.
+    - 조회 결과는 서버 메모리에 캐시되며, 제품 등록/수정 시 즉시 무효화됩니다.
     - 바코드 스캐너 연동 시 사용됩니다.
     """,
     responses={
@@ -43,10 +48,31 @@ async def get_product_by_barcode(
     barcode: str,
     db: AsyncSession = Depends(get_db)
 ):
-    product = await product_service.get_product_by_barcode(db, barcode)
-    if not product:
+    # 캐시된 직렬화 결과를 그대로 반환 (response_model 재검증/재직렬화 생략)
+    payload = await product_service.get_product_payload_by_barcode(db, barcode)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return Response(content=payload, media_type="application/json")
+
+@router.post(
+    "/barcode:batch",
+    response_model=BarcodeBatchResponse,
+    summary="바코드 일괄 조회",
+    description="""
+    여러 바코드를 한 번의 요청으로 조회합니다 (최대 100개).
+    - 오프라인 후 재접속한 단말이 바코드를 하나씩 조회하는 대신 사용합니다.
+    - 존재하는 제품은 `items`, 없는 바코드는 `missing`으로 반환합니다.
+    - 단건 조회와 같은 캐시를 사용하며, 캐시에 없는 바코드만 DB에서 한 번에 조회합니다.
+    """,
+)
+async def get_products_by_barcodes(
+    data: BarcodeBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    found, missing = await product_service.get_product_payloads_by_barcodes(db, data.barcodes)
+    # 캐시된 직렬화 결과를 이어 붙여 응답 구성 (단건 조회와 동일한 형식)
+    content = b'{"items":[' + b",".join(found) + b'],"missing":' + json.dumps(missing).encode() + b"}"
+    return Response(content=content, media_type="application/json")
 
 @router.get(
     "",
@@ -55,9 +81,10 @@ async def get_product_by_barcode(
     description="""
     제품 목록을 페이지네이션하여 조회합니다.
 
-    - **검색(`search`)**: 제품명 또는 바코드에 검색어가 포함된 제품을 찾습니다.
+    - **검색(`search`)**: 제품명에 검색어가 포함된(또는 유사한) 제품을 찾습니다. 숫자 검색어는 바코드 접두어로도 찾습니다.
     - **카테고리(`category_id`)**: 특정 카테고리의 제품만 필터링합니다.
-    - **정렬**: 최신 등록순으로 정렬됩니다.
+    - **정렬**: 최신 등록순으로 정렬됩니다. 검색 시에는 관련도순(바코드 접두어 일치 → 이름 유사도)입니다.
+    - **건수(`count`)**: `exact`(기본, 정확한 건수), `estimate`(DB 통계 기반 추정치, 빠름), `none`(건수 생략, `total`/`totalPages`는 null)
     """,
     responses={
         400: {
@@ -78,8 +105,9 @@ async def get_product_by_barcode(
 async def list_products(
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(10, ge=1, le=100, description="페이지당 항목 수 (최대 100)"),
-    search: Optional[str] = Query(None, description="검색어 (제품명/바코드)"),
+    search: Optional[str] = Query(None, description="검색어 (제품명 / 바코드 접두어)"),
     category_id: Optional[str] = Query(None, description="카테고리 필터 (UUID)"),
+    count: str = Query("exact", regex=COUNT_MODE_PATTERN, description="전체 건수 계산 방식 (exact | estimate | none)"),
     db: AsyncSession = Depends(get_db)
 ):
     cat_id = None
@@ -90,10 +118,10 @@ async def list_products(
              raise HTTPException(status_code=400, detail="Invalid category_id format")
 
     items, total = await product_service.list_products(
-        db, page=page, limit=limit, search=search, category_id=cat_id
+        db, page=page, limit=limit, search=search, category_id=cat_id, count=count
     )
 
-    total_pages = (total + limit - 1) // limit
+    total_pages = (total + limit - 1) // limit if total is not None else None
 
     return {
         "items": items,
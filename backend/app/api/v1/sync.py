@@ -1,13 +1,23 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
 # from app.api.deps import get_current_user
 # from app.models.user import User
-from app.schemas.sync import SyncRequest, SyncResponse
+from app.schemas.sync import (
+    SyncRequest, SyncResponse, SyncJobResponse,
+    SyncSessionCreate, SyncSessionResponse, SyncChunkResponse, SyncChangesResponse,
+)
 from app.schemas.common import ErrorResponse
+from app.core.config import settings
+from app.core.exceptions import NotFoundException
 from app.services import sync as sync_service
+from app.services import sync_jobs as sync_job_service
+from app.services import sync_sessions as sync_session_service
+from app.services import sync_changes as sync_changes_service
 
 router = APIRouter()
 
@@ -61,3 +71,251 @@ async def sync_transactions(
     """오프라인 트랜잭션 동기화"""
     # TODO: 인증 구현 후 활성화 - 현재는 user=None으로 처리
     return await sync_service.sync_transactions(db, request, user=None)
+
+
+def _job_response(job) -> dict:
+    return {
+        "jobId": job.id,
+        "status": job.status,
+        "itemCount": job.item_count,
+        "createdAt": job.created_at,
+        "startedAt": job.started_at,
+        "finishedAt": job.finished_at,
+        "result": job.result,
+        "error": job.error,
+    }
+
+
+@router.post(
+    "/jobs",
+    response_model=SyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="오프라인 트랜잭션 비동기 동기화 (작업 접수)",
+    description="""
+    `POST /sync/transactions`와 같은 요청을 작업으로 접수하고 즉시 작업 ID를 반환합니다.
+    대용량 배치로 요청 시간이 프록시 타임아웃을 넘을 수 있을 때 사용합니다.
+
+    - 처리는 서버 백그라운드에서 진행되며, 같은 매장의 작업은 접수 순서대로 처리됩니다.
+    - 결과는 `GET /sync/jobs/{jobId}`로 조회합니다 (`result`는 `POST /sync/transactions` 응답과 동일).
+    - 같은 작업을 다시 접수해도 `localId` 중복 체크로 이중 반영되지 않습니다.
+    """,
+    responses={
+        401: {
+            "model": ErrorResponse,
+            "description": "인증 필요"
+        }
+    }
+)
+async def create_sync_job(
+    request: SyncRequest,
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """오프라인 트랜잭션 비동기 동기화 작업 접수"""
+    job = await sync_job_service.create_sync_job(db, request)
+    sync_job_service.get_sync_job_runner().submit(job.id)
+    return _job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=SyncJobResponse,
+    summary="비동기 동기화 작업 조회",
+    description="""
+    동기화 작업의 상태와 결과를 조회합니다.
+
+    - **상태(`status`)**: PENDING(대기) → RUNNING(처리 중) → DONE(완료) | FAILED(실패)
+    - **대기(`wait`)**: 0보다 크면 작업이 끝나거나 지정한 초가 지날 때까지 응답을 미룹니다 (long-poll).
+    """,
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "작업을 찾을 수 없음"
+        }
+    }
+)
+async def get_sync_job(
+    job_id: UUID,
+    wait: int = Query(0, ge=0, le=settings.SYNC_JOB_MAX_WAIT_SECONDS, description="완료까지 대기할 최대 시간 (초)"),
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """비동기 동기화 작업 조회"""
+    job = await sync_job_service.wait_for_sync_job(db, job_id, wait)
+    if job is None:
+        raise NotFoundException("Sync job not found")
+    return _job_response(job)
+
+
+def _session_response(session) -> dict:
+    return {
+        "sessionId": session.id,
+        "totalChunks": session.total_chunks,
+        "ackedChunk": session.acked_chunk,
+        "nextChunk": session.acked_chunk + 1,
+        "syncedCount": session.synced_count,
+        "failedCount": session.failed_count,
+        "createdAt": session.created_at,
+        "updatedAt": session.updated_at,
+        "completedAt": session.completed_at,
+    }
+
+
+@router.post(
+    "/sessions",
+    response_model=SyncSessionResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="재개 가능한 동기화 세션 생성",
+    description=f"""
+    대용량 오프라인 배치를 순서 있는 청크로 나눠 올리기 위한 세션을 생성합니다.
+
+    1. `POST /sync/sessions` → `sessionId`
+    2. `PUT /sync/sessions/{{sessionId}}/chunks/{{seq}}`로 1번 청크부터 차례대로 전송 (청크당 최대 {settings.SYNC_CHUNK_MAX_ITEMS}건)
+    3. 연결이 끊기면 `GET /sync/sessions/{{sessionId}}`의 `nextChunk`부터 이어서 전송
+    4. `POST /sync/sessions/{{sessionId}}/complete`로 종료
+    """,
+)
+async def create_sync_session(
+    request: SyncSessionCreate,
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """동기화 세션 생성"""
+    session = await sync_session_service.create_sync_session(db, request.total_chunks)
+    return _session_response(session)
+
+
+@router.get(
+    "/sessions/{session_id}",
+    response_model=SyncSessionResponse,
+    summary="동기화 세션 진행 상황 조회",
+    description="재시도 전에 호출하여 `nextChunk`(= `ackedChunk` + 1)부터 이어서 전송합니다.",
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "세션을 찾을 수 없음"
+        }
+    }
+)
+async def get_sync_session(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """동기화 세션 진행 상황 조회"""
+    session = await sync_session_service.get_sync_session(db, session_id)
+    return _session_response(session)
+
+
+@router.put(
+    "/sessions/{session_id}/chunks/{seq}",
+    response_model=SyncChunkResponse,
+    summary="동기화 청크 전송",
+    description="""
+    `seq`번 청크를 받아 즉시 반영합니다. 요청 본문과 `result` 형식은 `POST /sync/transactions`와 같습니다.
+
+    - `seq`는 `nextChunk`여야 합니다. 다르면 409(`SYNC_CHUNK_OUT_OF_ORDER`)와 함께 `details.nextChunk`를 돌려줍니다.
+    - 응답을 받지 못한 마지막 청크를 다시 보내면 다시 반영하지 않고 저장된 결과를 돌려줍니다 (`replayed: true`).
+    """,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "청크 크기 초과 등 잘못된 요청"
+        },
+        404: {
+            "model": ErrorResponse,
+            "description": "세션을 찾을 수 없음"
+        },
+        409: {
+            "model": ErrorResponse,
+            "description": "청크 순서 불일치 또는 완료된 세션"
+        }
+    }
+)
+async def upload_sync_chunk(
+    session_id: UUID,
+    request: SyncRequest,
+    seq: int = Path(..., ge=1, description="청크 번호 (1부터)"),
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """동기화 청크 전송"""
+    session, result, replayed = await sync_session_service.upload_sync_chunk(
+        db, session_id, seq, request, user=None
+    )
+    return {
+        "session": _session_response(session),
+        "chunk": seq,
+        "replayed": replayed,
+        "result": result,
+    }
+
+
+@router.post(
+    "/sessions/{session_id}/complete",
+    response_model=SyncSessionResponse,
+    summary="동기화 세션 완료",
+    description="세션을 종료합니다. 생성 시 `totalChunks`를 지정했다면 모든 청크가 반영된 뒤에만 완료할 수 있습니다.",
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "세션을 찾을 수 없음"
+        },
+        409: {
+            "model": ErrorResponse,
+            "description": "반영되지 않은 청크가 남음"
+        }
+    }
+)
+async def complete_sync_session(
+    session_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """동기화 세션 완료"""
+    session = await sync_session_service.complete_sync_session(db, session_id)
+    return _session_response(session)
+
+
+@router.get(
+    "/changes",
+    response_model=SyncChangesResponse,
+    summary="변경분 조회 (로컬 캐시 갱신)",
+    description=f"""
+    마지막 조회 이후 추가/변경된 제품, 재고, 트랜잭션만 반환합니다.
+    목록 API를 처음부터 다시 받지 않고 로컬 캐시를 최신으로 유지할 때 사용합니다.
+
+    - **처음 조회** (`since` 없음): 전체 제품/재고를 반환합니다. 트랜잭션은 이후 반영분부터 받습니다.
+    - **이후 조회**: 직전 응답의 `nextToken`을 `since`로 전달합니다.
+    - **`hasMore`**: true면 `limit`을 넘는 변경이 남았으므로 `nextToken`으로 바로 다시 조회합니다.
+    - 최근 {settings.SYNC_CHANGES_LAG_SECONDS}초 안의 변경과, 아직 커밋되지 않은 트랜잭션이 시작된 이후의 변경은 다음 조회에 포함됩니다.
+    - 같은 행이 두 번 올 수 있으므로 키(제품 `id`, 재고 `productId`+`storeId`, 트랜잭션 `id`) 기준으로 덮어씁니다.
+    """,
+    responses={
+        400: {
+            "model": ErrorResponse,
+            "description": "잘못된 토큰"
+        }
+    }
+)
+async def get_changes(
+    since: Optional[str] = Query(None, description="직전 응답의 nextToken"),
+    store_id: Optional[UUID] = Query(None, description="재고/트랜잭션 매장 필터"),
+    limit: int = Query(500, ge=1, le=1000, description="종류별 최대 건수"),
+    db: AsyncSession = Depends(get_db)
+    # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
+    # current_user: User = Depends(get_current_user)
+):
+    """변경분 조회"""
+    products, stocks, transactions, token, has_more = await sync_changes_service.get_changes(
+        db, since, store_id, limit
+    )
+    return {
+        "products": products,
+        "stocks": stocks,
+        "transactions": transactions,
+        "nextToken": token,
+        "hasMore": has_more,
+    }
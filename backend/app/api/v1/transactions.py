@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status
@@ -15,7 +16,10 @@ from app.schemas.transaction import (
     TransactionListResponse
 )
 from app.schemas.common import ErrorResponse
+from app.core.counting import COUNT_MODE_PATTERN
+from app.core.config import settings
 from app.services import inventory as inventory_service
+from app.services import coalescer as coalescer_service
 
 router = APIRouter()
 
@@ -54,7 +58,10 @@ async def inbound(
 ):
     """입고 처리"""
     # TODO: 인증 구현 후 활성화 - 현재는 user=None으로 처리
-    tx, new_stock, _ = await inventory_service.process_inbound(db, data, user=None)
+    if settings.STOCK_COALESCER_ENABLED:
+        tx, new_stock, _ = await coalescer_service.process_inbound(data, user=None)
+    else:
+        tx, new_stock, _ = await inventory_service.process_inbound(db, data, user=None)
     
     resp = TransactionResultResponse.model_validate(tx)
     resp.new_stock = new_stock
@@ -101,7 +108,11 @@ async def outbound(
 ):
     """출고 처리"""
     # TODO: 인증 구현 후 활성화 - 현재는 user=None으로 처리
-    tx, new_stock, safety_alert = await inventory_service.process_outbound(db, data, user=None)
+    if settings.STOCK_COALESCER_ENABLED:
+        # 같은 (제품, 매장) 요청을 모아 그룹 커밋 (요청 세션은 사용하지 않음)
+        tx, new_stock, safety_alert = await coalescer_service.process_outbound(data, user=None)
+    else:
+        tx, new_stock, safety_alert = await inventory_service.process_outbound(db, data, user=None)
     
     resp = TransactionResultResponse.model_validate(tx)
     resp.new_stock = new_stock
@@ -144,7 +155,10 @@ async def adjust(
 ):
     """재고 조정"""
     # TODO: 인증 구현 후 활성화 - 현재는 user=None으로 처리
-    tx, new_stock, _ = await inventory_service.process_adjust(db, data, user=None)
+    if settings.STOCK_COALESCER_ENABLED:
+        tx, new_stock, _ = await coalescer_service.process_adjust(data, user=None)
+    else:
+        tx, new_stock, _ = await inventory_service.process_adjust(db, data, user=None)
     
     resp = TransactionResultResponse.model_validate(tx)
     resp.new_stock = new_stock
@@ -161,6 +175,9 @@ async def adjust(
     - **제품 필터(`product_id`)**: 특정 제품의 이력만 조회
     - **타입 필터(`type`)**: INBOUND, OUTBOUND, ADJUST 중 선택
     - 최신순으로 정렬됩니다.
+    - **커서(`cursor`)**: 응답의 `pagination.nextCursor`를 전달하면 OFFSET 없이 다음 페이지를 조회합니다 (깊은 페이지에서도 일정한 속도). 지정 시 `page`는 무시됩니다.
+    - **건수(`count`)**: `exact`(기본, 정확한 건수), `estimate`(DB 통계 기반 추정치, 빠름), `none`(건수 생략, `total`/`totalPages`는 null)
+    - **기간(`start`, `end`)**: 발생 일시 `start` 이상 `end` 미만만 조회. 지정한 기간의 월별 파티션만 읽으므로 최근 이력 조회 시 지정을 권장합니다.
     """,
     responses={
         400: {
@@ -172,14 +189,21 @@ async def adjust(
 async def list_transactions(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (pagination.nextCursor)"),
+    count: str = Query("exact", regex=COUNT_MODE_PATTERN, description="전체 건수 계산 방식 (exact | estimate | none)"),
     store_id: Optional[str] = None,
     product_id: Optional[str] = None,
     type: Optional[str] = None,
+    start: Optional[datetime] = Query(None, description="발생 일시 시작 (포함)"),
+    end: Optional[datetime] = Query(None, description="발생 일시 끝 (미포함)"),
     db: AsyncSession = Depends(get_db)
     # TODO: 인증 구현 후 활성화 (나중에 구현 예정)
     # current_user: User = Depends(get_current_user)
 ):
     """트랜잭션 이력 조회"""
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
     s_id = None
     if store_id:
         try:
@@ -195,10 +219,12 @@ async def list_transactions(
             raise HTTPException(status_code=400, detail="Invalid product_id")
 
     items, total = await inventory_service.list_transactions(
-        db, page=page, limit=limit, store_id=s_id, product_id=p_id, type=type
+        db, page=page, limit=limit, store_id=s_id, product_id=p_id, type=type, cursor=cursor, count=count,
+        start=start, end=end
     )
     
-    total_pages = (total + limit - 1) // limit
+    total_pages = (total + limit - 1) // limit if total is not None else None
+    next_cursor = inventory_service.transaction_cursor(items[-1]) if len(items) == limit else None
     
     return {
         "items": items,
@@ -206,6 +232,7 @@ async def list_transactions(
             "page": page,
             "limit": limit,
             "total": total,
-            "totalPages": total_pages
+            "totalPages": total_pages,
+            "nextCursor": next_cursor
         }
     }
@@ -0,0 +1,81 @@
+"""
+프로세스 내 캐시 (In-process TTL Cache)
+
+파일 역할:
+    자주 반복되는 조회 결과를 짧은 시간 동안 메모리에 보관하는 LRU + TTL 캐시입니다.
+    예) 대시보드가 주기적으로 호출하는 목록 API의 전체 건수(COUNT),
+        바코드 스캔 제품 조회 응답
+
+주의:
+    - 워커 프로세스마다 별도로 존재합니다 (프로세스 간 공유/무효화 없음)
+    - TTL 동안은 오래된 값이 반환될 수 있으므로 정확성이 중요한 값에는 사용하지 말 것
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    LRU + TTL 캐시
+
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - ttl_seconds가 지난 항목은 조회 시 만료 처리
+    - ttl_seconds <= 0 이면 캐시를 사용하지 않음 (항상 miss)
+    - hits / misses / evictions(용량 초과로 제거된 항목 수) 통계 제공
+    """
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 값 조회 (없거나 만료되었으면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목과 통계 초기화"""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
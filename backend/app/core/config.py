@@ -159,6 +159,284 @@ class Settings(BaseSettings):
     기본값: 10
     """
 
+    DB_APPLICATION_NAME: str = "donedone-api"
+    """
+    DB 연결의 application_name (PostgreSQL pg_stat_activity에 표시)
+
+    용도:
+        - 변경분 조회 상한 계산 시 이 앱의 트랜잭션만 고려 (psql/백업/모니터링 세션 제외)
+        - 운영 중 DB 세션 식별
+    기본값: "donedone-api"
+    """
+
+    # ========== Stock Write Coalescer Settings ==========
+
+    STOCK_COALESCER_ENABLED: bool = False
+    """
+    입고/출고/조정 요청의 그룹 커밋(Write Coalescing) 사용 여부
+
+    용도:
+        - 같은 (제품, 매장)에 대한 요청을 잠시 모아 한 번의 DB 트랜잭션으로 반영
+        - 프로모션 등으로 한 SKU에 출고 스캔이 몰릴 때 current_stocks 행 경합 감소
+
+    주의:
+        - 프로세스 내 버퍼이므로 워커 프로세스 간에는 합쳐지지 않음
+        - 요청마다 최대 STOCK_COALESCER_WINDOW_MS 만큼 응답이 지연될 수 있음
+
+    기본값: False
+    """
+
+    STOCK_COALESCER_WINDOW_MS: int = 5
+    """
+    그룹 커밋 대기 시간 (밀리초)
+    같은 (제품, 매장)의 첫 요청이 들어온 뒤 이 시간 동안 들어온 요청을 함께 반영합니다.
+    기본값: 5
+    """
+
+    STOCK_COALESCER_MAX_BATCH: int = 100
+    """
+    그룹 커밋 최대 배치 크기
+    대기 시간이 끝나기 전이라도 버퍼가 이 크기에 도달하면 즉시 반영합니다.
+    기본값: 100
+    """
+
+    # ========== Low Stock Alert Settings ==========
+
+    LOW_STOCK_ALERT_ENABLED: bool = False
+    """
+    안전재고 미달 알림 발송 사용 여부
+
+    용도:
+        - 재고 변경으로 안전재고 미만에 새로 진입한 (제품, 매장)을 커밋 후 알림 큐에 넣고
+          백그라운드 워커가 모아서 LOW_STOCK_ALERT_SINK로 전달
+        - 변경된 행만 처리하므로 카탈로그 크기와 무관하게 동작
+
+    기본값: False
+    """
+
+    LOW_STOCK_ALERT_SINK: str = "log"
+    """
+    알림 전달 대상
+
+    옵션:
+        - "log": 구조화 로그(WARNING)로 기록
+        - "webhook": LOW_STOCK_ALERT_WEBHOOK_URL로 JSON POST
+
+    기본값: "log"
+    """
+
+    LOW_STOCK_ALERT_WEBHOOK_URL: str = ""
+    """
+    webhook 알림 수신 URL (LOW_STOCK_ALERT_SINK="webhook"일 때 필수)
+    본문: {"alerts": [{"productId", "storeId", "quantity", "safetyStock", "detectedAt"}, ...]}
+    """
+
+    LOW_STOCK_ALERT_COOLDOWN_MINUTES: int = 360
+    """
+    같은 (제품, 매장) 재알림 최소 간격 (분)
+    current_stocks.last_alerted_at 기준으로 이 시간 안에는 다시 알리지 않습니다.
+    기본값: 360 (6시간)
+    """
+
+    LOW_STOCK_ALERT_BATCH_SIZE: int = 100
+    """
+    워커가 한 번에 처리(중복 제거 + 전달)하는 최대 알림 수
+    기본값: 100
+    """
+
+    LOW_STOCK_ALERT_QUEUE_SIZE: int = 10000
+    """
+    알림 대기열 최대 크기
+    가득 차면 새 알림은 버리고 경고 로그를 남깁니다
+    (누락분은 GET /alerts/low-stock으로 확인 가능).
+    기본값: 10000
+    """
+
+    # ========== Transaction Ledger Partition Settings ==========
+
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 3
+    """
+    inventory_transactions 월별 파티션을 미리 만들어 둘 개월 수 (PostgreSQL)
+    앱 시작 시와 이후 하루마다 이번 달 ~ N개월 뒤 파티션이 없으면 생성합니다.
+    기본값: 3
+    """
+
+    TRANSACTION_HOT_MONTHS: int = 12
+    """
+    원장에 남겨 둘(hot) 개월 수
+    scripts/archive_transactions.py가 이보다 오래된 월 파티션을 압축 파일로 내보내고 분리합니다.
+    기본값: 12
+    """
+
+    TRANSACTION_ARCHIVE_DIR: str = "archive/transactions"
+    """
+    분리된 파티션을 내보낼 디렉터리 (inventory_transactions_pYYYYMM.csv.gz)
+    기본값: "archive/transactions"
+    """
+
+    # ========== Stock Snapshot Settings ==========
+
+    STOCK_SNAPSHOT_INTERVAL_HOURS: int = 24
+    """
+    재고 스냅샷 간격 (시간, UTC 기준 경계)
+    과거 시점 재고 조회는 가장 가까운 스냅샷 + 그 사이 원장 합계로 계산하므로
+    간격이 짧을수록 조회 범위가 작아지고 스냅샷 행은 늘어납니다.
+    기본값: 24 (매일 00:00 UTC)
+    """
+
+    STOCK_SNAPSHOT_SETTLE_MINUTES: int = 10
+    """
+    스냅샷 경계 시각 이후 실제 스냅샷을 만들기까지 기다리는 시간 (분)
+    경계 직전에 시작해 경계 이후에 커밋되는 온라인 트랜잭션이 빠지지 않도록 합니다.
+    (더 늦게 동기화되는 오프라인 트랜잭션은 동기화 시 스냅샷에 반영)
+    기본값: 10
+    """
+
+    # ========== Stock Reconciliation Settings ==========
+
+    STOCK_RECONCILE_INTERVAL_HOURS: float = 0
+    """
+    current_stocks ↔ 원장 합계 대사 주기 (시간)
+    0이면 앱에서 주기 실행하지 않음 (scripts/reconcile_stocks.py로 수동/cron 실행)
+    기본값: 0
+    """
+
+    STOCK_RECONCILE_REPAIR: bool = False
+    """
+    주기 대사에서 불일치를 원장 기준으로 자동 보정할지 여부 (False면 로그로 보고만)
+    기본값: False
+    """
+
+    STOCK_RECONCILE_CHUNK_SIZE: int = 1000
+    """
+    대사 시 한 번에 확인(및 체크포인트 커밋)하는 재고 행 수
+    메모리 사용량과 체크포인트 간격을 결정합니다.
+    기본값: 1000
+    """
+
+    # ========== Sync Job Settings ==========
+
+    SYNC_JOB_MAX_CONCURRENCY: int = 4
+    """
+    프로세스당 동시에 처리하는 비동기 동기화 작업 수 (POST /sync/jobs)
+    기본값: 4
+    """
+
+    SYNC_JOB_STORE_CONCURRENCY: int = 1
+    """
+    매장당 동시에 처리하는 동기화 작업 수 (프로세스 기준)
+    같은 매장 재고 행을 잠그는 작업끼리 경합하지 않고 접수 순서대로 반영됩니다.
+    기본값: 1
+    """
+
+    SYNC_JOB_HEARTBEAT_SECONDS: int = 30
+    """
+    처리 중인 동기화 작업의 heartbeat_at 갱신 주기 (초)
+    기본값: 30
+    """
+
+    SYNC_JOB_STALE_MINUTES: int = 15
+    """
+    RUNNING 상태에서 heartbeat_at이 이 시간 넘게 갱신되지 않은 작업은 처리 프로세스가 죽은 것으로
+    보고 앱 시작 시 다시 처리 (SYNC_JOB_HEARTBEAT_SECONDS보다 충분히 크게)
+    기본값: 15
+    """
+
+    SYNC_JOB_MAX_WAIT_SECONDS: int = 30
+    """
+    GET /sync/jobs/{id}?wait= 로 완료를 기다릴 수 있는 최대 시간 (초, long-poll)
+    기본값: 30
+    """
+
+    SYNC_CHUNK_MAX_ITEMS: int = 500
+    """
+    재개 가능한 동기화 세션의 청크 하나에 담을 수 있는 최대 트랜잭션 수
+    (PUT /sync/sessions/{id}/chunks/{seq}, 요청 본문 크기와 서버 메모리 상한)
+    기본값: 500
+    """
+
+    SYNC_CHANGES_LAG_SECONDS: int = 10
+    """
+    변경분 조회(GET /sync/changes) 상한에서 추가로 빼는 여유 시간 (초)
+
+    상한은 min(현재, 진행 중인 가장 오래된 DB 트랜잭션 시작 시각) - 이 시간입니다.
+    변경 시각(updated_at 등)은 앱 서버 시계로 커밋 전에 기록되므로, 앱 서버와 DB 서버의
+    시계 차이보다 크게 잡아야 합니다 (트랜잭션 소요 시간과는 무관).
+    기본값: 10
+    """
+
+    SYNC_CHANGES_MAX_HORIZON_LAG_SECONDS: int = 300
+    """
+    변경분 조회 상한이 진행 중인 트랜잭션 때문에 현재보다 뒤처질 수 있는 최대 시간 (초)
+
+    이보다 오래 열려 있는 트랜잭션(멈춘 워커, idle in transaction 등)은 상한 계산에서 제외해
+    /sync/changes가 멈추지 않게 합니다. 대신 그런 트랜잭션이 나중에 커밋하는 변경은
+    이미 지나간 조회 범위에 기록되어 클라이언트가 받지 못할 수 있습니다
+    (전체 조회로 복구, 상한이 붙잡히면 경고 로그를 남김).
+    기본값: 300
+    """
+
+    # ========== List Count Settings ==========
+
+    COUNT_CACHE_TTL_SECONDS: float = 0
+    """
+    목록 API exact 건수(count=exact) 캐시 유지 시간 (초)
+
+    용도:
+        - 대시보드가 같은 필터로 1페이지를 반복 호출할 때 count(*) 재실행 방지
+        - 0이면 캐시 사용 안 함 (항상 정확한 건수)
+
+    권장값:
+        - 폴링 대시보드: 5~30초
+
+    기본값: 0
+    """
+
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+    """
+    건수 캐시 최대 항목 수 (필터 조합 수, 초과 시 LRU 제거)
+    기본값: 1024
+    """
+
+    # ========== Barcode Cache Settings ==========
+
+    BARCODE_CACHE_TTL_SECONDS: float = 300
+    """
+    바코드 스캔 조회(GET /products/barcode/{barcode}) 응답 캐시 유지 시간 (초)
+
+    용도:
+        - 스캐너 핫패스에서 DB 조회 없이 직렬화된 응답을 바로 반환
+        - 제품 생성/수정/삭제 시 커밋 시점에 해당 바코드는 즉시 무효화됨
+        - TTL은 ORM을 거치지 않은 변경(직접 SQL 등)에 대한 안전장치
+        - 0이면 캐시 사용 안 함
+
+    기본값: 300
+    """
+
+    BARCODE_CACHE_MAX_ENTRIES: int = 10000
+    """
+    바코드 캐시 최대 항목 수 (초과 시 LRU 제거)
+    기본값: 10000
+    """
+
+    # ========== Product Search Settings ==========
+
+    PRODUCT_SEARCH_MODE: str = "trigram"
+    """
+    제품 목록 검색(GET /products?search=) 방식
+
+    옵션:
+        - "trigram": PostgreSQL pg_trgm GIN 인덱스 사용 + 유사도 순 정렬
+                     (오타/부분 일치 허용, 마이그레이션으로 pg_trgm 확장 필요)
+        - "like": 기존 ILIKE 부분 일치 (pg_trgm을 설치할 수 없는 환경용)
+
+    참고:
+        - 숫자로만 된 검색어는 두 모드 모두 바코드 접두어(prefix) 검색을 함께 사용
+        - PostgreSQL이 아닌 DB(SQLite 테스트 등)에서는 항상 "like"로 동작
+
+    기본값: "trigram"
+    """
+
     # ========== Security Settings ==========
 
     SECRET_KEY: str
@@ -226,6 +504,81 @@ class Settings(BaseSettings):
     기본값: 7
     """
 
+    # ========== Compression Settings ==========
+
+    COMPRESSION_ENABLED: bool = True
+    """
+    요청 본문 해제(Content-Encoding) 및 응답 압축(Accept-Encoding) 사용 여부
+    gzip은 항상, zstd는 zstandard 패키지가 설치된 경우에만 지원합니다.
+    기본값: True
+    """
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    """
+    이 크기(바이트) 미만의 응답은 압축하지 않음 (스트리밍 응답은 크기와 무관하게 압축)
+    기본값: 1024
+    """
+
+    COMPRESSION_MAX_DECODED_BYTES: int = 50 * 1024 * 1024
+    """
+    압축된 요청 본문을 푼 최대 크기 (바이트, 초과 시 413 - 압축 폭탄 방지)
+    기본값: 50MB
+    """
+
+    # ========== Metrics Settings ==========
+
+    METRICS_ENABLED: bool = True
+    """
+    요청 지연 시간 / DB 쿼리 메트릭 수집 및 GET /metrics 노출 여부
+    값은 워커 프로세스별로 따로 집계됩니다.
+    """
+
+    # ========== Query Budget Settings ==========
+
+    QUERY_BUDGET_PER_REQUEST: int = 30
+    """
+    요청 하나에서 허용하는 DB 쿼리 수 (초과 시 라우트와 함께 경고 로그, 0이면 검사 안 함)
+    기본값: 30
+    """
+
+    QUERY_REPEAT_THRESHOLD: int = 5
+    """
+    한 요청에서 같은 SQL이 이 횟수 이상 실행되면 N+1 의심 경고 (0이면 검사 안 함)
+    기본값: 5
+    """
+
+    SERVER_TIMING_ENABLED: bool = True
+    """
+    응답에 Server-Timing 헤더(DB 시간/쿼리 수, 앱 처리 시간) 추가 여부
+    내부 처리 시간이 노출되므로 외부 공개 환경에서는 끌 수 있습니다.
+    """
+
+    # ========== Slow Query Settings ==========
+
+    SLOW_QUERY_EXPLAIN_ENABLED: bool = False
+    """
+    느린 쿼리의 실행 계획 자동 수집 여부 (PostgreSQL 전용, GET /diagnostics/slow-queries)
+    별도 커넥션에서 EXPLAIN (FORMAT JSON)을 실행합니다 (ANALYZE 없음).
+    """
+
+    SLOW_QUERY_THRESHOLD_MS: float = 500.0
+    """
+    실행 계획을 수집할 쿼리 실행 시간 임계값 (ms)
+    기본값: 500
+    """
+
+    SLOW_QUERY_BUFFER_SIZE: int = 50
+    """
+    보관할 느린 쿼리 기록 수 (쿼리 지문별 1개, 초과 시 가장 오래 관측되지 않은 것부터 제거)
+    기본값: 50
+    """
+
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: int = 300
+    """
+    같은 쿼리 지문의 실행 계획을 다시 수집하기까지의 최소 간격 (초)
+    기본값: 300 (5분)
+    """
+
     # ========== CORS Settings ==========
 
     ALLOWED_ORIGINS: str = "http://localhost:3000"
@@ -0,0 +1,104 @@
+"""
+목록 API 전체 건수 계산 (Count Modes)
+
+파일 역할:
+    목록 API의 pagination.total 계산 방식을 `count` 파라미터로 선택할 수 있게 합니다.
+
+    - exact:    SELECT count(*) (기본값, 기존 동작). COUNT_CACHE_TTL_SECONDS > 0 이면
+                같은 필터 조합의 결과를 짧게 캐시합니다.
+    - estimate: PostgreSQL 플래너 추정치. 필터가 없으면 pg_class.reltuples,
+                있으면 EXPLAIN의 Plan Rows를 사용합니다 (테이블을 읽지 않음).
+                추정을 지원하지 않는 DB(SQLite 등)에서는 exact로 계산합니다.
+    - none:     건수를 계산하지 않습니다 (total/totalPages = null).
+
+왜 필요한가?:
+    수백만 건의 트랜잭션 이력에서 count(*)는 페이지 조회보다 비쌀 때가 많고,
+    대시보드가 1페이지를 주기적으로 호출할 때마다 원장 전체를 다시 세게 됩니다.
+"""
+from typing import Hashable, Literal, Optional
+
+from sqlalchemy import Table, func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.query_analyzer import ExplainStatement
+
+logger = get_logger(__name__)
+
+CountMode = Literal["exact", "estimate", "none"]
+COUNT_MODE_PATTERN = "^(exact|estimate|none)$"
+
+count_cache = TTLCache(
+    maxsize=settings.COUNT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+)
+"""exact 건수 캐시 (key: 호출자가 지정한 필터 조합)"""
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    mode: CountMode = "exact",
+    table: Optional[Table] = None,
+    cache_key: Optional[Hashable] = None,
+) -> Optional[int]:
+    """
+    목록 쿼리의 전체 건수 계산
+
+    Args:
+        query: 필터만 적용된 목록 쿼리 (정렬/페이징/로딩 옵션 없이)
+        mode: exact | estimate | none
+        table: 필터가 없는 단일 테이블 조회일 때만 전달 (estimate 시 reltuples 사용)
+        cache_key: exact 결과 캐시 키 (None이면 캐시하지 않음)
+
+    Returns:
+        전체 건수 (mode="none"이면 None)
+    """
+    if mode == "none":
+        return None
+
+    if mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+        estimate = await _estimate_rows(db, query, table)
+        if estimate is not None:
+            return estimate
+
+    if cache_key is not None:
+        cached = count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    count_stmt = query.with_only_columns(
+        func.count(), maintain_column_froms=True
+    ).order_by(None)
+    total = (await db.execute(count_stmt)).scalar_one()
+
+    if cache_key is not None:
+        count_cache.set(cache_key, total)
+    return total
+
+
+async def _estimate_rows(
+    db: AsyncSession, query: Select, table: Optional[Table]
+) -> Optional[int]:
+    """플래너 추정 행 수 (실패하거나 통계가 없으면 None → exact로 대체)"""
+    try:
+        if table is not None:
+            reltuples = (await db.execute(
+                text("SELECT reltuples FROM pg_class WHERE oid = CAST(:name AS regclass)"),
+                {"name": table.name},
+            )).scalar_one_or_none()
+            # -1: 아직 VACUUM/ANALYZE 되지 않은 테이블 (PostgreSQL 14+)
+            if reltuples is not None and reltuples >= 0:
+                return int(reltuples)
+
+        probe = query.with_only_columns(
+            literal_column("1"), maintain_column_froms=True
+        ).order_by(None)
+        plan = (await db.execute(ExplainStatement(probe))).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        logger.warning("Row estimate failed, falling back to exact count", error=str(e))
+        return None
@@ -77,3 +77,14 @@ class InsufficientStockException(ApiException):
             error_code="INSUFFICIENT_STOCK",
             message=detail
         )
+
+
+class SyncChunkOutOfOrderException(ApiException):
+    """동기화 세션의 청크 순서 불일치 (다음에 보낼 청크 번호를 details로 알려줌)"""
+    def __init__(self, acked_chunk: int, detail: str = "Unexpected sync chunk"):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="SYNC_CHUNK_OUT_OF_ORDER",
+            message=detail,
+            details={"ackedChunk": acked_chunk, "nextChunk": acked_chunk + 1},
+        )
@@ -0,0 +1,245 @@
+"""
+프로세스 내 메트릭 (In-process Metrics Registry)
+
+파일 역할:
+    요청 지연 시간, 처리 중 요청 수, DB 커넥션 풀, 요청당 DB 쿼리 수/시간 등을 모아
+    GET /metrics 에서 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 외부 의존성은 없습니다.
+
+설계:
+    - 값은 이벤트 루프 스레드에서만 갱신되므로 잠금 없이 dict/list 연산만 합니다
+      (SQLAlchemy 이벤트도 같은 스레드의 greenlet에서 실행됨)
+    - 레이블 조합별 값은 레이블 값 튜플을 키로 하는 dict에 보관합니다
+    - 커넥션 풀/캐시처럼 다른 곳에 이미 있는 값은 수집 시점에 콜백으로 읽습니다 (Gauge callback)
+    - 워커 프로세스마다 별도 값입니다 (프로세스 간 합산은 수집기 쪽에서)
+
+요청당 DB 통계:
+    엔진 이벤트로 집계하는 요청 단위 쿼리 추적(app.core.query_analyzer.RequestQueryStats)을
+    MetricsMiddleware가 요청 종료 시 히스토그램에 기록합니다.
+"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.query_analyzer import query_totals
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 쿼리 수 버킷
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+Callback = Callable[[], Iterable[Tuple[Tuple[str, ...], float]]]
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+    def collect(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 값 (직접 증가시키거나, callback으로 다른 곳의 누적값을 읽음)"""
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), callback: Optional[Callback] = None):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callback = callback
+
+    def inc(self, amount: float = 1.0, labels: Tuple[str, ...] = ()) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        values = dict(self._callback()) if self._callback else self._values
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값 (직접 설정하거나, callback으로 수집 시점에 읽음)"""
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callback] = None,
+    ):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callback = callback
+
+    def inc(self, amount: float = 1.0, labels: Tuple[str, ...] = ()) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, labels: Tuple[str, ...] = ()) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        self._values[labels] = value
+
+    def collect(self) -> List[str]:
+        values = dict(self._callback()) if self._callback else self._values
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values.items()
+        ]
+
+
+class Histogram(_Metric):
+    """버킷별 누적 분포 (+ 합계, 개수)"""
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def collect(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록/텍스트 형식 출력"""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = (), callback=None) -> Counter:
+        return self.register(Counter(name, help, labelnames, callback))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, help, labelnames, callback))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines += metric.header()
+            lines += metric.collect()
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# ========== HTTP ==========
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ("method", "route", "status"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+)
+
+
+# ========== DB 쿼리 ==========
+
+registry.counter("db_queries_total", "DB statements executed", callback=lambda: [((), query_totals.count)])
+registry.counter(
+    "db_query_duration_seconds_total",
+    "Time spent executing DB statements",
+    callback=lambda: [((), query_totals.seconds)],
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request",
+    "DB statements executed per HTTP request",
+    ("route",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+db_query_seconds_per_request = registry.histogram(
+    "db_query_seconds_per_request",
+    "Time spent in DB statements per HTTP request",
+    ("route",),
+)
+
+
+# ========== 수집 시점에 읽는 값 ==========
+
+def _pool_values(attr: str):
+    def collect():
+        from app.db.session import engine  # 순환 import 방지
+
+        pool = engine.sync_engine.pool
+        reader = getattr(pool, attr, None)
+        return [((), reader())] if callable(reader) else []
+    return collect
+
+
+registry.gauge("db_pool_size", "Configured DB connection pool size", callback=_pool_values("size"))
+registry.gauge("db_pool_checked_out", "DB connections currently checked out", callback=_pool_values("checkedout"))
+registry.gauge("db_pool_overflow", "DB connections opened beyond pool_size (negative: unused pool slots)",
+               callback=_pool_values("overflow"))
+
+
+def _cache_values(field: str):
+    def collect():
+        from app.core.counting import count_cache
+        from app.services.product import barcode_cache
+
+        return [(("barcode",), barcode_cache.stats()[field]), (("count",), count_cache.stats()[field])]
+    return collect
+
+
+registry.gauge("cache_entries", "Entries held by in-process caches", ("cache",), callback=_cache_values("size"))
+registry.gauge("cache_hits", "In-process cache hits since start", ("cache",), callback=_cache_values("hits"))
+registry.gauge("cache_misses", "In-process cache misses since start", ("cache",), callback=_cache_values("misses"))
@@ -0,0 +1,45 @@
+"""
+커서 페이지네이션 유틸리티 (Keyset Pagination)
+
+파일 역할:
+    목록 API의 `cursor` 파라미터를 인코딩/디코딩합니다.
+    커서는 마지막으로 받은 행의 정렬 키 값을 담은 불투명(opaque) 문자열입니다.
+
+왜 커서인가?:
+    OFFSET 페이지네이션은 (page-1)*limit 행을 읽고 버리므로 깊은 페이지일수록 느려집니다.
+    커서는 `WHERE (정렬키) < (마지막 값)` 조건으로 인덱스에서 바로 다음 위치를 찾으므로
+    페이지 깊이와 무관하게 일정한 비용이 듭니다.
+
+형식:
+    base64url(JSON 배열) - 예: ["2026-01-01T09:00:00", "3f2a..."]
+    클라이언트는 내용을 해석하지 말고 응답의 nextCursor를 그대로 돌려보내야 합니다.
+"""
+import base64
+import json
+from typing import Any, List
+
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록을 커서 문자열로 인코딩 (값은 JSON 직렬화 가능한 형태여야 함)"""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩
+
+    Raises:
+        BadRequestException: 형식이 잘못되었거나 값 개수가 size와 다른 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise BadRequestException("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise BadRequestException("Invalid cursor")
+    return values
@@ -4,6 +4,8 @@
 파일 역할:
     SQLAlchemy 쿼리 성능 분석을 위한 유틸리티 함수들을 제공합니다.
     EXPLAIN ANALYZE 실행, 쿼리 시간 측정, N+1 문제 감지 등.
+    요청 단위 쿼리 추적(RequestQueryStats)은 엔진 이벤트로 모든 요청에 항상 적용됩니다.
+    느린 쿼리 실행 계획 수집(SlowQuerySampler)은 설정 시에만 동작합니다.
 
 패턴:
     - Decorator 패턴: 쿼리 성능 측정 랩퍼
@@ -12,12 +14,22 @@
 Phase: D-1 (쿼리 분석 환경 구축)
 작성일: 2026-01-31
 """
+import asyncio
+import contextvars
+import hashlib
+import re
 import time
 import functools
-from typing import Any, Callable, TypeVar
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from contextlib import asynccontextmanager
 
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -73,6 +85,33 @@ async def explain_analyze(
         return [dict(row._mapping) for row in rows]
 
 
+class ExplainStatement(Executable, ClauseElement):
+    """
+    SQLAlchemy 문장(Select 등)을 감싸는 EXPLAIN 구문 (PostgreSQL 전용)
+
+    목적:
+        문자열 SQL 대신 ORM/Core 문장을 그대로 EXPLAIN 합니다.
+        바인드 파라미터와 타입 처리(GUID 등)는 원래 문장과 동일하게 적용됩니다.
+
+    사용 예시:
+        >>> stmt = select(Product).where(Product.category_id == category_id)
+        >>> result = await session.execute(ExplainStatement(stmt))
+        >>> plan = result.scalar()[0]["Plan"]
+        >>> plan["Plan Rows"]  # 플래너 예상 행 수
+    """
+    inherit_cache = False
+
+    def __init__(self, statement, analyze: bool = False):
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(ExplainStatement, "postgresql")
+def _compile_explain(element: ExplainStatement, compiler, **kw) -> str:
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
 async def get_query_statistics(
     session: AsyncSession,
     min_duration_ms: float = 100.0,
@@ -221,6 +260,298 @@ class QueryCounter:
         return False
 
 
+# ========== 요청 단위 쿼리 추적 ==========
+
+class RequestQueryStats:
+    """
+    요청 하나에서 실행된 쿼리 수 / DB 시간 / 문장별 실행 횟수
+
+    목적:
+        QueryCounter는 감싼 세션만 세지만, 이 객체는 엔진 이벤트
+        (before/after_cursor_execute)로 요청 중 실행된 모든 문장을 셉니다.
+        요청 미들웨어(QueryBudgetMiddleware, MetricsMiddleware)가 begin_request_queries()로
+        만들어 contextvar에 두며, 같은 문장(SQL 텍스트)이 반복되면 N+1로 의심합니다.
+
+    사용 예시:
+        >>> stats, token = begin_request_queries(request_id)
+        >>> ...  # 요청 처리
+        >>> end_request_queries(token)
+        >>> stats.count, stats.seconds, stats.repeated(5)
+    """
+    __slots__ = ("request_id", "count", "seconds", "statements")
+
+    def __init__(self, request_id: str = ""):
+        self.request_id = request_id
+        self.count = 0
+        self.seconds = 0.0
+        # SQL 텍스트 → 실행 횟수 (컴파일 캐시의 같은 문자열 객체라 해시 비용이 작음)
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold회 이상 실행된 문장 (많은 순)"""
+        if threshold <= 0 or self.count < threshold:
+            return []
+        found = [(sql, n) for sql, n in self.statements.items() if n >= threshold]
+        return sorted(found, key=lambda item: item[1], reverse=True)
+
+
+class QueryTotals:
+    """프로세스 전체 누적 쿼리 수 / DB 시간 (요청 밖 백그라운드 작업 포함)"""
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+query_totals = QueryTotals()
+
+_QUERY_START_KEY = "query_analyzer_start"
+
+
+def begin_request_queries(request_id: str = ""):
+    """
+    현재 요청의 쿼리 추적 시작
+
+    바깥 미들웨어가 이미 시작했다면 그 객체를 그대로 씁니다 (token은 None).
+
+    Returns:
+        (RequestQueryStats, end_request_queries에 넘길 token)
+    """
+    stats = current_query_stats.get()
+    if stats is not None:
+        return stats, None
+    stats = RequestQueryStats(request_id)
+    return stats, current_query_stats.set(stats)
+
+
+def end_request_queries(token) -> None:
+    """begin_request_queries로 시작한 추적 종료"""
+    if token is not None:
+        current_query_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_QUERY_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    query_totals.count += 1
+    query_totals.seconds += elapsed
+    # SQLAlchemy가 greenlet에 호출한 쪽의 컨텍스트를 넘겨주므로 요청의 contextvar가 보임
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if slow_query_sampler.engine is not None and elapsed >= slow_query_sampler.threshold:
+        slow_query_sampler.observe(conn, statement, parameters, elapsed, executemany)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # 실패한 문장의 시작 시각 정리 (after_cursor_execute가 호출되지 않음)
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get(_QUERY_START_KEY)
+        if starts:
+            starts.pop()
+
+
+# ========== 느린 쿼리 실행 계획 수집 ==========
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))*\s*\)")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s")
+_NUMBER = re.compile(r"\b\d+\b")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+# 기록에 남길 SQL 최대 길이
+_SQL_MAX_LENGTH = 4000
+
+
+def _parameter_types(parameters) -> List[str]:
+    """파라미터 값 대신 타입 이름만 (기록/응답에 개인정보·비밀 값이 남지 않도록)"""
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    elif not isinstance(parameters, (list, tuple)):
+        return []
+    return [type(value).__name__ for value in parameters]
+
+
+def _error_summary(error: Exception) -> str:
+    """EXPLAIN 실패 요약 (DB 오류 메시지에는 파라미터 값이 포함될 수 있어 종류/SQLSTATE만 남김)"""
+    sqlstate = getattr(getattr(error, "orig", None), "sqlstate", None)
+    return f"{type(error).__name__} (SQLSTATE {sqlstate})" if sqlstate else type(error).__name__
+
+
+def query_fingerprint(statement: str) -> str:
+    """
+    쿼리 지문 (파라미터 값/개수와 공백을 무시한 SQL 형태의 해시)
+
+    IN 목록의 파라미터 개수가 달라도 같은 지문이 됩니다.
+    """
+    normalized = " ".join(statement.split())
+    normalized = _PLACEHOLDER_LIST.sub("(?)", normalized)
+    normalized = _NUMBER.sub("?", _PLACEHOLDER.sub("?", normalized))
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+class SlowQuerySampler:
+    """
+    느린 쿼리의 실행 계획 자동 수집 (PostgreSQL 전용, 선택 기능)
+
+    목적:
+        앱 엔진에서 threshold 이상 걸린 문장을 잡아, 별도 커넥션에서
+        EXPLAIN (FORMAT JSON)(ANALYZE 없음 → 실제 실행/부작용 없음)으로 실행 계획을 남깁니다.
+        운영 중 느려진 쿼리를 사후에 진단하기 위한 것입니다 (GET /admin/slow-queries).
+
+    동작:
+        - 기록은 쿼리 지문별로 하나이며, 최근에 본 순서로 최대 capacity개 유지 (초과 시 가장 오래된 것 제거)
+        - 같은 지문은 횟수/최대 시간만 갱신하고, 계획은 explain_interval초가 지나야 다시 수집
+        - EXPLAIN은 이벤트 루프 태스크로 실행하며 동시에 최대 max_pending개 (DB 부하 제한)
+        - 값은 이벤트 루프 스레드에서만 갱신되므로 잠금이 없습니다
+        - 파라미터 값은 EXPLAIN에만 쓰고 기록에는 타입 이름만 남깁니다 (진단 API로 값이 노출되지 않도록)
+
+    사용 예시:
+        >>> slow_query_sampler.install(engine)  # main.py lifespan (SLOW_QUERY_EXPLAIN_ENABLED)
+        >>> slow_query_sampler.records()
+    """
+
+    def __init__(self):
+        self.engine = None
+        self.threshold = float("inf")
+        self.capacity = 50
+        self.explain_interval = 300.0
+        self.max_pending = 2
+        self._records: "OrderedDict[str, dict]" = OrderedDict()
+        self._explained_at: Dict[str, float] = {}
+        self._pending: set = set()
+
+    def install(
+        self,
+        engine,
+        threshold_ms: float,
+        capacity: int = 50,
+        explain_interval: float = 300.0,
+        max_pending: int = 2,
+    ) -> None:
+        """앱 AsyncEngine에 연결 (이 엔진에서 실행된 문장만 수집)"""
+        self.engine = engine
+        self.threshold = threshold_ms / 1000
+        self.capacity = capacity
+        self.explain_interval = explain_interval
+        self.max_pending = max_pending
+
+    async def shutdown(self) -> None:
+        """수집 중지 및 진행 중인 EXPLAIN 정리"""
+        self.engine = None
+        self.threshold = float("inf")
+        for task in list(self._pending):
+            task.cancel()
+        await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._explained_at.clear()
+
+    def records(self) -> list[dict]:
+        """수집된 기록 (최근에 관측된 순)"""
+        return [dict(record) for record in reversed(self._records.values())]
+
+    def observe(self, conn, statement: str, parameters, elapsed: float, executemany: bool) -> None:
+        """after_cursor_execute에서 threshold 이상일 때 호출"""
+        if (
+            conn.engine is not self.engine.sync_engine
+            or conn.dialect.name != "postgresql"
+            or executemany
+            or not statement.lstrip()[:6].upper().startswith(_EXPLAINABLE)
+        ):
+            return
+
+        fingerprint = query_fingerprint(statement)
+        now = datetime.utcnow()
+        record = self._records.get(fingerprint)
+        if record is None:
+            record = self._records[fingerprint] = {
+                "fingerprint": fingerprint,
+                "statement": statement[:_SQL_MAX_LENGTH],
+                "count": 0,
+                "max_duration_ms": 0.0,
+                "first_seen_at": now,
+                "plan": None,
+                "explained_at": None,
+                "error": None,
+            }
+            if len(self._records) > self.capacity:
+                evicted, _ = self._records.popitem(last=False)
+                self._explained_at.pop(evicted, None)
+        else:
+            self._records.move_to_end(fingerprint)
+
+        duration_ms = round(elapsed * 1000, 2)
+        record["count"] += 1
+        record["last_duration_ms"] = duration_ms
+        record["max_duration_ms"] = max(record["max_duration_ms"], duration_ms)
+        record["last_seen_at"] = now
+        record["parameter_types"] = _parameter_types(parameters)
+
+        last = self._explained_at.get(fingerprint)
+        monotonic = time.monotonic()
+        if (last is not None and monotonic - last < self.explain_interval) or len(self._pending) >= self.max_pending:
+            return
+        self._explained_at[fingerprint] = monotonic
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # 요청의 쿼리 통계에 EXPLAIN이 섞이지 않도록 빈 컨텍스트에서 실행
+        task = loop.create_task(self._explain(fingerprint, statement, parameters), context=contextvars.Context())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _explain(self, fingerprint: str, statement: str, parameters) -> None:
+        engine = self.engine
+        if engine is None:
+            return
+        plan, error = None, None
+        try:
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql("SET LOCAL statement_timeout = 5000")
+                result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = result.scalar()
+                await conn.rollback()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = _error_summary(e)
+            logger.warning("Slow query EXPLAIN failed", fingerprint=fingerprint, error=str(e)[:500])
+
+        record = self._records.get(fingerprint)
+        if record is not None:
+            record["plan"] = plan[0] if isinstance(plan, list) and plan else plan
+            record["explained_at"] = datetime.utcnow()
+            record["error"] = error
+        if plan is not None:
+            logger.warning(
+                "Slow query plan captured",
+                fingerprint=fingerprint,
+                duration_ms=record["last_duration_ms"] if record else None,
+            )
+
+
+slow_query_sampler = SlowQuerySampler()
+
+
 # ========== 인덱스 사용 현황 조회 ==========
 
 async def get_index_usage(
@@ -244,8 +575,8 @@ async def get_index_usage(
     query = """
     SELECT
         schemaname,
-        tablename,
-        indexname,
+        relname as tablename,
+        indexrelname as indexname,
         idx_scan as scans,
         idx_tup_read as tuples_read,
         idx_tup_fetch as tuples_fetched,
@@ -255,7 +586,7 @@ async def get_index_usage(
     """
     
     if table_name:
-        query += " AND tablename = :table_name"
+        query += " AND relname = :table_name"
     
     query += " ORDER BY idx_scan DESC"
     
@@ -0,0 +1,166 @@
+"""
+트랜잭션 원장 월별 파티션 관리 (Monthly Range Partitions)
+
+파일 역할:
+    PostgreSQL에서 inventory_transactions는 created_at 기준 월별 RANGE 파티션 테이블입니다
+    (마이그레이션 c5d2e7f9a41b). 이 모듈은 파티션 생성/조회/분리를 담당합니다.
+
+    - 파티션 이름: inventory_transactions_pYYYYMM (해당 월 1일 00:00 ~ 다음 달 1일 00:00)
+    - 기본 파티션: inventory_transactions_default (범위 밖의 행, 예: 시계가 틀린 오프라인 기기)
+    - 앞으로 TRANSACTION_PARTITION_MONTHS_AHEAD개월 파티션은 미리 만들어 둠
+      (앱 시작 시 + scripts/archive_transactions.py 실행 시)
+
+왜 파티션인가?:
+    원장은 계속 늘어나기만 하므로 오래될수록 인덱스/카운트/목록 조회가 느려집니다.
+    created_at 조건이 있는 조회는 해당 월 파티션만 읽고(partition pruning),
+    오래된 월은 통째로 분리(DETACH)해 보관할 수 있습니다.
+
+주의:
+    - PostgreSQL 전용입니다. 다른 DB(SQLite 테스트 등)에서는 아무것도 하지 않습니다.
+    - 기본 파티션에 새 파티션 범위의 행이 이미 있으면 그 파티션을 만들 수 없으므로
+      미래 파티션은 해당 월이 오기 전에 만들어야 합니다.
+    - 분리한 파티션은 archived_partitions에 기록합니다. 기록이 있으면 원장은 전체 이력이
+      아니므로, 전체 원장 합산에 의존하는 작업(재고 대사 full 모드 등)은 archived_until로 확인합니다.
+"""
+import asyncio
+import re
+from datetime import date, datetime
+from typing import Callable, List, NamedTuple, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.archived_partition import ArchivedPartition
+
+logger = get_logger(__name__)
+
+PARENT_TABLE = "inventory_transactions"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p\d{{6}}$")
+
+# 여러 워커가 동시에 시작해도 파티션 생성이 겹치지 않도록 잡는 advisory lock 키
+_PARTITION_LOCK_KEY = 7_240_114
+
+
+class Partition(NamedTuple):
+    name: str
+    start: date
+    end: date
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """value가 속한 달의 1일에서 months개월 이동한 날짜"""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}{month.month:02d}"
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def ensure_transaction_partitions(
+    db: AsyncSession,
+    months_ahead: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    이번 달부터 months_ahead개월 뒤까지의 파티션이 없으면 생성
+
+    Returns:
+        새로 만든 파티션 이름 목록 (PostgreSQL이 아니면 빈 목록)
+    """
+    if not _is_postgres(db):
+        return []
+    months_ahead = settings.TRANSACTION_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    first = month_start(today or datetime.utcnow().date())
+
+    await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITION_LOCK_KEY})
+    existing = {p.name for p in await list_transaction_partitions(db)}
+
+    created = []
+    for offset in range(months_ahead + 1):
+        start = add_months(first, offset)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        await db.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{add_months(start, 1).isoformat()}')"
+        ))
+        created.append(name)
+    await db.commit()
+
+    if created:
+        logger.info("Transaction partitions created", partitions=created)
+    return created
+
+
+async def list_transaction_partitions(db: AsyncSession) -> List[Partition]:
+    """월별 파티션 목록 (기본 파티션 제외, 시작일 순)"""
+    if not _is_postgres(db):
+        return []
+    rows = await db.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :parent
+    """), {"parent": PARENT_TABLE})
+
+    partitions = []
+    prefix = f"{PARENT_TABLE}_p"
+    for (name,) in rows:
+        if not name.startswith(prefix):
+            continue
+        start = date(int(name[len(prefix):len(prefix) + 4]), int(name[len(prefix) + 4:]), 1)
+        partitions.append(Partition(name, start, add_months(start, 1)))
+    return sorted(partitions, key=lambda p: p.start)
+
+
+async def detach_partition(db: AsyncSession, name: str) -> None:
+    """파티션을 원장에서 분리 (테이블은 독립 테이블로 남음, 커밋은 호출자가 수행)"""
+    if not _PARTITION_NAME.match(name):
+        raise ValueError(f"Not a monthly transaction partition: {name}")
+    await db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+
+
+async def record_archived_partition(db: AsyncSession, partition: Partition, path: str, dropped: bool) -> None:
+    """분리한 파티션 기록 (분리와 같은 트랜잭션에서 호출, 커밋은 호출자가 수행)"""
+    db.add(ArchivedPartition(
+        name=partition.name,
+        range_start=partition.start,
+        range_end=partition.end,
+        path=path,
+        dropped=dropped,
+    ))
+
+
+async def archived_until(db: AsyncSession) -> Optional[date]:
+    """원장에서 분리된 구간의 끝 (이 날짜 이전 원장은 불완전할 수 있음, 보관 기록이 없으면 None)"""
+    return await db.scalar(select(func.max(ArchivedPartition.range_end)))
+
+
+async def run_partition_maintenance(
+    session_factory: Callable[[], AsyncSession],
+    interval_hours: float = 24,
+) -> None:
+    """미래 파티션 생성을 주기적으로 실행 (앱 수명주기 동안 백그라운드 태스크로 실행)"""
+    while True:
+        try:
+            async with session_factory() as db:
+                await ensure_transaction_partitions(db)
+        except Exception as e:
+            # 마이그레이션 전(파티션 테이블 아님) 등 - 앱 동작에는 영향 없음
+            logger.warning("Transaction partition maintenance failed", error=str(e))
+        await asyncio.sleep(interval_hours * 3600)
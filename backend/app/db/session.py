@@ -54,6 +54,9 @@ from app.core.config import settings
 #     - pool_size 초과 시 최대 20개 임시 연결 생성 가능
 #     - 총 최대 연결 수 = pool_size + max_overflow = 30개
 #
+#   - connect_args: PostgreSQL(asyncpg) 연결에 application_name 지정
+#     - pg_stat_activity에서 이 앱의 세션을 구분 (변경분 조회 상한 계산, 운영 모니터링)
+#
 # 왜 커넥션 풀이 필요한가?:
 #   - 성능: DB 연결 생성 비용이 높음 (수백ms) → 재사용으로 절약
 #   - 효율성: 동시 요청이 많아도 연결 수 제한 (DB 부하 방지)
@@ -68,6 +71,11 @@ engine = create_async_engine(
     max_overflow=settings.DB_MAX_OVERFLOW,  # 추가 커넥션 허용 개수 (peak 시 임시 생성, D-4)
     pool_recycle=1800,  # 30분마다 연결 재생성 (D-4: Connection Pool 튜닝)
     pool_timeout=30,  # 연결 대기 타임아웃 30초 (D-4)
+    connect_args=(
+        {"server_settings": {"application_name": settings.DB_APPLICATION_NAME}}
+        if settings.DATABASE_URL.startswith("postgresql+asyncpg")
+        else {}
+    ),
 )
 
 
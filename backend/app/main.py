@@ -12,11 +12,15 @@ FastAPI 애플리케이션 엔트리포인트 (Application Entry Point)
 
 작성일: 2025-12-31
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from app.core import metrics
 from app.core.config import settings
 from app.core.exceptions import ApiException
 from app.core.logging import setup_logging, get_logger
@@ -73,9 +77,63 @@ tags_metadata = [
     {"name": "Health", "description": "서버 상태 확인"},
 ]
 
+# ========== 앱 수명주기 ==========
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 트랜잭션 원장의 미래 월 파티션을 주기적으로 생성 (PostgreSQL 전용)
+    from app.db.partitions import run_partition_maintenance
+    from app.db.session import async_session
+    # 과거 시점 재고 조회용 재고 스냅샷을 주기적으로 생성
+    from app.services.snapshot import run_stock_snapshots
+    background_tasks = [
+        asyncio.create_task(run_partition_maintenance(async_session)),
+        asyncio.create_task(run_stock_snapshots(async_session)),
+    ]
+    # 재고 캐시 ↔ 원장 대사 (설정 시에만)
+    if settings.STOCK_RECONCILE_INTERVAL_HOURS > 0:
+        from app.services.reconciliation import run_reconciliation
+        background_tasks.append(asyncio.create_task(run_reconciliation(
+            async_session, settings.STOCK_RECONCILE_INTERVAL_HOURS, repair=settings.STOCK_RECONCILE_REPAIR
+        )))
+
+    # 재시작 등으로 남은 비동기 동기화 작업 다시 처리
+    from app.services.sync_jobs import recover_sync_jobs, shutdown_sync_jobs
+    try:
+        await recover_sync_jobs(async_session)
+    except Exception as e:
+        logger.warning("Sync job recovery failed", error=str(e))
+
+    # 느린 쿼리 실행 계획 자동 수집 (설정 시에만)
+    from app.core.query_analyzer import slow_query_sampler
+    if settings.SLOW_QUERY_EXPLAIN_ENABLED:
+        from app.db.session import engine
+        slow_query_sampler.install(
+            engine,
+            threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+            capacity=settings.SLOW_QUERY_BUFFER_SIZE,
+            explain_interval=settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+        )
+
+    yield
+
+    # 버퍼에 모인 재고 변경(이미 요청을 받은 것)을 다른 정리보다 먼저 반영
+    from app.services.coalescer import shutdown_coalescer
+    await shutdown_coalescer()
+    await slow_query_sampler.shutdown()
+    await shutdown_sync_jobs()
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # 종료 시 대기 중인 안전재고 알림을 전달하고 워커 정리
+    from app.services.alerts import shutdown_dispatcher
+    await shutdown_dispatcher()
+
+
 # ========== FastAPI 앱 인스턴스 생성 ==========
 
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description=description,
@@ -111,11 +169,25 @@ app.add_middleware(
 
 # ========== 커스텀 미들웨어 설정 (Phase C) ==========
 
-from app.middleware import RequestIdMiddleware, LoggingMiddleware
+from app.middleware import (
+    RequestIdMiddleware,
+    LoggingMiddleware,
+    CompressionMiddleware,
+    MetricsMiddleware,
+    QueryBudgetMiddleware,
+)
 
 # 미들웨어는 역순으로 실행됨 (마지막 등록이 먼저 실행)
-# 1. LoggingMiddleware (요청/응답 로깅)
-# 2. RequestIdMiddleware (요청 ID 생성 및 컨텍스트 바인딩)
+# 1. MetricsMiddleware (요청 지연 시간 / DB 쿼리 메트릭, 라우트 템플릿을 읽도록 라우터에 가장 가까이)
+# 2. QueryBudgetMiddleware (요청당 쿼리 예산 / N+1 감지 / Server-Timing)
+# 3. CompressionMiddleware (요청 본문 해제 / 응답 압축)
+# 4. LoggingMiddleware (요청/응답 로깅)
+# 5. RequestIdMiddleware (요청 ID 생성 및 컨텍스트 바인딩)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryBudgetMiddleware)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(RequestIdMiddleware)
 
@@ -201,6 +273,14 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+async def metrics_endpoint():
+    """프로세스 메트릭 (Prometheus 텍스트 형식)"""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """API 루트 엔드포인트 (Welcome)"""
@@ -6,12 +6,21 @@
 미들웨어 목록:
     - RequestIdMiddleware: 요청 ID 추적 (C-3)
     - LoggingMiddleware: 요청/응답 로깅 (C-4)
+    - CompressionMiddleware: 요청 본문 해제 / 응답 압축 (gzip, zstd)
+    - MetricsMiddleware: 요청 지연 시간 / DB 쿼리 메트릭 (GET /metrics)
+    - QueryBudgetMiddleware: 요청당 쿼리 예산 / N+1 감지 / Server-Timing 헤더
 """
 from app.middleware.request_id import RequestIdMiddleware, get_request_id
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_budget import QueryBudgetMiddleware
 
 __all__ = [
     "RequestIdMiddleware",
     "LoggingMiddleware",
+    "CompressionMiddleware",
+    "MetricsMiddleware",
+    "QueryBudgetMiddleware",
     "get_request_id",
 ]
@@ -0,0 +1,277 @@
+"""
+압축 미들웨어 (Compression Middleware)
+
+파일 역할:
+    요청 본문의 Content-Encoding(gzip, zstd)을 풀고, 응답 본문은 클라이언트의
+    Accept-Encoding에 맞춰 압축합니다. 매장 기기가 느린 모바일 망에서 동기화 배치를
+    올리고 큰 목록/내보내기 응답을 받는 시간을 줄이기 위한 것입니다.
+
+동작:
+    - 순수 ASGI 미들웨어로, 본문 전체를 모으지 않고 청크 단위로 풀고/압축합니다
+      (스트리밍 내보내기도 청크마다 flush하여 그대로 흘려보냄)
+    - 요청: 푼 크기가 COMPRESSION_MAX_DECODED_BYTES를 넘으면 413, 손상된 본문은 400,
+      지원하지 않는 인코딩은 415
+    - 응답: 텍스트/JSON 계열만, 한 번에 끝나는 응답은 COMPRESSION_MINIMUM_SIZE 이상일 때만 압축
+    - zstd는 zstandard 패키지로 처리 (requirements에 포함, 설치되지 않은 환경에서는 gzip만)
+
+작성일: 2026-10-17
+"""
+import zlib
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:  # 선택 의존성
+    import zstandard
+except ImportError:  # pragma: no cover - 설치 여부에 따라 다름
+    zstandard = None
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# zstd 해제에는 출력 크기 제한(max_length)이 없어 입력을 이 크기로 나눠 넣고 매번 크기를 확인
+# (블록은 최소 4바이트로 최대 128KB까지 풀리므로 조각당 출력은 약 2MB 이내)
+ZSTD_INPUT_SLICE = 64
+
+# 압축 효과가 있는 응답 형식 (엑셀/이미지 등은 이미 압축되어 있음)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/problem+json")
+
+
+def supported_encodings() -> List[str]:
+    """서버가 지원하는 인코딩 (선호 순)"""
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (q=0은 거부, 같은 q면 서버 선호 순)"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Decoder:
+    """요청 본문 스트리밍 해제 (gzip / zstd)"""
+    def __init__(self, encoding: str, limit: int):
+        self.limit = limit
+        self.total = 0
+        if encoding == "gzip":
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._zstd = None
+        else:
+            self._zlib = None
+            self._zstd = zstandard.ZstdDecompressor().decompressobj()
+
+    def decode(self, data: bytes, final: bool) -> bytes:
+        try:
+            if self._zlib is not None:
+                # max_length로 한 번에 풀리는 양을 제한 (압축 폭탄 방지)
+                out = self._zlib.decompress(data, self.limit - self.total + 1)
+                if self._zlib.unconsumed_tail:
+                    self._too_large()
+                if final:
+                    out += self._zlib.flush()
+                    if not self._zlib.eof:
+                        raise zlib.error("truncated gzip body")
+            else:
+                out = self._decode_zstd(data)
+                if final and not self._zstd.eof:
+                    raise zstandard.ZstdError("truncated zstd body")
+        except (zlib.error, getattr(zstandard, "ZstdError", zlib.error)):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid compressed request body")
+
+        self.total += len(out)
+        if self.total > self.limit:
+            self._too_large()
+        return out
+
+    def _decode_zstd(self, data: bytes) -> bytes:
+        """입력을 조각내어 풀며 조각마다 누적 크기 확인 (압축 폭탄 방지, 프레임 뒤 데이터는 거부)"""
+        chunks = []
+        decoded = 0
+        for start in range(0, len(data), ZSTD_INPUT_SLICE):
+            piece = self._zstd.decompress(data[start:start + ZSTD_INPUT_SLICE])
+            decoded += len(piece)
+            if self.total + decoded > self.limit:
+                self._too_large()
+            chunks.append(piece)
+        if self._zstd.eof and self._zstd.unused_data:
+            raise zstandard.ZstdError("trailing data after zstd frame")
+        return b"".join(chunks)
+
+    def _too_large(self):
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Decoded request body exceeds {self.limit} bytes",
+        )
+
+
+class _Encoder:
+    """응답 본문 스트리밍 압축 (청크마다 flush)"""
+    def __init__(self, encoding: str):
+        if encoding == "gzip":
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._zstd = None
+        else:
+            self._zlib = None
+            self._zstd = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def encode(self, data: bytes, final: bool) -> bytes:
+        if self._zlib is not None:
+            return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        out = self._zstd.compress(data)
+        return out + self._zstd.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+def _without(headers: List[Tuple[bytes, bytes]], *names: bytes) -> List[Tuple[bytes, bytes]]:
+    return [(k, v) for k, v in headers if k.lower() not in names]
+
+
+class CompressionMiddleware:
+    """
+    요청 본문 해제 + 응답 협상 압축 (gzip, zstd)
+
+    사용 예시:
+        # main.py
+        from app.middleware import CompressionMiddleware
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        max_decoded_bytes: Optional[int] = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.max_decoded_bytes = (
+            settings.COMPRESSION_MAX_DECODED_BYTES if max_decoded_bytes is None else max_decoded_bytes
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        content_encoding = headers.get("content-encoding", "").strip().lower()
+        if content_encoding and content_encoding != "identity":
+            scope, receive = self._decode_request(scope, receive, content_encoding)
+
+        encoding = negotiate_encoding(headers.get("accept-encoding", ""))
+        if encoding is None or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size))
+
+    def _decode_request(self, scope: Scope, receive: Receive, encoding: str):
+        # 본문 길이/인코딩이 바뀌므로 앱에는 해당 헤더 없이 전달
+        scope = dict(scope)
+        scope["headers"] = _without(scope["headers"], b"content-encoding", b"content-length")
+
+        if encoding not in supported_encodings():
+            async def reject() -> Message:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail=f"Unsupported Content-Encoding: {encoding}",
+                )
+            return scope, reject
+
+        decoder = _Decoder(encoding, self.max_decoded_bytes)
+
+        async def decoding_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                more_body = message.get("more_body", False)
+                message = {
+                    "type": "http.request",
+                    "body": decoder.decode(message.get("body", b""), final=not more_body),
+                    "more_body": more_body,
+                }
+            return message
+
+        return scope, decoding_receive
+
+
+class _CompressingSend:
+    """응답 시작 메시지를 첫 본문까지 미뤄 두고, 압축 여부를 정한 뒤 전달"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            content_type = headers.get("content-type", "")
+            if (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                self.passthrough = True
+                await self.send(message)
+            else:
+                self.start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            start, self.start = self.start, None
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.encoder = _Encoder(self.encoding)
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            data = self.encoder.encode(body, final=not more_body)
+            if not more_body:
+                headers["Content-Length"] = str(len(data))
+            await self.send({**start, "headers": headers.raw})
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        data = self.encoder.encode(body, final=not more_body)
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -13,17 +13,17 @@ Phase: C-4 (Request/Response 로깅)
 작성일: 2026-01-30
 """
 import time
-from typing import Callable, Set
+from typing import Set
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Request/Response 로깅 미들웨어
     
@@ -40,6 +40,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         - 요청: method, path, client_ip, user_agent
         - 응답: status_code, duration_ms
     
+    구현:
+        순수 ASGI 미들웨어입니다. 상태 코드는 http.response.start 메시지에서 읽고,
+        완료 로그는 응답 본문 전송이 끝난 시점에 남깁니다
+        (스트리밍 내보내기는 전체 전송 시간이 기록됨).
+    
     사용 예시:
         # main.py
         from app.middleware.logging_middleware import LoggingMiddleware
@@ -60,19 +65,22 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     # 느린 응답 임계값 (ms)
     SLOW_RESPONSE_THRESHOLD_MS: float = 1000.0
     
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # 제외 경로는 로깅 스킵
-        if request.url.path in self.EXCLUDE_PATHS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in self.EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
         
         # 시작 시간 기록
         start_time = time.perf_counter()
         
         # 클라이언트 정보
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("User-Agent", "Unknown")
+        headers = Headers(scope=scope)
+        client_ip = self._get_client_ip(scope, headers)
+        user_agent = headers.get("User-Agent", "Unknown")
         
         # 요청 시작 로깅
         logger.info(
@@ -81,16 +89,34 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             user_agent=user_agent[:100] if user_agent else None,  # 너무 긴 UA 자르기
         )
         
-        # 요청 처리
-        response = await call_next(request)
+        status_code = 500  # 응답 없이 예외가 나면 500으로 기록
+        completed = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, completed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                completed = True
+                self._log_completed(status_code, start_time)
         
+        # 요청 처리
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if not completed:
+                self._log_completed(500, start_time)
+            raise
+    
+    def _log_completed(self, status_code: int, start_time: float) -> None:
         # 응답 시간 계산
         duration_ms = (time.perf_counter() - start_time) * 1000
         
         # 로그 레벨 결정
-        if response.status_code >= 500:
+        if status_code >= 500:
             log_method = logger.error
-        elif response.status_code >= 400:
+        elif status_code >= 400:
             log_method = logger.warning
         elif duration_ms > self.SLOW_RESPONSE_THRESHOLD_MS:
             log_method = logger.warning
@@ -100,14 +126,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # 응답 완료 로깅
         log_method(
             "Request completed",
-            status_code=response.status_code,
+            status_code=status_code,
             duration_ms=round(duration_ms, 2),
             slow=duration_ms > self.SLOW_RESPONSE_THRESHOLD_MS,
         )
-        
-        return response
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """
         클라이언트 IP 추출
         
@@ -117,20 +141,21 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         우선순위:
             1. X-Forwarded-For 헤더 (프록시 환경)
             2. X-Real-IP 헤더 (Nginx 프록시)
-            3. request.client.host (직접 연결)
+            3. scope["client"] (직접 연결)
         """
         # X-Forwarded-For (첫 번째가 실제 클라이언트)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("X-Forwarded-For")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
         
         # X-Real-IP
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("X-Real-IP")
         if real_ip:
             return real_ip
         
         # 직접 연결
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
         
         return "Unknown"
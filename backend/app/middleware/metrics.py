@@ -0,0 +1,63 @@
+"""
+메트릭 미들웨어 (Metrics Middleware)
+
+파일 역할:
+    요청마다 처리 시간, 처리 중 요청 수, 요청당 DB 쿼리 수/시간을 app.core.metrics에 기록합니다.
+    GET /metrics 가 이 값을 Prometheus 텍스트 형식으로 내보냅니다.
+
+레이블:
+    - route: 매칭된 라우트 템플릿 (예: /api/v1/products/barcode/{barcode})
+      경로 값 그대로 쓰면 시계열이 무한히 늘어나므로 템플릿을 쓰고, 매칭 실패는 "unmatched"
+    - 라우터가 scope에 기록한 route를 읽으므로 라우터에 가장 가까이 등록합니다
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+from app.core.query_analyzer import begin_request_queries, end_request_queries
+
+EXCLUDE_PATHS = {"/metrics"}
+
+
+class MetricsMiddleware:
+    """
+    요청 지연 시간 / 처리 중 요청 수 / 요청당 DB 쿼리 기록
+
+    사용 예시:
+        # main.py (다른 미들웨어보다 먼저 등록 = 라우터에 가장 가까이)
+        from app.middleware import MetricsMiddleware
+        app.add_middleware(MetricsMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats, token = begin_request_queries()
+        metrics.http_requests_in_flight.inc()
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            metrics.http_requests_in_flight.dec()
+            end_request_queries(token)
+
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            metrics.http_request_duration.observe(duration, (scope["method"], template, str(status_code)))
+            metrics.db_queries_per_request.observe(stats.count, (template,))
+            metrics.db_query_seconds_per_request.observe(stats.seconds, (template,))
@@ -0,0 +1,101 @@
+"""
+쿼리 예산 미들웨어 (Query Budget Middleware)
+
+파일 역할:
+    요청마다 실행된 DB 쿼리 수/시간을 집계하여(app.core.query_analyzer.RequestQueryStats)
+    Server-Timing 응답 헤더로 알려 주고, 라우트가 쿼리 예산을 넘거나 같은 문장을
+    반복 실행하면(N+1 의심) 경고 로그를 남깁니다.
+
+동작:
+    - Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms> (응답 시작 시점 기준)
+      스트리밍 응답에서 헤더 전송 뒤 실행된 쿼리는 헤더에 포함되지 않음 (경고 판단에는 포함)
+    - QUERY_BUDGET_PER_REQUEST 초과 시 "Query budget exceeded" 경고
+    - 같은 SQL이 QUERY_REPEAT_THRESHOLD회 이상이면 "Repeated query detected (possible N+1)" 경고
+    - 로그에는 RequestIdMiddleware가 바인딩한 request_id가 함께 기록됨
+"""
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.query_analyzer import begin_request_queries, end_request_queries
+from app.middleware.request_id import get_request_id
+
+logger = get_logger(__name__)
+
+# 경고 로그에 남길 SQL 최대 길이
+STATEMENT_LOG_LENGTH = 300
+
+
+class QueryBudgetMiddleware:
+    """
+    요청 단위 쿼리 예산 / N+1 감지 / Server-Timing 헤더
+
+    사용 예시:
+        # main.py (MetricsMiddleware 바깥, RequestIdMiddleware 안쪽)
+        from app.middleware import QueryBudgetMiddleware
+        app.add_middleware(QueryBudgetMiddleware)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budget: int = None,
+        repeat_threshold: int = None,
+        server_timing: bool = None,
+    ) -> None:
+        self.app = app
+        self.budget = settings.QUERY_BUDGET_PER_REQUEST if budget is None else budget
+        self.repeat_threshold = (
+            settings.QUERY_REPEAT_THRESHOLD if repeat_threshold is None else repeat_threshold
+        )
+        self.server_timing = settings.SERVER_TIMING_ENABLED if server_timing is None else server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = begin_request_queries(get_request_id())
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                app_ms = (time.perf_counter() - start) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries", app;dur={app_ms:.2f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request_queries(token)
+            self._check(scope, stats)
+
+    def _check(self, scope: Scope, stats) -> None:
+        if stats.count == 0:
+            return
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+
+        if 0 < self.budget < stats.count:
+            logger.warning(
+                "Query budget exceeded",
+                route=route,
+                query_count=stats.count,
+                budget=self.budget,
+                db_ms=round(stats.seconds * 1000, 2),
+            )
+
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning(
+                "Repeated query detected (possible N+1)",
+                route=route,
+                repeat_count=count,
+                query_count=stats.count,
+                statement=" ".join(statement.split())[:STATEMENT_LOG_LENGTH],
+            )
@@ -14,10 +14,9 @@ Phase: C-3 (Request ID 추적)
 """
 import uuid
 from contextvars import ContextVar
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import bind_contextvars, clear_contextvars, get_logger
 
@@ -27,7 +26,7 @@ request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
 logger = get_logger(__name__)
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+class RequestIdMiddleware:
     """
     Request ID 미들웨어
     
@@ -41,17 +40,30 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
         3. 컨텍스트 변수에 저장 (로깅에서 사용)
         4. 응답 헤더에 X-Request-ID 추가
     
+    구현:
+        순수 ASGI 미들웨어입니다. BaseHTTPMiddleware와 달리 요청을 별도 태스크로
+        넘기거나 응답 본문을 중계하지 않으므로 요청당 오버헤드가 작고,
+        StreamingResponse도 그대로 흘려보냅니다. 같은 태스크에서 실행되므로
+        여기서 바인딩한 컨텍스트가 앱 코드의 로그에도 그대로 보입니다.
+    
     사용 예시:
         # main.py
         from app.middleware.request_id import RequestIdMiddleware
         app.add_middleware(RequestIdMiddleware)
     """
     
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # 클라이언트가 제공한 Request ID 또는 새로 생성
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request_id = Headers(scope=scope).get("X-Request-ID")
+        if request_id is None:
+            request_id = str(uuid.uuid4())
         
         # Context Variable에 저장
         request_id_ctx.set(request_id)
@@ -60,17 +72,18 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
         clear_contextvars()
         bind_contextvars(
             request_id=request_id,
-            path=request.url.path,
-            method=request.method,
+            path=scope["path"],
+            method=scope["method"],
         )
         
-        # 요청 처리
-        response = await call_next(request)
-        
-        # 응답 헤더에 Request ID 추가
-        response.headers["X-Request-ID"] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            # 응답 헤더에 Request ID 추가
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
         
-        return response
+        # 요청 처리
+        await self.app(scope, receive, send_with_request_id)
 
 
 def get_request_id() -> str:
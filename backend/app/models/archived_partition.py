@@ -0,0 +1,44 @@
+"""
+보관된 원장 파티션 모델 (ArchivedPartition Model)
+
+파일 역할:
+    scripts/archive_transactions.py가 원장에서 분리(DETACH)한 월별 파티션의 기록입니다.
+    분리된 파티션(또는 --drop으로 삭제된 테이블)은 pg_inherits에 남지 않으므로,
+    원장이 더 이상 전체 이력을 담고 있지 않다는 사실을 이 테이블로 판단합니다.
+
+사용처:
+    - 재고 대사(app.services.reconciliation): 보관된 달이 있으면 전체 원장 합산(full 모드)을
+      거부하고, 스냅샷 기준 대사도 보관 구간 이후의 스냅샷을 요구합니다
+
+작성일: 2026-10-17
+"""
+from sqlalchemy import Boolean, Column, Date, DateTime, String, Text
+from datetime import datetime
+
+from app.db.base import Base
+
+
+class ArchivedPartition(Base):
+    """
+    보관된 원장 파티션 (Archived Partitions 테이블)
+
+    Attributes:
+        name (str): 파티션 테이블 이름 (inventory_transactions_pYYYYMM)
+        range_start (date): 파티션 범위 시작 (포함)
+        range_end (date): 파티션 범위 끝 (미포함)
+        path (str): 내보낸 gzip CSV 경로
+        dropped (bool): 분리 후 테이블까지 삭제했는지 여부
+        archived_at (datetime): 보관 시각
+    """
+
+    __tablename__ = "archived_partitions"
+
+    name = Column(String(63), primary_key=True, comment="파티션 테이블 이름")
+    range_start = Column(Date, nullable=False, comment="파티션 범위 시작 (포함)")
+    range_end = Column(Date, nullable=False, comment="파티션 범위 끝 (미포함)")
+    path = Column(Text, nullable=False, comment="내보낸 gzip CSV 경로")
+    dropped = Column(Boolean, nullable=False, default=False, comment="분리 후 테이블 삭제 여부")
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="보관 시각")
+
+    def __repr__(self):
+        return f"<ArchivedPartition {self.name} {self.range_start}~{self.range_end}>"
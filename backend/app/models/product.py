@@ -22,7 +22,7 @@
 작성일: 2026-01-01
 TDD: Phase 1.1 - GREEN 단계에서 구현
 """
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, ForeignKey, Index, column, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -101,6 +101,32 @@ class Product(Base):
     # 테이블 이름
     __tablename__ = "products"
 
+    # 검색용 인덱스 (PostgreSQL 전용 옵션, SQLite에서는 일반 인덱스로 생성됨)
+    #   - 이름 부분 일치/유사도 검색: pg_trgm GIN 인덱스 (pg_trgm 확장 필요)
+    #   - 바코드 부분 일치 검색: ILIKE '%q%'용 pg_trgm GIN 인덱스
+    #   - 바코드 접두어 검색: LIKE 'q%'용 varchar_pattern_ops B-tree
+    #     (기본 B-tree는 C 이외의 collation에서 LIKE 접두어 검색에 사용되지 않음)
+    #   - 변경분 조회(GET /sync/changes): 변경 시각 = COALESCE(updated_at, created_at) 표현식 인덱스
+    #   - 카테고리 필터(GET /products?category_id=)
+    __table_args__ = (
+        Index('idx_products_category_id', 'category_id'),
+        Index(
+            'idx_products_name_trgm', 'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_products_barcode_trgm', 'barcode',
+            postgresql_using='gin',
+            postgresql_ops={'barcode': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_products_barcode_prefix', 'barcode',
+            postgresql_ops={'barcode': 'varchar_pattern_ops'},
+        ),
+        Index('idx_products_changed', func.coalesce(column('updated_at'), column('created_at')), 'id'),
+    )
+
     # Primary Key
     id = Column(
         GUID,
@@ -0,0 +1,55 @@
+"""
+재고 대사 실행 기록 모델 (ReconciliationRun Model)
+
+파일 역할:
+    current_stocks(캐시)와 원장(InventoryTransaction) 합계를 비교하는 대사(reconciliation)
+    작업의 실행 기록이자 체크포인트입니다.
+
+체크포인트:
+    - basis_at: 기준 재고 스냅샷 시각. 이 시각 이후 원장만 읽어 스냅샷에 더합니다
+      (NULL이면 전체 원장 합산 = full 모드)
+    - last_product_id/last_store_id: 마지막으로 확인한 재고 키. 청크마다 커밋되므로
+      중단된 실행은 다음 실행이 이어서 처리합니다 (finished_at이 NULL인 실행)
+
+작성일: 2026-10-17
+"""
+from sqlalchemy import Boolean, Column, DateTime, Integer
+from datetime import datetime
+import uuid
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class ReconciliationRun(Base):
+    """
+    재고 대사 실행 기록 (Reconciliation Runs 테이블)
+
+    Attributes:
+        id (GUID): 실행 ID
+        basis_at (datetime): 기준 스냅샷 시각 (NULL=전체 원장)
+        repair (bool): 불일치 자동 보정 여부
+        last_product_id (GUID): 마지막으로 확인한 재고 키 (제품)
+        last_store_id (GUID): 마지막으로 확인한 재고 키 (매장)
+        checked_count (int): 확인한 재고 행 수
+        drift_count (int): 불일치 건수
+        repaired_count (int): 보정한 건수
+        started_at (datetime): 시작 시각
+        finished_at (datetime): 완료 시각 (NULL=진행 중 또는 중단)
+    """
+
+    __tablename__ = "reconciliation_runs"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4, comment="실행 ID")
+    basis_at = Column(DateTime, nullable=True, comment="기준 재고 스냅샷 시각 (NULL=전체 원장 합산)")
+    repair = Column(Boolean, nullable=False, default=False, comment="불일치 자동 보정 여부")
+    last_product_id = Column(GUID, nullable=True, comment="마지막으로 확인한 재고 키 (제품 ID)")
+    last_store_id = Column(GUID, nullable=True, comment="마지막으로 확인한 재고 키 (매장 ID)")
+    checked_count = Column(Integer, nullable=False, default=0, comment="확인한 재고 행 수")
+    drift_count = Column(Integer, nullable=False, default=0, comment="불일치 건수")
+    repaired_count = Column(Integer, nullable=False, default=0, comment="보정한 건수")
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True, comment="시작 시각")
+    finished_at = Column(DateTime, nullable=True, comment="완료 시각 (NULL=진행 중 또는 중단)")
+
+    def __repr__(self):
+        return f"<ReconciliationRun {self.id} checked={self.checked_count} drift={self.drift_count}>"
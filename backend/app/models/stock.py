@@ -21,7 +21,7 @@
 작성일: 2026-01-01
 TDD: Phase 1.1 - GREEN 단계에서 구현
 """
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -71,6 +71,7 @@ class CurrentStock(Base):
         product_id (GUID): 제품 ID (복합 PK, FK)
         store_id (GUID): 매장 ID (복합 PK, FK)
         quantity (int): 현재 재고 수량 (0 이상)
+        status (str): 재고 상태 (LOW/NORMAL/GOOD, quantity와 제품 안전재고로 계산해 저장)
         last_alerted_at (datetime): 마지막 안전재고 알림 발송 시각 (선택)
         updated_at (datetime): 최종 수정일 (재고 변동 시각)
 
@@ -122,6 +123,19 @@ class CurrentStock(Base):
     # 테이블 이름
     __tablename__ = "current_stocks"
 
+    # 상태 필터용 인덱스
+    #   - 상태별 목록 (GET /inventory/stocks?status=...): (status, store_id)
+    #   - 안전재고 미달 알림: LOW 행만 담는 부분 인덱스 (PostgreSQL, 전체 재고 대비 작음)
+    #   - 변경분 조회(GET /sync/changes): (updated_at, product_id, store_id)
+    __table_args__ = (
+        Index('idx_current_stocks_status_store', 'status', 'store_id'),
+        Index('idx_current_stocks_updated', 'updated_at', 'product_id', 'store_id'),
+        Index(
+            'idx_current_stocks_low', 'store_id',
+            postgresql_where=text("status = 'LOW'"),
+        ),
+    )
+
     # Composite Primary Key (제품 + 매장 조합)
     # 하나의 매장에서 하나의 제품은 하나의 재고 레코드만 존재
     product_id = Column(
@@ -146,6 +160,16 @@ class CurrentStock(Base):
         comment="현재 재고 수량 (음수 불가, 0 이상)"
     )
 
+    # 재고 상태 (비정규화)
+    # - 제품 테이블 조인 없이 상태 필터/인덱스 조회를 하기 위해 저장
+    # - 재고 변경 문장과 같은 문장에서 갱신됨 (app.services.inventory 참고)
+    # - Product.safety_stock 변경 시 해당 제품의 모든 재고 행을 다시 계산
+    status = Column(
+        String(10),
+        nullable=False,
+        comment="재고 상태 (LOW: 안전재고 미만, NORMAL: 안전재고 2배 미만, GOOD: 그 이상)"
+    )
+
     # 알림 관리
     last_alerted_at = Column(
         DateTime,
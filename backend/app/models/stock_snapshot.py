@@ -0,0 +1,73 @@
+"""
+재고 스냅샷 모델 (StockSnapshot Model)
+
+파일 역할:
+    특정 시각 기준 (제품, 매장)별 재고 수량을 주기적으로 기록하는 테이블 모델입니다.
+    과거 시점 재고 조회(GET /inventory/stocks/as-of)의 기준점으로 사용합니다.
+
+패턴:
+    - Snapshot 패턴: 원장(InventoryTransaction) 누적 합계를 일정 간격으로 저장
+    - Composite Primary Key 패턴: (product_id, store_id, taken_at)
+
+비즈니스 규칙:
+    1. quantity = created_at < taken_at 인 모든 트랜잭션 quantity의 합
+    2. 스냅샷은 모든 (제품, 매장)에 대해 같은 taken_at으로 한 번에 생성됨
+       (행이 없는 (제품, 매장)은 그 시각 재고 0)
+    3. taken_at 이전 시각으로 뒤늦게 동기화된 트랜잭션은 이후 스냅샷에 반영됨
+       (app.services.snapshot.adjust_snapshots 참고)
+
+작성일: 2026-10-17
+"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class StockSnapshot(Base):
+    """
+    재고 스냅샷 모델 (Stock Snapshots 테이블)
+
+    Attributes:
+        product_id (GUID): 제품 ID (복합 PK, FK)
+        store_id (GUID): 매장 ID (복합 PK, FK)
+        taken_at (datetime): 기준 시각 (이 시각 이전 트랜잭션까지 반영, 복합 PK)
+        quantity (int): 기준 시각의 재고 수량
+    """
+
+    __tablename__ = "stock_snapshots"
+
+    # 매장별 시점 조회: (store_id, taken_at)
+    __table_args__ = (
+        Index('idx_stock_snapshots_store_taken', 'store_id', 'taken_at'),
+        Index('idx_stock_snapshots_taken', 'taken_at'),
+    )
+
+    product_id = Column(
+        GUID,
+        ForeignKey("products.id"),
+        primary_key=True,
+        comment="제품 ID (복합 PK, FK)"
+    )
+
+    store_id = Column(
+        GUID,
+        ForeignKey("stores.id"),
+        primary_key=True,
+        comment="매장 ID (복합 PK, FK)"
+    )
+
+    taken_at = Column(
+        DateTime,
+        primary_key=True,
+        comment="스냅샷 기준 시각 (created_at < taken_at 인 트랜잭션까지 반영)"
+    )
+
+    quantity = Column(
+        Integer,
+        nullable=False,
+        comment="기준 시각의 재고 수량"
+    )
+
+    def __repr__(self):
+        return f"<StockSnapshot product={self.product_id} store={self.store_id} qty={self.quantity} at {self.taken_at}>"
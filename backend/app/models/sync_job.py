@@ -0,0 +1,61 @@
+"""
+비동기 동기화 작업 모델 (SyncJob Model)
+
+파일 역할:
+    POST /sync/jobs로 접수한 대용량 오프라인 동기화 배치를 저장하는 작업 큐 테이블 모델입니다.
+    접수 즉시 작업 ID를 돌려주고, 백그라운드 워커가 처리한 결과를 여기에 기록합니다.
+
+상태 흐름:
+    PENDING → RUNNING → DONE | FAILED
+    - 처리 중인 워커는 heartbeat_at을 주기적으로 갱신하며, 갱신이 오래 끊긴 RUNNING 작업은
+      PENDING으로 되돌려 다시 처리합니다
+      (local_id 중복 체크로 이미 반영된 항목은 synced로 돌려주므로 재실행해도 안전)
+    - 선점할 때마다 claim_id가 새로 발급되고, 완료 기록은 claim_id가 그대로일 때만 반영됩니다
+
+작성일: 2026-10-17
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text
+from datetime import datetime
+import uuid
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class SyncJob(Base):
+    """
+    비동기 동기화 작업 (Sync Jobs 테이블)
+
+    Attributes:
+        id (GUID): 작업 ID (클라이언트가 조회에 사용)
+        status (str): PENDING / RUNNING / DONE / FAILED
+        item_count (int): 요청 트랜잭션 수
+        payload (JSON): 요청 본문 (SyncRequest)
+        result (JSON): 처리 결과 (SyncResponse, DONE일 때)
+        error (str): 실패 사유 (FAILED일 때)
+        claim_id (GUID): 현재 처리 중인 실행의 선점 토큰 (RUNNING일 때)
+        created_at / started_at / finished_at (datetime): 접수 / 처리 시작 / 완료 시각
+        heartbeat_at (datetime): 처리 중인 워커가 마지막으로 살아 있음을 기록한 시각
+    """
+
+    __tablename__ = "sync_jobs"
+
+    # 복구 시 상태별 조회 (PENDING / 오래된 RUNNING)
+    __table_args__ = (
+        Index('idx_sync_jobs_status_created', 'status', 'created_at'),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4, comment="작업 ID")
+    status = Column(String(10), nullable=False, default="PENDING", comment="작업 상태 (PENDING/RUNNING/DONE/FAILED)")
+    item_count = Column(Integer, nullable=False, comment="요청 트랜잭션 수")
+    payload = Column(JSON, nullable=False, comment="요청 본문 (SyncRequest)")
+    result = Column(JSON, nullable=True, comment="처리 결과 (SyncResponse)")
+    error = Column(Text, nullable=True, comment="실패 사유")
+    claim_id = Column(GUID, nullable=True, comment="선점 토큰 (처리 중인 실행 식별)")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="접수 시각")
+    started_at = Column(DateTime, nullable=True, comment="처리 시작 시각")
+    finished_at = Column(DateTime, nullable=True, comment="완료 시각")
+    heartbeat_at = Column(DateTime, nullable=True, comment="처리 워커 마지막 생존 기록 시각")
+
+    def __repr__(self):
+        return f"<SyncJob {self.id} {self.status} items={self.item_count}>"
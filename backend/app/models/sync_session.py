@@ -0,0 +1,51 @@
+"""
+재개 가능한 동기화 세션 모델 (SyncSession Model)
+
+파일 역할:
+    대용량 오프라인 배치를 순서 있는 청크로 나눠 올리는 동기화 세션의 진행 상황을 저장합니다.
+    연결이 끊겨도 클라이언트는 acked_chunk 다음 청크부터 이어서 올립니다.
+
+진행 규칙:
+    - 청크 번호는 1부터 시작하며, acked_chunk + 1 번 청크만 받습니다
+    - 청크는 도착 즉시 반영되고, acked_chunk 갱신은 청크 반영과 같은 트랜잭션에서 커밋됩니다
+    - 마지막으로 반영한 청크의 응답(last_result)을 보관해, 응답을 받지 못한 클라이언트가
+      같은 청크를 다시 보내면 다시 반영하지 않고 저장된 응답을 돌려줍니다
+
+작성일: 2026-10-17
+"""
+from sqlalchemy import Column, DateTime, Integer, JSON
+from datetime import datetime
+import uuid
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class SyncSession(Base):
+    """
+    동기화 세션 (Sync Sessions 테이블)
+
+    Attributes:
+        id (GUID): 세션 ID
+        total_chunks (int): 클라이언트가 알린 전체 청크 수 (선택)
+        acked_chunk (int): 반영을 마친 마지막 청크 번호 (0=없음)
+        synced_count (int): 지금까지 성공한 항목 수
+        failed_count (int): 지금까지 실패한 항목 수
+        last_result (JSON): 마지막 청크의 처리 결과 (SyncResponse)
+        created_at / updated_at / completed_at (datetime): 생성 / 마지막 청크 반영 / 완료 시각
+    """
+
+    __tablename__ = "sync_sessions"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4, comment="세션 ID")
+    total_chunks = Column(Integer, nullable=True, comment="전체 청크 수 (클라이언트 신고, 선택)")
+    acked_chunk = Column(Integer, nullable=False, default=0, comment="반영을 마친 마지막 청크 번호 (0=없음)")
+    synced_count = Column(Integer, nullable=False, default=0, comment="성공 항목 수 (누적)")
+    failed_count = Column(Integer, nullable=False, default=0, comment="실패 항목 수 (누적)")
+    last_result = Column(JSON, nullable=True, comment="마지막 청크 처리 결과 (SyncResponse)")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="생성 시각")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="마지막 청크 반영 시각")
+    completed_at = Column(DateTime, nullable=True, comment="완료 시각 (NULL=진행 중)")
+
+    def __repr__(self):
+        return f"<SyncSession {self.id} acked={self.acked_chunk}/{self.total_chunks}>"
@@ -19,7 +19,10 @@
 작성일: 2026-01-01
 TDD: Phase 1.1 - GREEN 단계에서 구현
 """
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy import (
+    Column, Integer, Text, DateTime, ForeignKey, Enum as SQLEnum, Index,
+    PrimaryKeyConstraint, UniqueConstraint, column, func,
+)
 from sqlalchemy.orm import relationship
 import enum
 from datetime import datetime
@@ -196,16 +199,23 @@ class InventoryTransaction(Base):
     # 테이블 이름
     __tablename__ = "inventory_transactions"
     
-    # 인덱스 정의 (복합 인덱스)
+    # 인덱스 정의 (복합 인덱스) + 월별 파티션 (PostgreSQL, app/db/partitions.py 참고)
+    # 파티션 테이블의 PK/UNIQUE에는 파티션 키(created_at)가 포함되어야 함
+    # - local_id 중복 방지: 오프라인 재전송은 같은 created_at을 가지므로 (local_id, created_at)으로 충분
+    # - 변경분 조회(GET /sync/changes): 서버 반영 시각 = COALESCE(synced_at, created_at) 표현식 인덱스
+    #   (오프라인 항목의 created_at은 과거의 로컬 시각이라 도착 순서가 아님)
     __table_args__ = (
+        PrimaryKeyConstraint('id', 'created_at', name='inventory_transactions_pkey'),
+        UniqueConstraint('local_id', 'created_at', name='uq_inventory_transactions_local_id'),
         Index('idx_transactions_store_created', 'store_id', 'created_at'),
         Index('idx_transactions_product_created', 'product_id', 'created_at'),
+        Index('idx_transactions_changed', func.coalesce(column('synced_at'), column('created_at')), 'id'),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    # Primary Key
+    # Primary Key (ORM 식별자는 id 단독, __mapper_args__ 참고)
     id = Column(
         GUID,
-        primary_key=True,
         default=uuid.uuid4,
         comment="트랜잭션 고유 식별자"
     )
@@ -274,11 +284,13 @@ class InventoryTransaction(Base):
 
     local_id = Column(
         GUID,
-        nullable=True,
-        unique=True,  # 중복 방지
+        nullable=True,  # 중복 방지는 __table_args__의 UniqueConstraint
         comment="클라이언트 로컬 ID (오프라인 생성 ID)"
     )
 
+    # DB PK는 (id, created_at)이지만 id만으로 유일하므로 ORM 식별자는 id만 사용
+    __mapper_args__ = {"primary_key": [id]}
+
     # Relationships (ORM 편의 기능)
     product = relationship(
         "Product",
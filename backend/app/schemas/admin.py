@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
 from pydantic import BaseModel, Field
 from app.schemas.product import ProductResponse
 from app.schemas.store import StoreResponse
@@ -39,3 +42,40 @@ class LowStockItemResponse(BaseModel):
             }
         }
     }
+
+
+class SlowQueryResponse(BaseModel):
+    """느린 쿼리 실행 계획 기록 응답 스키마"""
+    fingerprint: str = Field(..., description="쿼리 지문 (파라미터 값을 무시한 SQL 형태의 해시)")
+    statement: str = Field(..., description="실행된 SQL (바인드 파라미터 자리 표시 포함)")
+    parameter_types: List[str] = Field(
+        default_factory=list, alias="parameterTypes",
+        description="마지막으로 관측된 바인드 파라미터 타입 (값은 기록하지 않음)",
+    )
+    count: int = Field(..., description="임계값을 넘은 횟수")
+    last_duration_ms: float = Field(..., alias="lastDurationMs", description="마지막 실행 시간 (ms)")
+    max_duration_ms: float = Field(..., alias="maxDurationMs", description="최대 실행 시간 (ms)")
+    first_seen_at: datetime = Field(..., alias="firstSeenAt", description="처음 관측 시각 (UTC)")
+    last_seen_at: datetime = Field(..., alias="lastSeenAt", description="마지막 관측 시각 (UTC)")
+    plan: Optional[Dict[str, Any]] = Field(None, description="EXPLAIN (FORMAT JSON) 결과 (수집 전이면 null)")
+    explained_at: Optional[datetime] = Field(None, alias="explainedAt", description="실행 계획 수집 시각 (UTC)")
+    error: Optional[str] = Field(None, description="EXPLAIN 실패 사유 (오류 종류와 SQLSTATE)")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "fingerprint": "3f2a9c1d0b7e4a56",
+                "statement": "SELECT products.id, products.name FROM products WHERE products.category_id = $1",
+                "parameterTypes": ["UUID"],
+                "count": 12,
+                "lastDurationMs": 812.4,
+                "maxDurationMs": 1530.0,
+                "firstSeenAt": "2026-10-17T02:10:00",
+                "lastSeenAt": "2026-10-17T03:45:12",
+                "plan": {"Plan": {"Node Type": "Seq Scan", "Relation Name": "products", "Total Cost": 1834.5}},
+                "explainedAt": "2026-10-17T03:45:12",
+                "error": None
+            }
+        }
+    }
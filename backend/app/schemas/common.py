@@ -39,8 +39,9 @@ class Pagination(BaseModel):
     Attributes:
         page (int): 현재 페이지 번호 (1부터 시작, 최소 1)
         limit (int): 페이지당 항목 수 (1~100, 기본 10)
-        total (int): 전체 항목 수 (0 이상)
-        totalPages (int): 전체 페이지 수 (0 이상)
+        total (int, optional): 전체 항목 수 (0 이상, count=none이면 null)
+        totalPages (int, optional): 전체 페이지 수 (0 이상, count=none이면 null)
+        nextCursor (str, optional): 다음 페이지 커서 (keyset 페이지네이션 지원 API만)
 
     예시:
         >>> # API 응답 예시
@@ -73,16 +74,21 @@ class Pagination(BaseModel):
         description="페이지당 항목 수 (1~100)"
     )
 
-    total: int = Field(
+    total: Optional[int] = Field(
         ...,
         ge=0,  # 0개 이상
-        description="전체 항목 수"
+        description="전체 항목 수 (count=estimate면 추정치, count=none이면 null)"
     )
 
-    totalPages: int = Field(
+    totalPages: Optional[int] = Field(
         ...,
         ge=0,
-        description="전체 페이지 수 (total을 limit로 나눈 값)"
+        description="전체 페이지 수 (total을 limit로 나눈 값, count=none이면 null)"
+    )
+
+    nextCursor: Optional[str] = Field(
+        None,
+        description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 null)"
     )
 
     model_config = {
@@ -111,6 +111,50 @@ class StockListResponse(BaseModel):
     }
 
 
+class StockAsOfItemResponse(BaseModel):
+    """과거 시점 재고 항목"""
+    product: ProductSimpleResponse
+    store: StoreSimpleResponse
+    quantity: int = Field(..., description="기준 시점의 재고 수량")
+
+    model_config = {
+        "from_attributes": True,
+        "populate_by_name": True,
+    }
+
+class StockAsOfResponse(BaseModel):
+    """과거 시점 재고 응답 스키마"""
+    at: datetime = Field(..., description="조회 시점 (이 시각까지의 트랜잭션 반영)")
+    snapshot_at: Optional[datetime] = Field(None, alias="snapshotAt", description="계산 기준 스냅샷 시각 (없으면 전체 원장 합산)")
+    items: List[StockAsOfItemResponse]
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "at": "2026-09-30T18:00:00",
+                "snapshotAt": "2026-10-01T00:00:00",
+                "items": [
+                    {
+                        "product": {
+                            "id": "550e8400-e29b-41d4-a716-446655440000",
+                            "barcode": "8801234567890",
+                            "name": "새우깡",
+                            "safetyStock": 10
+                        },
+                        "store": {
+                            "id": "660e8400-e29b-41d4-a716-446655440000",
+                            "name": "강남점",
+                            "code": "GN001"
+                        },
+                        "quantity": 18
+                    }
+                ]
+            }
+        }
+    }
+
+
 class ProductStockDetailResponse(BaseModel):
     """제품별 재고 상세 응답 스키마"""
     product: ProductResponse
@@ -200,4 +200,62 @@ class ProductListResponse(BaseModel):
                 }
             }
         }
-    }
\ No newline at end of file
+    }
+
+class BarcodeBatchRequest(BaseModel):
+    """
+    바코드 일괄 조회 요청 스키마
+
+    오프라인 후 재접속한 단말이 여러 바코드를 한 번의 요청으로 조회할 때 사용합니다.
+    """
+    barcodes: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="조회할 바코드 목록 (1~100개, 중복은 한 번만 조회)"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "barcodes": ["8801234567890", "8809876543210"]
+            }
+        }
+    }
+
+
+class BarcodeBatchResponse(BaseModel):
+    """
+    바코드 일괄 조회 응답 스키마
+    """
+    items: List[ProductResponse] = Field(
+        ...,
+        description="조회된 제품 목록 (요청 순서, 중복 제외)"
+    )
+
+    missing: List[str] = Field(
+        ...,
+        description="존재하지 않는 바코드 목록"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {
+                        "id": "550e8400-e29b-41d4-a716-446655440000",
+                        "barcode": "8801234567890",
+                        "name": "하이드라 에센스 100ml",
+                        "categoryId": "660e8400-e29b-41d4-a716-446655440000",
+                        "safetyStock": 20,
+                        "imageUrl": None,
+                        "memo": None,
+                        "isActive": True,
+                        "createdAt": "2026-01-01T09:00:00Z",
+                        "updatedAt": None
+                    }
+                ],
+                "missing": ["8809876543210"]
+            }
+        }
+    }
@@ -3,6 +3,7 @@ from uuid import UUID
 from datetime import datetime
 from typing import List, Optional
 from app.models.transaction import TransactionType, AdjustReason
+from app.schemas.product import ProductResponse
 
 class SyncTransactionItem(BaseModel):
     """동기화할 개별 트랜잭션 항목"""
@@ -123,3 +124,159 @@ class SyncResponse(BaseModel):
             }
         }
     }
+
+
+class SyncJobResponse(BaseModel):
+    """비동기 동기화 작업 응답 스키마"""
+    job_id: UUID = Field(..., alias="jobId", description="작업 ID")
+    status: str = Field(..., description="작업 상태 (PENDING, RUNNING, DONE, FAILED)")
+    item_count: int = Field(..., alias="itemCount", description="요청 트랜잭션 수")
+    created_at: datetime = Field(..., alias="createdAt", description="접수 시각")
+    started_at: Optional[datetime] = Field(None, alias="startedAt", description="처리 시작 시각")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt", description="완료 시각")
+    result: Optional[SyncResponse] = Field(None, description="처리 결과 (DONE일 때)")
+    error: Optional[str] = Field(None, description="실패 사유 (FAILED일 때)")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "jobId": "990e8400-e29b-41d4-a716-446655440000",
+                "status": "DONE",
+                "itemCount": 2,
+                "createdAt": "2026-01-24T10:00:00Z",
+                "startedAt": "2026-01-24T10:00:00Z",
+                "finishedAt": "2026-01-24T10:00:03Z",
+                "result": {
+                    "synced": [
+                        {
+                            "localId": "110e8400-e29b-41d4-a716-446655440000",
+                            "serverId": "880e8400-e29b-41d4-a716-446655440000"
+                        }
+                    ],
+                    "failed": [],
+                    "syncedAt": "2026-01-24T10:00:03Z"
+                },
+                "error": None
+            }
+        }
+    }
+
+
+class SyncSessionCreate(BaseModel):
+    """동기화 세션 생성 요청 스키마"""
+    total_chunks: Optional[int] = Field(None, alias="totalChunks", ge=1, description="전체 청크 수 (알면 지정)")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "totalChunks": 12
+            }
+        }
+    }
+
+
+class SyncSessionResponse(BaseModel):
+    """동기화 세션 진행 상황 응답 스키마"""
+    session_id: UUID = Field(..., alias="sessionId", description="세션 ID")
+    total_chunks: Optional[int] = Field(None, alias="totalChunks", description="전체 청크 수")
+    acked_chunk: int = Field(..., alias="ackedChunk", description="반영을 마친 마지막 청크 번호 (0=없음)")
+    next_chunk: int = Field(..., alias="nextChunk", description="다음에 보낼 청크 번호")
+    synced_count: int = Field(..., alias="syncedCount", description="성공 항목 수 (누적)")
+    failed_count: int = Field(..., alias="failedCount", description="실패 항목 수 (누적)")
+    created_at: datetime = Field(..., alias="createdAt", description="생성 시각")
+    updated_at: datetime = Field(..., alias="updatedAt", description="마지막 청크 반영 시각")
+    completed_at: Optional[datetime] = Field(None, alias="completedAt", description="완료 시각")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "sessionId": "aa0e8400-e29b-41d4-a716-446655440000",
+                "totalChunks": 12,
+                "ackedChunk": 4,
+                "nextChunk": 5,
+                "syncedCount": 1995,
+                "failedCount": 5,
+                "createdAt": "2026-01-24T10:00:00Z",
+                "updatedAt": "2026-01-24T10:00:40Z",
+                "completedAt": None
+            }
+        }
+    }
+
+
+class SyncChunkResponse(BaseModel):
+    """동기화 청크 반영 응답 스키마"""
+    session: SyncSessionResponse = Field(..., description="반영 후 세션 진행 상황")
+    chunk: int = Field(..., description="청크 번호")
+    replayed: bool = Field(..., description="이미 반영된 청크의 재전송 여부 (저장된 결과 반환)")
+    result: SyncResponse = Field(..., description="청크 처리 결과")
+
+    model_config = {
+        "populate_by_name": True,
+    }
+
+
+class StockChangeItem(BaseModel):
+    """변경된 재고 항목"""
+    product_id: UUID = Field(..., alias="productId", description="제품 ID")
+    store_id: UUID = Field(..., alias="storeId", description="매장 ID")
+    quantity: int = Field(..., description="현재 재고 수량")
+    status: str = Field(..., description="재고 상태 (LOW, NORMAL, GOOD)")
+    updated_at: datetime = Field(..., alias="updatedAt", description="최종 변동 시각")
+
+    model_config = {
+        "from_attributes": True,
+        "populate_by_name": True,
+    }
+
+
+class TransactionChangeItem(BaseModel):
+    """새로 반영된 트랜잭션 항목"""
+    id: UUID = Field(..., description="트랜잭션 ID")
+    local_id: Optional[UUID] = Field(None, alias="localId", description="클라이언트 로컬 ID (오프라인 생성 시)")
+    product_id: UUID = Field(..., alias="productId", description="제품 ID")
+    store_id: UUID = Field(..., alias="storeId", description="매장 ID")
+    type: TransactionType = Field(..., description="트랜잭션 타입 (INBOUND, OUTBOUND, ADJUST)")
+    quantity: int = Field(..., description="수량 변화 (양수=입고, 음수=출고/조정)")
+    reason: Optional[AdjustReason] = Field(None, description="조정 사유")
+    note: Optional[str] = Field(None, description="비고")
+    created_at: datetime = Field(..., alias="createdAt", description="발생 일시")
+    synced_at: Optional[datetime] = Field(None, alias="syncedAt", description="동기화 일시 (오프라인 항목)")
+
+    model_config = {
+        "from_attributes": True,
+        "populate_by_name": True,
+    }
+
+
+class SyncChangesResponse(BaseModel):
+    """변경분 조회 응답 스키마"""
+    products: List[ProductResponse] = Field(..., description="추가/수정된 제품")
+    stocks: List[StockChangeItem] = Field(..., description="변동된 재고")
+    transactions: List[TransactionChangeItem] = Field(..., description="새로 반영된 트랜잭션")
+    next_token: str = Field(..., alias="nextToken", description="다음 조회에 since로 전달할 토큰")
+    has_more: bool = Field(..., alias="hasMore", description="true면 nextToken으로 바로 다시 조회")
+
+    model_config = {
+        "populate_by_name": True,
+        "json_schema_extra": {
+            "example": {
+                "products": [],
+                "stocks": [
+                    {
+                        "productId": "550e8400-e29b-41d4-a716-446655440000",
+                        "storeId": "660e8400-e29b-41d4-a716-446655440000",
+                        "quantity": 25,
+                        "status": "NORMAL",
+                        "updatedAt": "2026-01-24T10:00:00Z"
+                    }
+                ],
+                "transactions": [],
+                "nextToken": "WyIyMDI2LTAxLTI0VDEwOjAwOjAwIl0",
+                "hasMore": False
+            }
+        }
+    }
@@ -0,0 +1,294 @@
+"""
+안전재고 미달 알림 발송 (Low Stock Alert Dispatcher)
+
+재고 변경 문장(apply_stock_delta / apply_mutation_batch)이 안전재고 미만으로
+새로 내려간 (제품, 매장)을 세션에 기록하면, 커밋 후 대기열에 넣고
+백그라운드 워커가 배치로 모아 전달합니다.
+
+    재고 변경 → record_low_stock() → (커밋) → 대기열 → 워커
+        → last_alerted_at 선점(UPDATE ... RETURNING) → sink.send()
+
+- 비용은 변경된 행 수에 비례합니다 (전체 재고를 다시 훑지 않음)
+- 중복 제거: 배치 안에서는 (제품, 매장)당 1건, 배치 간에는 current_stocks.last_alerted_at이
+  LOW_STOCK_ALERT_COOLDOWN_MINUTES 안이면 건너뜀. 선점은 한 문장의 조건부 UPDATE라
+  여러 워커 프로세스가 같은 행을 동시에 처리해도 한 번만 발송됩니다.
+- 롤백된 변경은 대기열에 들어가지 않습니다
+
+주의:
+    - 프로세스 내 대기열입니다 (재시작 시 대기 중인 알림은 사라짐)
+    - 전달에 실패하면 선점을 해제하여 다음 변경 때 다시 알립니다
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session
+from app.models.product import Product
+from app.models.stock import CurrentStock
+
+logger = get_logger(__name__)
+
+_PENDING_KEY = "low_stock_alerts"
+
+
+class LowStockAlert:
+    """안전재고 미달 알림 1건"""
+    def __init__(
+        self,
+        product_id: UUID,
+        store_id: UUID,
+        quantity: int,
+        safety_stock: int,
+        detected_at: Optional[datetime] = None,
+    ):
+        self.product_id = product_id
+        self.store_id = store_id
+        self.quantity = quantity
+        self.safety_stock = safety_stock
+        self.detected_at = detected_at or datetime.utcnow()
+
+    @property
+    def key(self) -> Tuple[UUID, UUID]:
+        return (self.product_id, self.store_id)
+
+    def to_dict(self) -> dict:
+        return {
+            "productId": str(self.product_id),
+            "storeId": str(self.store_id),
+            "quantity": self.quantity,
+            "safetyStock": self.safety_stock,
+            "detectedAt": self.detected_at.isoformat(),
+        }
+
+
+# ========== 전달 대상 (Sinks) ==========
+
+class LogAlertSink:
+    """구조화 로그로 기록"""
+    async def send(self, alerts: List[LowStockAlert]) -> None:
+        for alert in alerts:
+            logger.warning("Low stock alert", **alert.to_dict())
+
+
+class WebhookAlertSink:
+    """배치를 JSON 한 번으로 POST (2xx가 아니면 실패로 처리)"""
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    async def send(self, alerts: List[LowStockAlert]) -> None:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(
+                self.url, json={"alerts": [a.to_dict() for a in alerts]}
+            )
+            response.raise_for_status()
+
+
+class InMemoryAlertSink:
+    """전달된 알림을 목록에 보관 (테스트용)"""
+    def __init__(self):
+        self.alerts: List[LowStockAlert] = []
+
+    async def send(self, alerts: List[LowStockAlert]) -> None:
+        self.alerts.extend(alerts)
+
+
+def create_sink():
+    """설정(LOW_STOCK_ALERT_SINK)에 맞는 sink 생성"""
+    if settings.LOW_STOCK_ALERT_SINK == "webhook":
+        return WebhookAlertSink(settings.LOW_STOCK_ALERT_WEBHOOK_URL)
+    return LogAlertSink()
+
+
+# ========== Dispatcher ==========
+
+class AlertDispatcher:
+    """
+    알림 대기열 + 백그라운드 워커
+
+    - enqueue()는 블로킹 없이 대기열에 넣기만 함 (가득 차면 버림)
+    - 워커는 첫 알림이 오면 대기열에 쌓인 것까지 max_batch개를 한 번에 처리
+    - 워커는 첫 enqueue 시 현재 이벤트 루프에서 시작됨
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        sink=None,
+        cooldown_minutes: Optional[int] = None,
+        max_batch: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self.sink = sink or create_sink()
+        self.cooldown = timedelta(minutes=(
+            settings.LOW_STOCK_ALERT_COOLDOWN_MINUTES if cooldown_minutes is None else cooldown_minutes
+        ))
+        self.max_batch = settings.LOW_STOCK_ALERT_BATCH_SIZE if max_batch is None else max_batch
+        self.queue_size = settings.LOW_STOCK_ALERT_QUEUE_SIZE if queue_size is None else queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def enqueue(self, alerts: Iterable[LowStockAlert]) -> None:
+        queue = self._ensure_worker()
+        for alert in alerts:
+            try:
+                queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                logger.warning("Low stock alert queue full, dropping alert", **alert.to_dict())
+
+    async def drain(self) -> None:
+        """대기열의 알림이 모두 처리될 때까지 대기 (종료 시/테스트용)"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """대기 중인 알림을 처리한 뒤 워커 종료"""
+        await self.drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # 새 이벤트 루프(테스트마다 루프가 바뀌는 경우 등)에서는 대기열도 새로 만듦
+            if self._loop is not loop or self._queue is None:
+                self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._loop = loop
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self.dispatch(batch)
+            except Exception as e:
+                logger.error("Low stock alert dispatch failed", error=str(e), batch_size=len(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def dispatch(self, alerts: List[LowStockAlert]) -> List[LowStockAlert]:
+        """
+        알림 배치 1회 처리
+
+        1. 배치 안 중복 제거 ((제품, 매장)당 마지막 1건)
+        2. 아직 LOW이고 재알림 간격이 지난 행만 last_alerted_at = now로 선점
+           (UPDATE ... RETURNING 한 문장, 결과는 선점된 행의 현재 수량)
+        3. 선점된 알림만 sink로 전달. 실패 시 선점 해제
+
+        Returns:
+            실제로 전달된 알림 목록
+        """
+        keys = list({a.key: a for a in alerts})
+        now = datetime.utcnow()
+        table = CurrentStock.__table__
+        safety_stock = (
+            select(Product.safety_stock).where(Product.id == table.c.product_id).scalar_subquery()
+        )
+
+        async with self._session_factory() as db:
+            rows = await db.execute(
+                update(table)
+                .where(
+                    tuple_(table.c.product_id, table.c.store_id).in_(keys),
+                    table.c.status == "LOW",
+                    or_(
+                        table.c.last_alerted_at.is_(None),
+                        table.c.last_alerted_at <= now - self.cooldown,
+                    ),
+                )
+                .values(last_alerted_at=now)
+                .returning(table.c.product_id, table.c.store_id, table.c.quantity, safety_stock)
+            )
+            claimed = [
+                LowStockAlert(row[0], row[1], row[2], row[3] or 0, detected_at=now)
+                for row in rows
+            ]
+            await db.commit()
+
+            if not claimed:
+                return []
+            try:
+                await self.sink.send(claimed)
+            except Exception:
+                await db.execute(
+                    update(table)
+                    .where(
+                        tuple_(table.c.product_id, table.c.store_id).in_([a.key for a in claimed]),
+                        table.c.last_alerted_at == now,
+                    )
+                    .values(last_alerted_at=None)
+                )
+                await db.commit()
+                raise
+        return claimed
+
+
+_dispatcher: Optional[AlertDispatcher] = None
+
+
+def get_dispatcher() -> AlertDispatcher:
+    """프로세스 전역 dispatcher (첫 사용 시 생성)"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = AlertDispatcher()
+    return _dispatcher
+
+
+async def shutdown_dispatcher() -> None:
+    """앱 종료 시 대기 중인 알림 처리 후 워커 종료"""
+    if _dispatcher is not None:
+        await _dispatcher.stop()
+
+
+# ========== 세션 연동 ==========
+
+def record_low_stock(
+    db: AsyncSession,
+    product_id: UUID,
+    store_id: UUID,
+    quantity: int,
+    safety_stock: int,
+) -> None:
+    """
+    안전재고 미만으로 새로 내려간 재고를 세션에 기록 (커밋 후 대기열로 전달)
+
+    재고 변경 함수가 변경 전 수량 >= 안전재고 > 변경 후 수량일 때 호출합니다.
+    """
+    if not settings.LOW_STOCK_ALERT_ENABLED:
+        return
+    db.sync_session.info.setdefault(_PENDING_KEY, []).append(
+        LowStockAlert(product_id, store_id, quantity, safety_stock)
+    )
+
+
+def _enqueue_on_commit(session: Session) -> None:
+    alerts = session.info.pop(_PENDING_KEY, None)
+    if alerts:
+        get_dispatcher().enqueue(alerts)
+
+
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_commit", _enqueue_on_commit)
+event.listen(Session, "after_rollback", _discard_on_rollback)
@@ -0,0 +1,190 @@
+"""
+재고 쓰기 그룹 커밋 (Stock Write Coalescer)
+
+같은 (제품, 매장)에 대한 입고/출고/조정 요청을 STOCK_COALESCER_WINDOW_MS 동안 모아
+inventory_service.apply_mutation_batch 한 번(트랜잭션 multi-row INSERT + 재고 일괄 반영)과
+단일 커밋으로 처리합니다. 각 요청은 자신의 변경 직후 재고와 safety_alert를 돌려받습니다.
+
+요청마다 DB 트랜잭션을 열어 같은 current_stocks 행을 두고 경합하는 대신,
+행 잠금은 배치당 한 번만 잡힙니다.
+
+주의:
+    - 프로세스 내 버퍼입니다 (워커 프로세스 간에는 합쳐지지 않음)
+    - 버퍼에 들어간 요청은 클라이언트가 연결을 끊어도 반영됩니다
+"""
+import asyncio
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session
+from app.models.transaction import InventoryTransaction, TransactionType
+from app.models.user import User
+from app.schemas.transaction import (
+    InboundTransactionCreate, OutboundTransactionCreate, AdjustTransactionCreate
+)
+from app.services import inventory as inventory_service
+from app.services.inventory import MutationResult, StockKey, StockMutation
+
+logger = get_logger(__name__)
+
+_Pending = Tuple[StockMutation, "asyncio.Future[MutationResult]"]
+
+
+class StockWriteCoalescer:
+    """
+    (제품, 매장)별 재고 변경 버퍼
+
+    - 키의 첫 요청이 들어오면 window_ms 뒤 flush 예약
+    - 버퍼가 max_batch에 도달하면 즉시 flush
+    - flush는 요청과 별도의 세션으로 수행하고, 결과를 입력 순서대로 각 Future에 전달
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        window_ms: Optional[int] = None,
+        max_batch: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self.window_ms = settings.STOCK_COALESCER_WINDOW_MS if window_ms is None else window_ms
+        self.max_batch = settings.STOCK_COALESCER_MAX_BATCH if max_batch is None else max_batch
+        self._buffers: Dict[StockKey, List[_Pending]] = {}
+        self._timers: Dict[StockKey, asyncio.TimerHandle] = {}
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, mutation: StockMutation) -> MutationResult:
+        """변경 1건을 버퍼에 넣고, 배치가 반영되면 그 결과를 반환"""
+        loop = asyncio.get_running_loop()
+        if mutation.created_at is None:
+            mutation.created_at = datetime.utcnow()
+
+        future: "asyncio.Future[MutationResult]" = loop.create_future()
+        buffer = self._buffers.setdefault(mutation.key, [])
+        buffer.append((mutation, future))
+
+        if len(buffer) >= self.max_batch:
+            self._start_flush(mutation.key)
+        elif len(buffer) == 1:
+            self._timers[mutation.key] = loop.call_later(
+                self.window_ms / 1000, self._start_flush, mutation.key
+            )
+
+        # 호출자가 취소되어도 이미 버퍼에 들어간 변경은 반영되므로 Future는 보호
+        return await asyncio.shield(future)
+
+    async def drain(self) -> None:
+        """대기 중인 버퍼를 모두 즉시 반영하고 완료될 때까지 대기 (종료 시/테스트용)"""
+        for key in list(self._buffers):
+            self._start_flush(key)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _start_flush(self, key: StockKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._buffers.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: List[_Pending]) -> None:
+        mutations = [m for m, _ in batch]
+        try:
+            async with self._session_factory() as db:
+                results = await inventory_service.apply_mutation_batch(db, mutations)
+                await db.commit()
+        except Exception as e:
+            logger.warning("Coalesced stock flush failed", error=str(e), batch_size=len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_coalescer: Optional[StockWriteCoalescer] = None
+
+
+def get_coalescer() -> StockWriteCoalescer:
+    """프로세스 전역 coalescer (첫 사용 시 생성)"""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = StockWriteCoalescer()
+    return _coalescer
+
+
+async def shutdown_coalescer() -> None:
+    """앱 종료 시 버퍼/진행 중인 재고 변경을 모두 반영 (생성된 적이 없으면 아무 것도 안 함)"""
+    if _coalescer is not None:
+        await _coalescer.drain()
+
+
+async def _process(mutation: StockMutation) -> Tuple[InventoryTransaction, int, bool]:
+    result = await get_coalescer().submit(mutation)
+    result.raise_for_error()
+
+    # 응답 구성용 (세션에 연결되지 않은 객체, 행은 이미 배치 INSERT로 저장됨)
+    tx = InventoryTransaction(
+        id=result.transaction_id,
+        product_id=mutation.product_id,
+        store_id=mutation.store_id,
+        user_id=mutation.user_id,
+        type=mutation.type,
+        quantity=mutation.quantity,
+        reason=mutation.reason,
+        note=mutation.note,
+        created_at=mutation.created_at,
+    )
+    return tx, result.new_stock, result.safety_alert
+
+
+async def process_inbound(
+    data: InboundTransactionCreate,
+    user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
+) -> Tuple[InventoryTransaction, int, bool]:
+    return await _process(StockMutation(
+        product_id=data.product_id,
+        store_id=data.store_id,
+        type=TransactionType.INBOUND,
+        quantity=data.quantity,
+        note=data.note,
+        user_id=user.id if user else None,
+    ))
+
+
+async def process_outbound(
+    data: OutboundTransactionCreate,
+    user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
+) -> Tuple[InventoryTransaction, int, bool]:
+    return await _process(StockMutation(
+        product_id=data.product_id,
+        store_id=data.store_id,
+        type=TransactionType.OUTBOUND,
+        quantity=-data.quantity,
+        note=data.note,
+        user_id=user.id if user else None,
+    ))
+
+
+async def process_adjust(
+    data: AdjustTransactionCreate,
+    user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
+) -> Tuple[InventoryTransaction, int, bool]:
+    return await _process(StockMutation(
+        product_id=data.product_id,
+        store_id=data.store_id,
+        type=TransactionType.ADJUST,
+        quantity=data.quantity,
+        reason=data.reason,
+        note=data.note,
+        user_id=user.id if user else None,
+    ))
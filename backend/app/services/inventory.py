@@ -1,18 +1,30 @@
-from typing import List, Optional, Tuple, Sequence
-from uuid import UUID
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import joinedload
+from typing import Dict, List, Optional, Tuple, Sequence
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from sqlalchemy import (
+    select, and_, or_, insert, update, bindparam, tuple_, literal, case, event, inspect
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, Mapper
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.stock import CurrentStock
 from app.models.product import Product
+from app.models.store import Store
 from app.models.user import User, UserRole
 from app.models.user_store import UserStore
 from app.models.transaction import InventoryTransaction, TransactionType
 from app.schemas.transaction import (
     InboundTransactionCreate, OutboundTransactionCreate, AdjustTransactionCreate
 )
-from app.core.exceptions import ForbiddenException, InsufficientStockException
+from app.core.exceptions import (
+    BadRequestException, ForbiddenException, InsufficientStockException, NotFoundException
+)
+from app.core.counting import CountMode, count_rows
+from app.services.alerts import record_low_stock
+from app.core.pagination import encode_cursor, decode_cursor
+from app.db.types import GUID
 
 
 def get_stock_status(quantity: int, safety_stock: int) -> str:
@@ -23,6 +35,76 @@ def get_stock_status(quantity: int, safety_stock: int) -> str:
     else:
         return "GOOD"
 
+def stock_status_case(quantity, safety_stock):
+    """get_stock_status와 같은 기준의 SQL 식 (current_stocks.status 갱신용)"""
+    return case(
+        (quantity < safety_stock, "LOW"),
+        (quantity < safety_stock * 2, "NORMAL"),
+        else_="GOOD",
+    )
+
+@event.listens_for(CurrentStock, "before_insert")
+@event.listens_for(CurrentStock, "before_update")
+def _set_stock_status(mapper: Mapper, connection, target: CurrentStock) -> None:
+    """
+    ORM으로 저장되는 재고 행의 status 계산
+
+    대량 변경 경로(apply_stock_delta/apply_stock_deltas)는 SQL 문장 안에서 직접 갱신하므로
+    여기서는 ORM 객체(테스트 데이터, 관리 스크립트 등)만 처리합니다.
+    """
+    state = inspect(target)
+    if state.persistent and not state.attrs.quantity.history.has_changes():
+        return
+
+    product = target.__dict__.get("product")
+    if product is not None and product.id == target.product_id:
+        safety_stock = product.safety_stock
+    else:
+        safety_stock = connection.scalar(
+            select(Product.safety_stock).where(Product.id == target.product_id)
+        )
+    target.status = get_stock_status(target.quantity or 0, safety_stock or 0)
+
+@event.listens_for(Product, "after_update")
+def _refresh_stock_status(mapper: Mapper, connection, target: Product) -> None:
+    """안전재고가 바뀌면 해당 제품의 모든 재고 행 status를 한 문장으로 다시 계산"""
+    if not inspect(target).attrs.safety_stock.history.has_changes():
+        return
+    table = CurrentStock.__table__
+    connection.execute(
+        update(table)
+        .where(table.c.product_id == target.id)
+        .values(status=stock_status_case(table.c.quantity, target.safety_stock))
+    )
+
+def transaction_cursor(tx: InventoryTransaction) -> str:
+    """list_transactions의 다음 페이지 커서 (마지막 항목의 created_at, id)"""
+    return encode_cursor([tx.created_at.isoformat(), tx.id.hex])
+
+def stock_cursor(stock: CurrentStock) -> str:
+    """get_current_stocks의 다음 페이지 커서 (마지막 항목의 product_id, store_id)"""
+    return encode_cursor([stock.product_id.hex, stock.store_id.hex])
+
+def naive_utc(value: datetime) -> datetime:
+    """created_at은 UTC naive로 저장되므로 타임존이 있는 입력은 UTC로 변환 후 tzinfo 제거"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _decode_transaction_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    created_at, tx_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), UUID(tx_id)
+    except (TypeError, ValueError, AttributeError):
+        raise BadRequestException("Invalid cursor")
+
+def _decode_uuid_cursor(cursor: str) -> Tuple[UUID, UUID]:
+    first, second = decode_cursor(cursor, 2)
+    try:
+        return UUID(first), UUID(second)
+    except (TypeError, ValueError, AttributeError):
+        raise BadRequestException("Invalid cursor")
+
 async def get_current_stocks(
     db: AsyncSession,
     user: Optional[User] = None,  # TODO: 인증 구현 후 필수로 변경
@@ -30,8 +112,17 @@ async def get_current_stocks(
     limit: int = 10,
     store_id: Optional[UUID] = None,
     category_id: Optional[UUID] = None,
-    status: Optional[str] = None
-) -> Tuple[Sequence[CurrentStock], int]:
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
+) -> Tuple[Sequence[CurrentStock], Optional[int]]:
+    """
+    현재고 목록 조회
+
+    (product_id, store_id) 순으로 정렬합니다. cursor가 주어지면 OFFSET 대신
+    PK 기준 keyset 조건으로 다음 페이지를 조회하고 page는 무시합니다.
+    전체 건수는 count 모드(exact/estimate/none)에 따라 계산합니다 (none이면 None).
+    """
     
     allowed_store_ids = []
     
@@ -56,11 +147,7 @@ async def get_current_stocks(
     # MVP: 모든 매장 접근 허용
     target_store_ids = [store_id] if store_id else []
 
-    # product, store 조인 포함하여 재고 조회
-    query = select(CurrentStock).options( # Eager loading 사용
-        joinedload(CurrentStock.product),
-        joinedload(CurrentStock.store)
-    )
+    query = select(CurrentStock)
 
     if target_store_ids:
         query = query.where(CurrentStock.store_id.in_(target_store_ids))
@@ -69,24 +156,34 @@ async def get_current_stocks(
         query = query.join(Product).where(Product.category_id == category_id)
         
     if status:
-        if not category_id:
-            query = query.join(Product)
-            
-        if status == "LOW":
-            query = query.where(CurrentStock.quantity < Product.safety_stock)
-        elif status == "NORMAL":
-            query = query.where(
-                (CurrentStock.quantity >= Product.safety_stock) & 
-                (CurrentStock.quantity < Product.safety_stock * 2)
-            )
-        elif status == "GOOD":
-             query = query.where(CurrentStock.quantity >= Product.safety_stock * 2)
+        # 비정규화된 status 컬럼으로 필터 (products 조인 없이 idx_current_stocks_status_store 사용)
+        query = query.where(CurrentStock.status == status)
+
+    filtered = bool(target_store_ids or category_id or status)
+    total = await count_rows(
+        db, query, count,
+        table=None if filtered else CurrentStock.__table__,
+        cache_key=("stocks", tuple(target_store_ids), category_id, status),
+    )
 
-    subquery = query.subquery()
-    count_stmt = select(func.count()).select_from(subquery)
-    total = (await db.execute(count_stmt)).scalar_one()
+    # product, store 조인 포함하여 재고 조회
+    query = query.options( # Eager loading 사용
+        joinedload(CurrentStock.product),
+        joinedload(CurrentStock.store)
+    )
+    query = query.order_by(CurrentStock.product_id, CurrentStock.store_id)
+    if cursor:
+        after_product_id, after_store_id = _decode_uuid_cursor(cursor)
+        query = query.where(
+            tuple_(CurrentStock.product_id, CurrentStock.store_id)
+            > tuple_(
+                literal(after_product_id, GUID), literal(after_store_id, GUID)
+            )
+        )
+    else:
+        query = query.offset((page - 1) * limit)
 
-    query = query.offset((page - 1) * limit).limit(limit)
+    query = query.limit(limit)
     result = await db.execute(query)
     stocks = result.scalars().all()
     
@@ -120,140 +217,492 @@ async def list_transactions(
     limit: int = 10,
     store_id: Optional[UUID] = None,
     product_id: Optional[UUID] = None,
-    type: Optional[str] = None
-) -> Tuple[Sequence[InventoryTransaction], int]:
-    
-    query = select(InventoryTransaction).options(
-        joinedload(InventoryTransaction.product),
-        joinedload(InventoryTransaction.store),
-        joinedload(InventoryTransaction.user)
-    )
-    
+    type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Tuple[Sequence[InventoryTransaction], Optional[int]]:
+    """
+    트랜잭션 이력 조회 (최신순)
+
+    (created_at DESC, id DESC)로 정렬합니다. cursor가 주어지면 OFFSET 대신
+    `(created_at, id) < (커서 값)` seek 조건을 사용하므로 매장/제품 필터 시
+    idx_transactions_store_created / idx_transactions_product_created 인덱스를
+    따라 페이지 깊이와 무관한 비용으로 조회합니다. 이때 page는 무시합니다.
+    전체 건수는 count 모드(exact/estimate/none)에 따라 계산합니다 (none이면 None).
+
+    start/end(created_at 범위, [start, end))를 주면 PostgreSQL 월별 파티션 중
+    해당 기간의 파티션만 읽습니다 (건수 계산 포함).
+    """
+    query = select(InventoryTransaction)
+
     if store_id:
         query = query.where(InventoryTransaction.store_id == store_id)
     if product_id:
         query = query.where(InventoryTransaction.product_id == product_id)
     if type:
         query = query.where(InventoryTransaction.type == type)
-        
-    query = query.order_by(InventoryTransaction.created_at.desc())
-    
-    # Count
-    count_stmt = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_stmt)).scalar_one()
-    
+    if start:
+        start = naive_utc(start)
+        query = query.where(InventoryTransaction.created_at >= start)
+    if end:
+        end = naive_utc(end)
+        query = query.where(InventoryTransaction.created_at < end)
+
+    # Count (커서 위치와 무관하게 필터 전체 건수)
+    filtered = bool(store_id or product_id or type or start or end)
+    total = await count_rows(
+        db, query, count,
+        table=None if filtered else InventoryTransaction.__table__,
+        cache_key=("transactions", store_id, product_id, type, start, end),
+    )
+
+    query = query.options(
+        joinedload(InventoryTransaction.product),
+        joinedload(InventoryTransaction.store),
+        joinedload(InventoryTransaction.user)
+    )
+
+    query = query.order_by(
+        InventoryTransaction.created_at.desc(), InventoryTransaction.id.desc()
+    )
+
     # Paging
-    query = query.offset((page - 1) * limit).limit(limit)
+    if cursor:
+        before_created_at, before_id = _decode_transaction_cursor(cursor)
+        # (created_at, id) < (c, i)를 풀어 쓴 형태: created_at <= c 가 인덱스 범위 조건이 됨
+        query = query.where(
+            InventoryTransaction.created_at <= before_created_at,
+            or_(
+                InventoryTransaction.created_at < before_created_at,
+                InventoryTransaction.id < before_id,
+            ),
+        )
+    else:
+        query = query.offset((page - 1) * limit)
+
+    query = query.limit(limit)
     result = await db.execute(query)
     items = result.scalars().all()
     
     return items, total
 
-async def _get_or_create_stock(db: AsyncSession, product_id: UUID, store_id: UUID) -> CurrentStock:
-    stmt = select(CurrentStock).options(
-        joinedload(CurrentStock.product)
-    ).where(
-        CurrentStock.product_id == product_id,
-        CurrentStock.store_id == store_id
+StockKey = Tuple[UUID, UUID]  # (product_id, store_id)
+
+
+class StockMutation:
+    """
+    일괄 적용할 재고 변동 1건
+
+    quantity는 부호가 있는 변동량입니다 (입고 +, 출고 -, 조정 +/-).
+    """
+    def __init__(
+        self,
+        product_id: UUID,
+        store_id: UUID,
+        type: TransactionType,
+        quantity: int,
+        reason: Optional[str] = None,
+        note: Optional[str] = None,
+        local_id: Optional[UUID] = None,
+        created_at: Optional[datetime] = None,
+        synced_at: Optional[datetime] = None,
+        user_id: Optional[UUID] = None,
+    ):
+        self.product_id = product_id
+        self.store_id = store_id
+        self.type = type
+        self.quantity = quantity
+        self.reason = reason
+        self.note = note
+        self.local_id = local_id
+        self.created_at = created_at
+        self.synced_at = synced_at
+        self.user_id = user_id
+
+    @property
+    def key(self) -> StockKey:
+        return (self.product_id, self.store_id)
+
+
+class MutationResult:
+    """StockMutation 1건의 적용 결과 (성공 시 transaction_id, 실패 시 error)"""
+    def __init__(
+        self,
+        mutation: StockMutation,
+        transaction_id: Optional[UUID] = None,
+        new_stock: Optional[int] = None,
+        safety_alert: bool = False,
+        error: Optional[str] = None,
+        not_found: bool = False,
+    ):
+        self.mutation = mutation
+        self.transaction_id = transaction_id
+        self.new_stock = new_stock
+        self.safety_alert = safety_alert
+        self.error = error
+        self.not_found = not_found
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def raise_for_error(self) -> None:
+        """실패한 결과를 API 예외로 변환 (제품/매장 없음 → 404, 재고 부족 → 400)"""
+        if self.ok:
+            return
+        if self.not_found:
+            raise NotFoundException(self.error)
+        raise InsufficientStockException(self.error)
+
+
+def _insufficient_message(mutation: StockMutation, current: int) -> str:
+    if mutation.type == TransactionType.OUTBOUND:
+        return f"Not enough stock. Current: {current}, Requested: {-mutation.quantity}"
+    return "Cannot reduce stock below 0"
+
+
+def insert_for(db: AsyncSession):
+    """현재 바인드의 방언에 맞는 INSERT 생성자 (ON CONFLICT 지원)"""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+async def apply_stock_deltas(
+    db: AsyncSession,
+    deltas: Dict[StockKey, int],
+    existing_keys: Sequence[StockKey],
+    safety_stocks: Dict[UUID, int],
+) -> None:
+    """
+    (제품, 매장)별 순변동량을 current_stocks에 반영
+
+    기존 행은 `quantity = quantity + :delta` executemany 한 번,
+    신규 행은 INSERT ... ON CONFLICT DO UPDATE 한 번으로 처리합니다.
+    status도 같은 문장에서 변경 후 수량 기준으로 갱신합니다.
+
+    Args:
+        safety_stocks: 제품별 안전재고 (신규 행의 status 계산용)
+    """
+    table = CurrentStock.__table__
+    now = datetime.utcnow()
+    existing = set(existing_keys)
+
+    updates = [
+        {"b_product_id": p_id, "b_store_id": s_id, "b_delta": delta, "b_now": now}
+        for (p_id, s_id), delta in sorted(deltas.items())
+        if (p_id, s_id) in existing and delta != 0
+    ]
+    inserts = [
+        {
+            "product_id": p_id, "store_id": s_id, "quantity": delta, "updated_at": now,
+            "status": get_stock_status(delta, safety_stocks.get(p_id, 0)),
+        }
+        for (p_id, s_id), delta in sorted(deltas.items())
+        if (p_id, s_id) not in existing
+    ]
+
+    if updates:
+        stmt = (
+            update(table)
+            .where(
+                table.c.product_id == bindparam("b_product_id"),
+                table.c.store_id == bindparam("b_store_id"),
+            )
+            .values(
+                quantity=table.c.quantity + bindparam("b_delta"),
+                status=stock_status_case(
+                    table.c.quantity + bindparam("b_delta"), _safety_stock_of(table)
+                ),
+                updated_at=bindparam("b_now"),
+            )
+        )
+        await db.execute(stmt, updates)
+
+    if inserts:
+        # 동시 요청이 같은 행을 먼저 만들었더라도 덮어쓰지 않고 합산
+        stmt = insert_for(db)(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.product_id, table.c.store_id],
+            set_={
+                "quantity": table.c.quantity + stmt.excluded.quantity,
+                "status": stock_status_case(
+                    table.c.quantity + stmt.excluded.quantity, _safety_stock_of(table)
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt, inserts)
+
+
+async def apply_mutation_batch(
+    db: AsyncSession,
+    mutations: Sequence[StockMutation],
+    user: Optional[User] = None,
+) -> List[MutationResult]:
+    """
+    재고 변동 일괄 적용 (Set-based)
+
+    건별 SELECT → 처리 → COMMIT 대신 배치 전체를 몇 개의 문장으로 처리합니다.
+        1. 제품/매장 존재 여부 확인 (IN 쿼리 2회)
+        2. 배치가 건드리는 (제품, 매장) 행만 키 순서로 잠금 조회 (SELECT ... FOR UPDATE)
+        3. 입력 순서대로 메모리에서 재고를 계산하여 건별 성공/실패 판정
+        4. 트랜잭션 행 multi-row INSERT, 재고 순변동량 일괄 반영
+
+    커밋은 호출자가 수행합니다. 결과는 입력 순서와 동일합니다.
+    """
+    if not mutations:
+        return []
+
+    product_ids = {m.product_id for m in mutations}
+    store_ids = {m.store_id for m in mutations}
+
+    product_rows = await db.execute(
+        select(Product.id, Product.safety_stock).where(Product.id.in_(product_ids))
     )
-    result = await db.execute(stmt)
-    stock = result.scalar_one_or_none()
-    
-    if not stock:
-        stock = CurrentStock(product_id=product_id, store_id=store_id, quantity=0)
-        db.add(stock)
-        
-    return stock
+    safety_by_product = {row.id: row.safety_stock for row in product_rows}
+
+    store_rows = await db.execute(select(Store.id).where(Store.id.in_(store_ids)))
+    known_stores = set(store_rows.scalars().all())
+
+    # 배치가 건드리는 (제품, 매장) 행만, 항상 같은 순서로 잠금 (동시 배치 간 교착 방지)
+    keys = sorted({m.key for m in mutations})
+    stock_rows = await db.execute(
+        select(CurrentStock.product_id, CurrentStock.store_id, CurrentStock.quantity)
+        .where(tuple_(CurrentStock.product_id, CurrentStock.store_id).in_(keys))
+        .order_by(CurrentStock.product_id, CurrentStock.store_id)
+        .with_for_update()
+    )
+    running: Dict[StockKey, int] = {
+        (row.product_id, row.store_id): row.quantity for row in stock_rows
+    }
+    existing_keys = list(running.keys())
+    initial = dict(running)
+
+    results: List[MutationResult] = []
+    deltas: Dict[StockKey, int] = {}
+    tx_rows = []
+    now = datetime.utcnow()
+
+    for m in mutations:
+        if m.product_id not in safety_by_product:
+            results.append(MutationResult(m, error=f"Product {m.product_id} not found", not_found=True))
+            continue
+        if m.store_id not in known_stores:
+            results.append(MutationResult(m, error=f"Store {m.store_id} not found", not_found=True))
+            continue
+
+        current = running.get(m.key, 0)
+        new_quantity = current + m.quantity
+        if new_quantity < 0:
+            results.append(MutationResult(m, error=_insufficient_message(m, current)))
+            continue
+
+        running[m.key] = new_quantity
+        deltas[m.key] = deltas.get(m.key, 0) + m.quantity
+
+        tx_id = uuid4()
+        tx_rows.append({
+            "id": tx_id,
+            "product_id": m.product_id,
+            "store_id": m.store_id,
+            "user_id": m.user_id or (user.id if user else None),  # TODO: 인증 구현 후 필수로 변경
+            "type": m.type,
+            "quantity": m.quantity,
+            "reason": m.reason,
+            "note": m.note,
+            "local_id": m.local_id,
+            "created_at": m.created_at or now,
+            "synced_at": m.synced_at,
+        })
+        results.append(MutationResult(
+            m,
+            transaction_id=tx_id,
+            new_stock=new_quantity,
+            safety_alert=new_quantity < safety_by_product[m.product_id],
+        ))
+
+    if tx_rows:
+        await db.execute(insert(InventoryTransaction.__table__), tx_rows)
+        await apply_stock_deltas(db, deltas, existing_keys, safety_by_product)
+
+        # 배치 전에는 충분했는데 배치 후 안전재고 미만이 된 재고만 알림 대상
+        for (p_id, s_id) in deltas:
+            safety_stock = safety_by_product[p_id]
+            before, after = initial.get((p_id, s_id), 0), running[(p_id, s_id)]
+            if before >= safety_stock > after:
+                record_low_stock(db, p_id, s_id, after, safety_stock)
+
+    return results
+
+def _safety_stock_of(table):
+    """RETURNING 절에서 함께 돌려받을 제품 안전재고 (상관 서브쿼리)"""
+    return (
+        select(Product.safety_stock)
+        .where(Product.id == table.c.product_id)
+        .scalar_subquery()
+    )
+
+
+async def apply_stock_delta(
+    db: AsyncSession,
+    product_id: UUID,
+    store_id: UUID,
+    delta: int,
+) -> Optional[Tuple[int, int]]:
+    """
+    단일 (제품, 매장) 재고를 DB에서 원자적으로 변경
+
+    Python에서 읽고-고치고-쓰는 대신 한 문장으로 처리하여 동시 요청 간 Lost Update를 막습니다.
+        - 감소: UPDATE ... SET quantity = quantity + :delta
+                WHERE ... AND quantity + :delta >= 0 RETURNING quantity
+        - 증가: INSERT ... ON CONFLICT DO UPDATE (첫 입고 시 행 생성)
+    status(재고 상태)도 같은 문장에서 변경 후 수량 기준으로 갱신합니다.
+    안전재고 미만으로 새로 내려가면 커밋 후 알림 대기열에 들어갑니다 (app.services.alerts).
+
+    Returns:
+        (변경 후 수량, 안전재고). 재고가 부족하면 None (아무것도 변경하지 않음)
+    """
+    table = CurrentStock.__table__
+    now = datetime.utcnow()
+
+    if delta < 0:
+        stmt = (
+            update(table)
+            .where(
+                table.c.product_id == product_id,
+                table.c.store_id == store_id,
+                table.c.quantity + delta >= 0,
+            )
+            .values(
+                quantity=table.c.quantity + delta,
+                status=stock_status_case(table.c.quantity + delta, _safety_stock_of(table)),
+                updated_at=now,
+            )
+            .returning(table.c.quantity, _safety_stock_of(table))
+        )
+    else:
+        safety_stock = (
+            select(Product.safety_stock).where(Product.id == product_id).scalar_subquery()
+        )
+        insert_stmt = insert_for(db)(table).values(
+            product_id=product_id, store_id=store_id, quantity=delta, updated_at=now,
+            status=stock_status_case(literal(delta), safety_stock),
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[table.c.product_id, table.c.store_id],
+            set_={
+                "quantity": table.c.quantity + insert_stmt.excluded.quantity,
+                "status": stock_status_case(
+                    table.c.quantity + insert_stmt.excluded.quantity, _safety_stock_of(table)
+                ),
+                "updated_at": insert_stmt.excluded.updated_at,
+            },
+        ).returning(table.c.quantity, _safety_stock_of(table))
+
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+    quantity, safety_stock = row[0], row[1] or 0
+    if quantity - delta >= safety_stock > quantity:
+        record_low_stock(db, product_id, store_id, quantity, safety_stock)
+    return quantity, safety_stock
+
+
+async def _current_quantity(db: AsyncSession, product_id: UUID, store_id: UUID) -> int:
+    """재고 부족 에러 메시지용 현재고 조회 (행이 없으면 0)"""
+    quantity = await db.scalar(
+        select(CurrentStock.quantity).where(
+            CurrentStock.product_id == product_id,
+            CurrentStock.store_id == store_id,
+        )
+    )
+    return quantity or 0
+
 
 async def process_inbound(
     db: AsyncSession, 
     data: InboundTransactionCreate, 
     user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
 ) -> Tuple[InventoryTransaction, int, bool]:
-    stock = await _get_or_create_stock(db, UUID(data.product_id), UUID(data.store_id))
-    
+    new_quantity, _ = await apply_stock_delta(
+        db, data.product_id, data.store_id, data.quantity
+    )
+
     tx = InventoryTransaction(
-        product_id=UUID(data.product_id),
-        store_id=UUID(data.store_id),
+        id=uuid4(),
+        product_id=data.product_id,
+        store_id=data.store_id,
         user_id=user.id if user else None,  # TODO: 인증 구현 후 필수로 변경
         type=TransactionType.INBOUND,
         quantity=data.quantity,
-        note=data.note
+        note=data.note,
+        created_at=datetime.utcnow(),
     )
     db.add(tx)
-    
-    stock.quantity += data.quantity
-    
+
     await db.commit()
-    await db.refresh(tx)
-    
-    return tx, stock.quantity, False
+
+    return tx, new_quantity, False
 
 async def process_outbound(
     db: AsyncSession, 
     data: OutboundTransactionCreate, 
     user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
 ) -> Tuple[InventoryTransaction, int, bool]:
-    p_id = UUID(data.product_id)
-    s_id = UUID(data.store_id)
-    stock = await _get_or_create_stock(db, p_id, s_id)
-    
-    if stock.quantity < data.quantity:
+    applied = await apply_stock_delta(
+        db, data.product_id, data.store_id, -data.quantity
+    )
+    if applied is None:
+        current = await _current_quantity(db, data.product_id, data.store_id)
         raise InsufficientStockException(
-            detail=f"Not enough stock. Current: {stock.quantity}, Requested: {data.quantity}"
+            detail=f"Not enough stock. Current: {current}, Requested: {data.quantity}"
         )
-        
+    new_quantity, safety_stock = applied
+
     tx = InventoryTransaction(
-        product_id=p_id,
-        store_id=s_id,
+        id=uuid4(),
+        product_id=data.product_id,
+        store_id=data.store_id,
         user_id=user.id if user else None,  # TODO: 인증 구현 후 필수로 변경
         type=TransactionType.OUTBOUND,
         quantity=-data.quantity,
-        note=data.note
+        note=data.note,
+        created_at=datetime.utcnow(),
     )
     db.add(tx)
-    
-    stock.quantity -= data.quantity
-    
+
     await db.commit()
-    await db.refresh(tx)
-    
-    if stock.product:
-        safety = stock.product.safety_stock
-    else:
-        prod = await db.get(Product, p_id)
-        safety = prod.safety_stock if prod else 0
-            
-    safety_alert = stock.quantity < safety
-    
-    return tx, stock.quantity, safety_alert
+
+    return tx, new_quantity, new_quantity < safety_stock
 
 async def process_adjust(
     db: AsyncSession, 
     data: AdjustTransactionCreate, 
     user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
 ) -> Tuple[InventoryTransaction, int, bool]:
-    p_id = UUID(data.product_id)
-    s_id = UUID(data.store_id)
-    stock = await _get_or_create_stock(db, p_id, s_id)
-    
-    if data.quantity < 0 and stock.quantity < abs(data.quantity):
-         raise InsufficientStockException("Cannot reduce stock below 0")
-         
+    applied = await apply_stock_delta(
+        db, data.product_id, data.store_id, data.quantity
+    )
+    if applied is None:
+        raise InsufficientStockException("Cannot reduce stock below 0")
+    new_quantity, _ = applied
+
     tx = InventoryTransaction(
-        product_id=p_id,
-        store_id=s_id,
+        id=uuid4(),
+        product_id=data.product_id,
+        store_id=data.store_id,
         user_id=user.id if user else None,  # TODO: 인증 구현 후 필수로 변경
         type=TransactionType.ADJUST,
         quantity=data.quantity,
         reason=data.reason,
-        note=data.note
+        note=data.note,
+        created_at=datetime.utcnow(),
     )
     db.add(tx)
-    
-    stock.quantity += data.quantity
-    
+
     await db.commit()
-    await db.refresh(tx)
-    
-    return tx, stock.quantity, False
+
+    return tx, new_quantity, False
@@ -1,14 +1,75 @@
-from typing import Optional, List, Tuple, Sequence
+from typing import Iterable, Optional, List, Tuple, Sequence
 from uuid import UUID
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, event, inspect, case, func, or_
+from sqlalchemy.orm import Session, selectinload, joinedload, object_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
 from app.models.product import Product
 from app.models.category import Category
-from app.schemas.product import ProductCreate
+from app.schemas.product import ProductCreate, ProductResponse
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import ConflictException, NotFoundException
+from app.core.counting import CountMode, count_rows
+
+# ========== 바코드 조회 캐시 ==========
+
+barcode_cache = TTLCache(
+    maxsize=settings.BARCODE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.BARCODE_CACHE_TTL_SECONDS,
+)
+"""바코드 → 직렬화된 ProductResponse(JSON bytes) 캐시"""
+
+# 무효화가 일어날 때마다 증가. 조회 도중 무효화가 있었다면 읽은 값을 캐시에 넣지 않음
+# (DB 조회와 다른 요청의 커밋이 엇갈려 이전 값이 다시 캐시되는 것을 방지)
+_invalidation_seq = 0
+
+# 세션에서 변경된 제품 바코드 목록을 커밋 시점까지 보관하는 session.info 키
+_PENDING_KEY = "product_barcodes_changed"
+
+
+def invalidate_barcodes(barcodes: Iterable[str]) -> None:
+    """바코드 캐시 무효화 (ORM을 거치지 않고 제품을 수정한 경우 직접 호출)"""
+    global _invalidation_seq
+    _invalidation_seq += 1
+    for barcode in barcodes:
+        barcode_cache.invalidate(barcode)
+
+
+def _track_product_change(mapper, connection, target: Product) -> None:
+    """Product INSERT/UPDATE/DELETE 시 변경 전/후 바코드를 세션에 기록"""
+    session = object_session(target)
+    if session is None:
+        return
+    history = inspect(target).attrs.barcode.history
+    barcodes = {target.barcode, *history.deleted}
+    session.info.setdefault(_PENDING_KEY, set()).update(b for b in barcodes if b)
+    # 커밋 전에도 즉시 제거 (같은 프로세스의 다른 요청이 이전 값을 받지 않도록)
+    invalidate_barcodes(barcodes)
+
+
+def _invalidate_on_commit(session: Session) -> None:
+    # 커밋 전 엇갈린 조회가 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한 번 더 제거
+    barcodes = session.info.pop(_PENDING_KEY, None)
+    if barcodes:
+        invalidate_barcodes(barcodes)
+
+
+def _invalidate_on_rollback(session: Session, previous_transaction) -> None:
+    # 같은 세션 안에서 커밋 전 값이 캐시되었을 수 있으므로 롤백 시에도 제거
+    _invalidate_on_commit(session)
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Product, _event, _track_product_change)
+event.listen(Session, "after_commit", _invalidate_on_commit)
+event.listen(Session, "after_soft_rollback", _invalidate_on_rollback)
+
+
+def _serialize(product: Product) -> bytes:
+    return ProductResponse.model_validate(product).model_dump_json(by_alias=True).encode()
+
 
 async def get_product_by_barcode(db: AsyncSession, barcode: str) -> Optional[Product]:
     """
@@ -18,48 +79,152 @@ async def get_product_by_barcode(db: AsyncSession, barcode: str) -> Optional[Pro
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
+
+async def get_product_payload_by_barcode(db: AsyncSession, barcode: str) -> Optional[bytes]:
+    """
+    바코드로 제품 조회 (캐시 사용, 스캐너 핫패스)
+
+    캐시 히트 시 DB 조회와 직렬화 없이 ProductResponse JSON bytes를 그대로 반환합니다.
+    제품이 없으면 None (없는 바코드는 캐시하지 않음)
+    """
+    payload = barcode_cache.get(barcode)
+    if payload is not None:
+        return payload
+
+    seq = _invalidation_seq
+    product = await get_product_by_barcode(db, barcode)
+    if product is None:
+        return None
+
+    payload = _serialize(product)
+    if seq == _invalidation_seq:
+        barcode_cache.set(barcode, payload)
+    return payload
+
+
+async def get_product_payloads_by_barcodes(
+    db: AsyncSession, barcodes: Sequence[str]
+) -> Tuple[List[bytes], List[str]]:
+    """
+    바코드 일괄 조회 (캐시 사용)
+
+    캐시에 없는 바코드만 `WHERE barcode IN (...)` 한 번으로 조회합니다 (unique 인덱스 사용).
+
+    Returns:
+        (요청 순서대로의 ProductResponse JSON bytes 목록, 존재하지 않는 바코드 목록)
+        중복 바코드는 한 번만 포함됩니다.
+    """
+    unique = list(dict.fromkeys(barcodes))
+    payloads = {}
+    for barcode in unique:
+        payload = barcode_cache.get(barcode)
+        if payload is not None:
+            payloads[barcode] = payload
+
+    to_fetch = [b for b in unique if b not in payloads]
+    if to_fetch:
+        seq = _invalidation_seq
+        result = await db.execute(select(Product).where(Product.barcode.in_(to_fetch)))
+        for product in result.scalars():
+            payloads[product.barcode] = _serialize(product)
+            if seq == _invalidation_seq:
+                barcode_cache.set(product.barcode, payloads[product.barcode])
+
+    found = [payloads[b] for b in unique if b in payloads]
+    missing = [b for b in unique if b not in payloads]
+    return found, missing
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자(%, _) 이스케이프 (ESCAPE '/')
+
+    패턴을 바인드 파라미터 하나로 완성해서 넘겨야 PostgreSQL 플래너가
+    접두어 패턴('q%')을 인덱스 범위 조건으로 바꿀 수 있음
+    """
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _use_trigram_search(db: AsyncSession) -> bool:
+    """pg_trgm 검색 사용 여부 (PostgreSQL + PRODUCT_SEARCH_MODE="trigram")"""
+    return (
+        settings.PRODUCT_SEARCH_MODE == "trigram"
+        and db.get_bind().dialect.name == "postgresql"
+    )
+
+
+def _search_predicate(search: str, trigram: bool):
+    """
+    제품 검색 조건
+
+    - 이름: 부분 일치 (ILIKE '%q%'). trigram 모드에서는 유사도 연산자(%)로
+      오타/띄어쓰기 차이도 허용 - 둘 다 idx_products_name_trgm(GIN)을 사용
+    - 바코드: 부분 일치 (ILIKE '%q%') - idx_products_barcode_trgm(GIN) 사용.
+      숫자 검색어는 접두어 일치(LIKE 'q%')도 함께 걸어 idx_products_barcode_prefix를 사용
+      (trigram 인덱스는 3자 미만 검색어에 쓰이지 않으므로 짧은 숫자 접두어도 인덱스로 찾음)
+    """
+    escaped = _escape_like(search)
+    conditions = [Product.name.ilike(f"%{escaped}%", escape="/")]
+    if trigram:
+        conditions.append(Product.name.op("%")(search))
+    if search.isdigit():
+        conditions.append(Product.barcode.like(f"{escaped}%", escape="/"))
+    conditions.append(Product.barcode.ilike(f"%{escaped}%", escape="/"))
+    return or_(*conditions)
+
+
+def _search_rank(search: str, trigram: bool):
+    """
+    검색 결과 정렬 키 (작을수록 먼저)
+
+    바코드 접두어 일치 → (trigram) 이름 유사도 높은 순 / (like) 이름 접두어 일치 순
+    """
+    escaped = _escape_like(search)
+    barcode_hit = Product.barcode.like(f"{escaped}%", escape="/")
+    if trigram:
+        return case((barcode_hit, -1.0), else_=-func.similarity(Product.name, search))
+    return case(
+        (barcode_hit, 0),
+        (Product.name.ilike(f"{escaped}%", escape="/"), 1),
+        else_=2,
+    )
+
+
 async def list_products(
     db: AsyncSession,
     page: int = 1,
     limit: int = 10,
     search: Optional[str] = None,
-    category_id: Optional[UUID] = None
-) -> Tuple[Sequence[Product], int]:
+    category_id: Optional[UUID] = None,
+    count: CountMode = "exact"
+) -> Tuple[Sequence[Product], Optional[int]]:
     """
     제품 목록 조회 (페이지네이션, 검색, 필터)
-    Returns: (items, total_count)
+    Returns: (items, total_count) - count="none"이면 total_count는 None
     """
     # 기본 쿼리
-    query = select(Product).options(joinedload(Product.category))
+    query = select(Product)
 
     # 필터링
     if category_id:
         query = query.where(Product.category_id == category_id)
     
+    trigram = False
     if search:
-        # 이름 또는 바코드 검색 (대소문자 무시)
-        query = query.where(
-            (Product.name.ilike(f"%{search}%")) | 
-            (Product.barcode.ilike(f"%{search}%"))
-        )
+        # 이름 또는 바코드 검색 (count/목록 쿼리가 같은 조건을 공유)
+        trigram = _use_trigram_search(db)
+        query = query.where(_search_predicate(search, trigram))
     
-    # 정렬 (최신순)
-    query = query.order_by(Product.created_at.desc())
+    # 전체 개수 계산 (별도 쿼리, subquery 없이 필터만 적용한 count)
+    total = await count_rows(
+        db, query, count,
+        table=None if (category_id or search) else Product.__table__,
+        cache_key=("products", search, category_id),
+    )
 
-    # 전체 개수 계산 (별도 쿼리)
-    # count_query = select(func.count()).select_from(query.subquery()) # subquery 방식
-    # 더 효율적인 방식:
-    count_stmt = select(func.count(Product.id))
-    if category_id:
-        count_stmt = count_stmt.where(Product.category_id == category_id)
+    # 정렬 (검색 시 관련도순, 그 외 최신순)
+    query = query.options(joinedload(Product.category))
     if search:
-        count_stmt = count_stmt.where(
-            (Product.name.ilike(f"%{search}%")) | 
-            (Product.barcode.ilike(f"%{search}%"))
-        )
-    
-    total_result = await db.execute(count_stmt)
-    total = total_result.scalar_one()
+        query = query.order_by(_search_rank(search, trigram))
+    query = query.order_by(Product.created_at.desc(), Product.id)
 
     # 페이지네이션
     offset = (page - 1) * limit
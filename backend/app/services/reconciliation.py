@@ -0,0 +1,280 @@
+"""
+재고 대사 (Ledger vs Cache Reconciliation)
+
+current_stocks.quantity는 원장(inventory_transactions) 합계의 캐시입니다.
+이 모듈은 두 값이 여전히 같은지 확인하고, 필요하면 캐시를 원장에 맞춰 보정합니다.
+
+    기대 수량 = 기준 스냅샷 수량 + SUM(basis_at 이후 원장)      (증분, 기본)
+              = SUM(전체 원장)                                  (full 모드)
+
+- 기준은 가장 최근 재고 스냅샷입니다(app.services.snapshot). 따라서 스냅샷 이후 원장만 읽습니다
+- current_stocks를 (product_id, store_id) 키 순서로 chunk_size개씩 처리합니다.
+  캐시 수량과 기대 수량은 한 SELECT 문으로 함께 읽으므로, 동시에 커밋되는 재고 변경이
+  불일치로 잘못 잡히지 않습니다
+- 청크마다 체크포인트(reconciliation_runs)를 커밋하므로 중단되어도 이어서 처리합니다
+- 보정은 apply_stock_delta(기대 - 캐시)로 합니다. 차이값은 이후 정상적인 재고 변경에
+  영향을 받지 않으므로 읽은 뒤 보정 사이에 다른 요청이 끼어들어도 안전합니다
+
+원장 보관(scripts/archive_transactions.py)과의 관계:
+    분리된 파티션의 원장은 합계에서 빠지므로, 보관 기록(archived_partitions)이 있으면
+    full 모드는 모든 재고를 불일치로 잘못 보고(--repair 시 잘못 보정)하게 됩니다.
+    따라서 보관 기록이 있으면 full 모드를 거부하고, 스냅샷 기준 대사도 기준 스냅샷이
+    보관 구간 끝 이후일 때만 실행합니다 (LedgerArchivedError).
+"""
+import asyncio
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, exists, func, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.partitions import archived_until
+from app.models.reconciliation import ReconciliationRun
+from app.models.stock import CurrentStock
+from app.models.stock_snapshot import StockSnapshot
+from app.models.transaction import InventoryTransaction
+from app.services import inventory as inventory_service
+from app.services.snapshot import latest_snapshot_at
+
+logger = get_logger(__name__)
+
+# 결과로 돌려줄 불일치 샘플 최대 개수 (건수는 전체를 셈)
+DRIFT_SAMPLE_LIMIT = 100
+
+
+class LedgerArchivedError(ValueError):
+    """기준 시점 이전 원장 일부가 보관(분리)되어 기대 수량을 계산할 수 없음"""
+    def __init__(self, archived: date, basis_at: Optional[datetime]):
+        self.archived = archived
+        self.basis_at = basis_at
+        basis = basis_at.isoformat() if basis_at else "full ledger"
+        super().__init__(
+            f"Ledger before {archived.isoformat()} is archived; "
+            f"reconciliation basis ({basis}) must be a stock snapshot at or after that date"
+        )
+
+
+def _ensure_ledger_covers(archived: Optional[date], basis_at: Optional[datetime]) -> None:
+    """basis_at 이후 원장이 모두 남아 있는지 확인 (보관 구간과 겹치면 LedgerArchivedError)"""
+    if archived is not None and (basis_at is None or basis_at < datetime.combine(archived, datetime.min.time())):
+        raise LedgerArchivedError(archived, basis_at)
+
+
+class StockDrift:
+    """캐시와 원장이 다른 재고 1건"""
+    def __init__(self, product_id: UUID, store_id: UUID, cached: Optional[int], expected: int):
+        self.product_id = product_id
+        self.store_id = store_id
+        self.cached = cached  # None: current_stocks 행 없음
+        self.expected = expected
+
+    @property
+    def difference(self) -> int:
+        return self.expected - (self.cached or 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "productId": str(self.product_id),
+            "storeId": str(self.store_id),
+            "cached": self.cached,
+            "expected": self.expected,
+        }
+
+
+def _ledger_sources(basis_at: Optional[datetime], keys=None):
+    """
+    (product_id, store_id, quantity) 원천: basis 스냅샷 행 + 그 이후 원장 (basis 없으면 전체 원장)
+
+    keys(product_id, store_id 컬럼을 가진 서브쿼리)를 주면 해당 키로 제한합니다.
+    """
+    tx = InventoryTransaction
+    ledger = select(tx.product_id, tx.store_id, tx.quantity)
+    snapshot = select(StockSnapshot.product_id, StockSnapshot.store_id, StockSnapshot.quantity)
+    if keys is not None:
+        ledger = ledger.join(keys, and_(keys.c.product_id == tx.product_id, keys.c.store_id == tx.store_id))
+        snapshot = snapshot.join(keys, and_(
+            keys.c.product_id == StockSnapshot.product_id, keys.c.store_id == StockSnapshot.store_id
+        ))
+    if basis_at is None:
+        return [ledger]
+    return [
+        ledger.where(tx.created_at >= basis_at),
+        snapshot.where(StockSnapshot.taken_at == basis_at),
+    ]
+
+
+async def _check_chunk(
+    db: AsyncSession,
+    basis_at: Optional[datetime],
+    after: Optional[Tuple[UUID, UUID]],
+    chunk_size: int,
+) -> List[Tuple[UUID, UUID, int, int]]:
+    """키 순서로 다음 chunk_size개 재고의 (제품, 매장, 캐시 수량, 기대 수량)"""
+    cs = CurrentStock
+    chunk = select(cs.product_id, cs.store_id, cs.quantity)
+    if after is not None:
+        chunk = chunk.where(tuple_(cs.product_id, cs.store_id) > tuple_(*after))
+    chunk = chunk.order_by(cs.product_id, cs.store_id).limit(chunk_size).subquery()
+
+    sources = union_all(*_ledger_sources(basis_at, chunk)).subquery()
+    totals = (
+        select(sources.c.product_id, sources.c.store_id, func.sum(sources.c.quantity).label("quantity"))
+        .group_by(sources.c.product_id, sources.c.store_id)
+        .subquery()
+    )
+
+    rows = await db.execute(
+        select(
+            chunk.c.product_id,
+            chunk.c.store_id,
+            chunk.c.quantity,
+            func.coalesce(totals.c.quantity, 0),
+        )
+        .outerjoin(
+            totals,
+            and_(totals.c.product_id == chunk.c.product_id, totals.c.store_id == chunk.c.store_id),
+        )
+        .order_by(chunk.c.product_id, chunk.c.store_id)
+    )
+    return [tuple(row) for row in rows]
+
+
+async def _find_missing_stocks(db: AsyncSession, basis_at: Optional[datetime]):
+    """원장 합계는 0이 아닌데 current_stocks 행이 없는 (제품, 매장)"""
+    sources = union_all(*_ledger_sources(basis_at)).subquery()
+    stmt = (
+        select(sources.c.product_id, sources.c.store_id, func.sum(sources.c.quantity))
+        .where(~exists().where(
+            CurrentStock.product_id == sources.c.product_id,
+            CurrentStock.store_id == sources.c.store_id,
+        ))
+        .group_by(sources.c.product_id, sources.c.store_id)
+        .having(func.sum(sources.c.quantity) != 0)
+    )
+    result = await db.stream(stmt.execution_options(yield_per=settings.STOCK_RECONCILE_CHUNK_SIZE))
+    async for rows in result.partitions():
+        for product_id, store_id, expected in rows:
+            yield StockDrift(product_id, store_id, None, expected)
+
+
+async def _start_run(db: AsyncSession, repair: bool, full: bool) -> ReconciliationRun:
+    """같은 모드의 중단된 실행이 있으면 이어서, 없으면 새 실행 (기준: 최신 스냅샷)"""
+    archived = await archived_until(db)
+    unfinished = await db.scalar(
+        select(ReconciliationRun)
+        .where(
+            ReconciliationRun.finished_at.is_(None),
+            ReconciliationRun.repair == repair,
+            ReconciliationRun.basis_at.is_(None) if full else ReconciliationRun.basis_at.is_not(None),
+        )
+        .order_by(ReconciliationRun.started_at.desc())
+        .limit(1)
+    )
+    if unfinished is not None:
+        _ensure_ledger_covers(archived, unfinished.basis_at)
+        logger.info("Resuming stock reconciliation", run_id=str(unfinished.id))
+        return unfinished
+
+    basis_at = None if full else await latest_snapshot_at(db)
+    _ensure_ledger_covers(archived, basis_at)
+    run = ReconciliationRun(
+        basis_at=basis_at,
+        repair=repair,
+        checked_count=0,
+        drift_count=0,
+        repaired_count=0,
+        started_at=datetime.utcnow(),
+    )
+    db.add(run)
+    await db.commit()
+    return run
+
+
+async def _record(db: AsyncSession, run: ReconciliationRun, drift: StockDrift, samples: List[StockDrift]) -> None:
+    run.drift_count += 1
+    if len(samples) < DRIFT_SAMPLE_LIMIT:
+        samples.append(drift)
+    logger.warning("Stock drift detected", run_id=str(run.id), repair=run.repair, **drift.to_dict())
+
+    if run.repair:
+        applied = await inventory_service.apply_stock_delta(
+            db, drift.product_id, drift.store_id, drift.difference
+        )
+        if applied is None:
+            # 원장 합계가 음수 등 캐시로 옮길 수 없는 경우 - 보고만 함
+            logger.error("Stock drift could not be repaired", run_id=str(run.id), **drift.to_dict())
+        else:
+            run.repaired_count += 1
+
+
+async def reconcile_stocks(
+    db: AsyncSession,
+    repair: bool = False,
+    full: bool = False,
+    chunk_size: Optional[int] = None,
+) -> Tuple[ReconciliationRun, List[StockDrift]]:
+    """
+    current_stocks와 원장 합계 대사
+
+    Args:
+        repair: True면 불일치를 원장 기준으로 보정
+        full: True면 스냅샷 없이 전체 원장 합계와 비교 (스냅샷 자체를 의심할 때)
+        chunk_size: 한 번에 확인할 재고 행 수 (기본: STOCK_RECONCILE_CHUNK_SIZE)
+
+    Returns:
+        (완료된 실행 기록, 불일치 샘플 최대 DRIFT_SAMPLE_LIMIT건)
+
+    Raises:
+        LedgerArchivedError: 기준 시점 이후 원장 일부가 보관됨 (보관 후 full 모드 등)
+    """
+    chunk_size = chunk_size or settings.STOCK_RECONCILE_CHUNK_SIZE
+    run = await _start_run(db, repair, full)
+    samples: List[StockDrift] = []
+
+    after = (run.last_product_id, run.last_store_id) if run.last_product_id else None
+    while True:
+        rows = await _check_chunk(db, run.basis_at, after, chunk_size)
+        for product_id, store_id, cached, expected in rows:
+            if cached != expected:
+                await _record(db, run, StockDrift(product_id, store_id, cached, expected), samples)
+        if rows:
+            after = rows[-1][:2]
+            run.last_product_id, run.last_store_id = after
+            run.checked_count += len(rows)
+        await db.commit()  # 체크포인트 (보정 포함)
+        if len(rows) < chunk_size:
+            break
+
+    missing = [drift async for drift in _find_missing_stocks(db, run.basis_at)]
+    for drift in missing:
+        await _record(db, run, drift, samples)
+
+    run.finished_at = datetime.utcnow()
+    await db.commit()
+    logger.info(
+        "Stock reconciliation finished",
+        run_id=str(run.id),
+        basis_at=run.basis_at.isoformat() if run.basis_at else None,
+        checked=run.checked_count,
+        drift=run.drift_count,
+        repaired=run.repaired_count,
+    )
+    return run, samples
+
+
+async def run_reconciliation(
+    session_factory: Callable[[], AsyncSession],
+    interval_hours: float,
+    repair: bool = False,
+) -> None:
+    """대사를 주기적으로 실행 (앱 수명주기 동안 백그라운드 태스크로 실행)"""
+    while True:
+        await asyncio.sleep(interval_hours * 3600)
+        try:
+            async with session_factory() as db:
+                await reconcile_stocks(db, repair=repair)
+        except Exception as e:
+            logger.warning("Stock reconciliation failed", error=str(e))
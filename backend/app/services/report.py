@@ -1,62 +1,303 @@
-from typing import List
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
-from sqlalchemy.ext.asyncio import AsyncSession
-from io import BytesIO
+import asyncio
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, List, Literal, Optional, Sequence
+from uuid import UUID
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import lazyload
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from openpyxl import Workbook
 
 from app.models.stock import CurrentStock
 from app.models.product import Product
+from app.models.store import Store
+from app.models.transaction import InventoryTransaction
+from app.services.inventory import naive_utc
 from app.schemas.admin import LowStockItemResponse
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ExportFormat = Literal["xlsx", "csv", "ndjson"]
+EXPORT_FORMAT_PATTERN = "^(xlsx|csv|ndjson)$"
+STREAM_FORMAT_PATTERN = "^(csv|ndjson)$"
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+EXPORT_MEDIA_TYPES = {
+    "xlsx": XLSX_MEDIA_TYPE,
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_FETCH_SIZE = 1000
+"""서버 사이드 커서에서 한 번에 가져오는 행 수"""
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+"""응답 본문 청크 크기 (bytes)"""
+
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+"""이 크기를 넘는 엑셀 파일은 메모리 대신 임시 파일에 기록"""
+
+LOW_STOCK_HEADERS = ["제품명", "바코드", "매장명", "현재고", "안전재고", "부족수량"]
 
 class LowStockItemDTO:
-    def __init__(self, product, store, quantity, safety_stock):
+    def __init__(self, product, store, current_stock, shortage):
         self.product = product
         self.store = store
-        self.current_stock = quantity
-        self.shortage = safety_stock - quantity
-
-async def get_low_stock_items(db: AsyncSession) -> List[LowStockItemDTO]:
-    stmt = select(CurrentStock).options(
-        joinedload(CurrentStock.product),
-        joinedload(CurrentStock.store)
-    ).join(Product).where(
-        CurrentStock.quantity < Product.safety_stock
+        self.current_stock = current_stock
+        self.shortage = shortage
+
+def _shortage():
+    """부족 수량 (안전재고 - 현재고), SQL에서 계산"""
+    return (Product.safety_stock - CurrentStock.quantity).label("shortage")
+
+def _low_stock_query(columns, store_id: Optional[UUID], category_id: Optional[UUID]) -> Select:
+    """
+    안전재고 미달 공통 쿼리 (알림 목록/내보내기 공유)
+
+    - 조건: status = 'LOW' (quantity < safety_stock, idx_current_stocks_low 부분 인덱스) + 매장/카테고리 필터
+    - 정렬: 부족 수량 큰 순 → 제품명 → 매장명 (페이지 간 순서 고정)
+    """
+    shortage = _shortage()
+    stmt = (
+        select(*columns)
+        .select_from(CurrentStock)
+        .join(Product, CurrentStock.product_id == Product.id)
+        .join(Store, CurrentStock.store_id == Store.id)
+        .where(CurrentStock.status == "LOW")
     )
-    
+    if store_id:
+        stmt = stmt.where(CurrentStock.store_id == store_id)
+    if category_id:
+        stmt = stmt.where(Product.category_id == category_id)
+    return stmt.order_by(shortage.desc(), Product.name, Store.name, CurrentStock.product_id)
+
+async def get_low_stock_items(
+    db: AsyncSession,
+    store_id: Optional[UUID] = None,
+    category_id: Optional[UUID] = None,
+    page: int = 1,
+    limit: Optional[int] = None,
+) -> List[LowStockItemDTO]:
+    """
+    안전재고 미달 목록 (부족 수량 큰 순)
+
+    부족 수량 계산/정렬/페이징을 모두 SQL에서 처리하고, 응답에 필요한
+    제품/매장/현재고/부족 수량만 한 번의 쿼리로 조회합니다.
+
+    Args:
+        limit: None이면 전체 조회
+    """
+    stmt = _low_stock_query(
+        [Product, Store, CurrentStock.quantity, _shortage()], store_id, category_id
+    ).options(
+        # 응답에 카테고리가 포함되지 않으므로 Product.category 자동 조인 생략
+        lazyload(Product.category)
+    )
+    if limit is not None:
+        stmt = stmt.offset((page - 1) * limit).limit(limit)
+
     result = await db.execute(stmt)
-    stocks = result.scalars().all()
-    
-    items = []
-    for s in stocks:
-        items.append(LowStockItemDTO(
-            product=s.product,
-            store=s.store,
-            quantity=s.quantity,
-            safety_stock=s.product.safety_stock
-        ))
-    return items
-
-def generate_low_stock_excel(items: List[LowStockItemDTO]) -> BytesIO:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Low Stock"
-    
-    # Headers
-    ws.append(["제품명", "바코드", "매장명", "현재고", "안전재고", "부족수량"])
-    
-    # Data
-    for item in items:
-        ws.append([
-            item.product.name,
-            item.product.barcode,
-            item.store.name,
-            item.current_stock,
-            item.product.safety_stock,
-            item.shortage
-        ])
-    
-    output = BytesIO()
+    return [
+        LowStockItemDTO(product=product, store=store, current_stock=quantity, shortage=shortage)
+        for product, store, quantity, shortage in result
+    ]
+
+def low_stock_rows_query(
+    store_id: Optional[UUID] = None,
+    category_id: Optional[UUID] = None,
+) -> Select:
+    """
+    내보내기용 안전재고 미달 행 쿼리 (ORM 객체 없이 컬럼만 조회)
+
+    컬럼 순서는 LOW_STOCK_HEADERS와 같고, 컬럼 이름은 CSV 헤더/NDJSON 키로 사용.
+    """
+    return _low_stock_query(
+        [
+            Product.name.label("productName"),
+            Product.barcode.label("barcode"),
+            Store.name.label("storeName"),
+            CurrentStock.quantity.label("currentStock"),
+            Product.safety_stock.label("safetyStock"),
+            _shortage(),
+        ],
+        store_id, category_id,
+    )
+
+
+def transaction_ledger_query(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    store_id: Optional[UUID] = None,
+) -> Select:
+    """
+    내보내기용 트랜잭션 원장 쿼리
+
+    - 기간: start <= created_at < end (둘 다 선택)
+    - 정렬: created_at, id 오름차순 (적재 측에서 마지막 값 이후만 받아갈 수 있도록)
+    - 매장 필터 시 idx_transactions_store_created 인덱스 사용
+    """
+    stmt = (
+        select(
+            InventoryTransaction.id.label("id"),
+            InventoryTransaction.created_at.label("createdAt"),
+            InventoryTransaction.type.label("type"),
+            InventoryTransaction.store_id.label("storeId"),
+            Store.code.label("storeCode"),
+            InventoryTransaction.product_id.label("productId"),
+            Product.barcode.label("barcode"),
+            InventoryTransaction.quantity.label("quantity"),
+            InventoryTransaction.reason.label("reason"),
+            InventoryTransaction.note.label("note"),
+            InventoryTransaction.user_id.label("userId"),
+            InventoryTransaction.local_id.label("localId"),
+            InventoryTransaction.synced_at.label("syncedAt"),
+        )
+        .join(Product, InventoryTransaction.product_id == Product.id)
+        .join(Store, InventoryTransaction.store_id == Store.id)
+    )
+    if start:
+        stmt = stmt.where(InventoryTransaction.created_at >= naive_utc(start))
+    if end:
+        stmt = stmt.where(InventoryTransaction.created_at < naive_utc(end))
+    if store_id:
+        stmt = stmt.where(InventoryTransaction.store_id == store_id)
+    return stmt.order_by(InventoryTransaction.created_at, InventoryTransaction.id)
+
+
+async def stream_row_batches(
+    db: AsyncSession, stmt: Select, batch_size: int = EXPORT_FETCH_SIZE
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    서버 사이드 커서로 결과를 batch_size 행씩 전달
+
+    전체 결과를 메모리에 올리지 않고 DB에서 batch_size 행씩 받아옵니다.
+    """
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for batch in result.partitions():
+        yield batch
+
+
+async def build_low_stock_excel(
+    db: AsyncSession,
+    store_id: Optional[UUID] = None,
+    category_id: Optional[UUID] = None,
+) -> SpooledTemporaryFile:
+    """
+    안전재고 미달 목록 엑셀 파일 생성
+
+    - openpyxl write-only 모드: 행을 셀 객체로 보관하지 않고 바로 기록 (메모리 일정)
+    - 행은 서버 사이드 커서에서 배치 단위로 받아서 기록
+    - 엑셀 기록/압축은 스레드에서 실행 (이벤트 루프를 막지 않음)
+    - 결과 파일은 EXPORT_SPOOL_MAX_SIZE를 넘으면 임시 파일로 옮겨짐
+
+    주의:
+        xlsx는 zip 파일이라 저장이 끝나야 완성되므로, 응답은 파일 생성 후 시작됩니다.
+        생성과 동시에 전송해야 하면 CSV/NDJSON 형식을 사용하세요.
+
+    Returns:
+        처음 위치로 되감긴 파일 객체 (호출자가 닫아야 함)
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Low Stock")
+    ws.append(LOW_STOCK_HEADERS)
+
+    async for batch in stream_row_batches(db, low_stock_rows_query(store_id, category_id)):
+        await asyncio.to_thread(_append_rows, ws, batch)
+
+    output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    try:
+        await asyncio.to_thread(_save_workbook, wb, output)
+    except BaseException:
+        output.close()
+        raise
+    return output
+
+
+def _append_rows(ws, rows: Sequence[Row]) -> None:
+    for row in rows:
+        ws.append(tuple(row))
+
+
+def _save_workbook(wb: Workbook, output: SpooledTemporaryFile) -> None:
     wb.save(output)
     output.seek(0)
-    return output
+
+
+async def iter_file_chunks(
+    file: SpooledTemporaryFile, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """파일을 청크 단위로 읽어 전달하고, 끝나면(또는 클라이언트가 끊으면) 파일을 닫음"""
+    try:
+        while True:
+            chunk = await asyncio.to_thread(file.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
+
+
+async def stream_export(
+    bind: AsyncEngine, stmt: Select, fmt: ExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    쿼리 결과를 CSV 또는 NDJSON으로 인코딩하며 바로 전달
+
+    - 배치(EXPORT_FETCH_SIZE 행)마다 인코딩해서 전달하므로 첫 바이트가 즉시 나가고
+      메모리 사용량은 결과 크기와 무관하게 일정
+    - StreamingResponse 본문은 요청 의존성(get_db 세션)이 정리된 뒤에 소비되므로,
+      같은 엔진에서 전송 동안만 쓰는 세션을 따로 엶
+
+    Args:
+        bind: 요청 세션의 엔진 (db.bind)
+        fmt: "csv" (첫 줄 헤더) | "ndjson" (행마다 JSON 객체 한 줄)
+    """
+    encode = _encode_csv if fmt == "csv" else _encode_ndjson
+    rows = 0
+    try:
+        async with AsyncSession(bind) as session:
+            result = await session.stream(stmt.execution_options(yield_per=EXPORT_FETCH_SIZE))
+            keys = list(result.keys())
+            if fmt == "csv":
+                yield _encode_csv(keys, [keys])
+            async for batch in result.partitions():
+                rows += len(batch)
+                yield encode(keys, batch)
+    except Exception as e:
+        # 헤더가 이미 전송된 뒤라 에러 응답을 보낼 수 없음 - 잘린 파일임을 로그로 남김
+        logger.error("Export stream aborted", format=fmt, rows=rows, error=str(e))
+        raise
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _encode_csv(keys: List[str], rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_export_value(v) for v in row])
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(keys: List[str], rows: Sequence[Sequence[Any]]) -> bytes:
+    lines = [
+        json.dumps(
+            {k: _export_value(v) for k, v in zip(keys, row)},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        for row in rows
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
@@ -0,0 +1,251 @@
+"""
+재고 스냅샷 및 과거 시점 재고 조회 (Stock Snapshots / As-of Stock)
+
+current_stocks는 원장 합계의 "현재" 캐시일 뿐이라 과거 시점 재고를 알 수 없습니다.
+STOCK_SNAPSHOT_INTERVAL_HOURS마다 모든 (제품, 매장)의 재고를 stock_snapshots에 기록하고,
+시점 T의 재고는 T에 가장 가까운 스냅샷에서 그 사이 원장만 더하거나 빼서 계산합니다.
+
+    stock(T) = snapshot(S) + SUM(S <= created_at <= T)   (S <= T, 이전 스냅샷)
+             = snapshot(S) - SUM(T <  created_at <  S)   (S >  T, 이후 스냅샷)
+
+- 조회 비용은 스냅샷 간격 절반 이내의 원장 범위에 비례합니다 (전체 이력 합산 아님)
+- 새 스냅샷은 직전 스냅샷 + 그 사이 원장으로 계산합니다 (원장 전체를 다시 읽지 않음)
+- 원장 파티션을 보관/분리해도 이후 스냅샷이 있으면 과거 시점 조회가 유지됩니다
+
+주의:
+    스냅샷 이전 시각(created_at)으로 뒤늦게 동기화된 트랜잭션은 adjust_snapshots로
+    이후 스냅샷에 반영해야 합니다 (오프라인 동기화에서 호출).
+
+동시성:
+    take_stock_snapshot은 advisory lock(트랜잭션 범위)을 배타 모드로, adjust_snapshots는 공유 모드로
+    잡습니다. 잠금이 없으면 동기화 트랜잭션이 아직 커밋 전일 때 스냅샷의 INSERT ... SELECT는 그
+    원장 행을 보지 못하고, 동기화 쪽 adjust_snapshots도 커밋 전인 새 스냅샷을 보지 못해 둘 다
+    누락됩니다. 잠금 후에는 한쪽이 커밋한 결과를 다른 쪽이 (READ COMMITTED의 새 문장 스냅샷으로)
+    보게 됩니다. 동기화끼리는 공유 잠금이라 서로 기다리지 않고, 같은 스냅샷 행 갱신은 행 잠금과
+    ON CONFLICT DO NOTHING(0 행 생성)으로 충돌 없이 누적됩니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row, and_, exists, func, insert, literal, select, text, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import lazyload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.types import GUID
+from app.models.product import Product
+from app.models.stock_snapshot import StockSnapshot
+from app.models.store import Store
+from app.models.transaction import InventoryTransaction
+from app.services.inventory import StockMutation, insert_for, naive_utc
+
+logger = get_logger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+
+# 스냅샷 생성과 뒤늦은 트랜잭션 반영을 직렬화하는 advisory lock 키
+_SNAPSHOT_LOCK_KEY = 7_240_115
+
+
+def snapshot_boundary(now: Optional[datetime] = None, interval_hours: Optional[int] = None) -> datetime:
+    """
+    가장 최근의 스냅샷 경계 시각 (정착 시간 STOCK_SNAPSHOT_SETTLE_MINUTES 반영)
+
+    예) 간격 24시간, 정착 10분: 2026-10-17 00:05 → 2026-10-16 00:00, 00:15 → 2026-10-17 00:00
+    """
+    interval = timedelta(hours=settings.STOCK_SNAPSHOT_INTERVAL_HOURS if interval_hours is None else interval_hours)
+    settled = (now or datetime.utcnow()) - timedelta(minutes=settings.STOCK_SNAPSHOT_SETTLE_MINUTES)
+    return _EPOCH + ((settled - _EPOCH) // interval) * interval
+
+
+async def latest_snapshot_at(db: AsyncSession) -> Optional[datetime]:
+    return await db.scalar(select(func.max(StockSnapshot.taken_at)))
+
+
+async def _lock_snapshots(db: AsyncSession, shared: bool = False) -> None:
+    """스냅샷 잠금 (shared=True면 공유 모드, 트랜잭션 종료 시 해제, PostgreSQL이 아니면 생략)"""
+    if db.get_bind().dialect.name == "postgresql":
+        fn = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+        await db.execute(text(f"SELECT {fn}(:key)"), {"key": _SNAPSHOT_LOCK_KEY})
+
+
+async def take_stock_snapshot(db: AsyncSession, taken_at: Optional[datetime] = None) -> int:
+    """
+    taken_at 기준 스냅샷 생성 (INSERT ... SELECT 한 문장)
+
+    직전 스냅샷 행 + [직전 스냅샷, taken_at) 원장을 (제품, 매장)별로 합산합니다.
+    직전 스냅샷이 없으면 taken_at 이전 원장 전체를 합산합니다.
+
+    진행 중인 adjust_snapshots(동기화 트랜잭션)가 커밋될 때까지 기다린 뒤 원장을 읽습니다.
+
+    Returns:
+        생성된 행 수 (이미 같은/이후 시각 스냅샷이 있으면 0)
+    """
+    taken_at = naive_utc(taken_at) if taken_at else snapshot_boundary()
+    await _lock_snapshots(db)
+    latest = await latest_snapshot_at(db)
+    if latest is not None and taken_at <= latest:
+        return 0
+
+    tx = InventoryTransaction
+    ledger = select(tx.product_id, tx.store_id, tx.quantity).where(tx.created_at < taken_at)
+    sources = [ledger]
+    if latest is not None:
+        sources = [
+            ledger.where(tx.created_at >= latest),
+            select(StockSnapshot.product_id, StockSnapshot.store_id, StockSnapshot.quantity)
+            .where(StockSnapshot.taken_at == latest),
+        ]
+    combined = union_all(*sources).subquery()
+
+    stmt = insert(StockSnapshot).from_select(
+        ["product_id", "store_id", "taken_at", "quantity"],
+        select(
+            combined.c.product_id,
+            combined.c.store_id,
+            literal(taken_at),
+            func.sum(combined.c.quantity),
+        ).group_by(combined.c.product_id, combined.c.store_id),
+    )
+    try:
+        result = await db.execute(stmt)
+        await db.commit()
+    except IntegrityError:
+        # 다른 워커가 같은 시각 스냅샷을 먼저 만든 경우
+        await db.rollback()
+        return 0
+
+    logger.info("Stock snapshot taken", taken_at=taken_at.isoformat(), rows=result.rowcount)
+    return result.rowcount
+
+
+async def adjust_snapshots(db: AsyncSession, mutations: Sequence[StockMutation]) -> int:
+    """
+    스냅샷 이전 시각으로 기록된 트랜잭션을 이후 스냅샷에 반영 (커밋은 호출자가 수행)
+
+    해당 (제품, 매장) 행이 없는 이후 스냅샷에는 0으로 행을 만든 뒤 변동량을 더합니다.
+    대부분의 동기화 항목은 최신 스냅샷 이후 시각이라 MAX 조회 1회로 끝납니다.
+    공유 스냅샷 잠금은 호출자 트랜잭션이 끝날 때까지 유지되어, 그 사이 새 스냅샷 생성은
+    이 트랜잭션의 원장 행이 커밋된 뒤에 진행됩니다 (다른 동기화와는 서로 막지 않음).
+
+    Returns:
+        반영한 트랜잭션 수
+    """
+    dated = [m for m in mutations if m.created_at is not None]
+    if not dated:
+        return 0
+    await _lock_snapshots(db, shared=True)
+    latest = await latest_snapshot_at(db)
+    if latest is None:
+        return 0
+    backdated = [m for m in dated if naive_utc(m.created_at) < latest]
+
+    for m in backdated:
+        created_at = naive_utc(m.created_at)
+        later = select(StockSnapshot.taken_at).where(StockSnapshot.taken_at > created_at).distinct().subquery()
+        same_key = and_(
+            StockSnapshot.product_id == m.product_id,
+            StockSnapshot.store_id == m.store_id,
+        )
+        await db.execute(
+            insert_for(db)(StockSnapshot).from_select(
+                ["product_id", "store_id", "taken_at", "quantity"],
+                select(
+                    literal(m.product_id, GUID()),
+                    literal(m.store_id, GUID()),
+                    later.c.taken_at,
+                    literal(0),
+                ).where(~exists().where(same_key, StockSnapshot.taken_at == later.c.taken_at)),
+            ).on_conflict_do_nothing()
+        )
+        await db.execute(
+            update(StockSnapshot)
+            .where(same_key, StockSnapshot.taken_at > created_at)
+            .values(quantity=StockSnapshot.quantity + m.quantity)
+        )
+
+    if backdated:
+        logger.info("Backdated transactions applied to snapshots", count=len(backdated))
+    return len(backdated)
+
+
+async def get_stocks_as_of(
+    db: AsyncSession,
+    at: datetime,
+    store_id: UUID,
+    product_id: Optional[UUID] = None,
+) -> Tuple[Optional[datetime], List[Row]]:
+    """
+    시점 at의 매장 재고 (created_at <= at 인 트랜잭션까지 반영)
+
+    at에 더 가까운 쪽(이전/이후) 스냅샷을 기준으로 그 사이 원장만 합산합니다.
+
+    Returns:
+        (기준 스냅샷 시각(없으면 None), [(Product, Store, quantity)] 제품명순)
+    """
+    at = naive_utc(at)
+    before = await db.scalar(select(func.max(StockSnapshot.taken_at)).where(StockSnapshot.taken_at <= at))
+    after = await db.scalar(select(func.min(StockSnapshot.taken_at)).where(StockSnapshot.taken_at > at))
+
+    tx = InventoryTransaction
+    if after is not None and (before is None or after - at < at - before):
+        basis, sign = after, -1
+        ledger_range = [tx.created_at > at, tx.created_at < after]
+    else:
+        basis, sign = before, 1
+        ledger_range = [tx.created_at <= at]
+        if before is not None:
+            ledger_range.append(tx.created_at >= before)
+
+    key_filter = [tx.store_id == store_id]
+    if product_id:
+        key_filter.append(tx.product_id == product_id)
+    sources = [
+        select(tx.product_id, tx.store_id, (tx.quantity * sign).label("quantity"))
+        .where(*ledger_range, *key_filter)
+    ]
+    if basis is not None:
+        snap_filter = [StockSnapshot.taken_at == basis, StockSnapshot.store_id == store_id]
+        if product_id:
+            snap_filter.append(StockSnapshot.product_id == product_id)
+        sources.append(
+            select(StockSnapshot.product_id, StockSnapshot.store_id, StockSnapshot.quantity)
+            .where(*snap_filter)
+        )
+    combined = union_all(*sources).subquery()
+    totals = (
+        select(
+            combined.c.product_id,
+            combined.c.store_id,
+            func.sum(combined.c.quantity).label("quantity"),
+        )
+        .group_by(combined.c.product_id, combined.c.store_id)
+        .subquery()
+    )
+
+    rows = await db.execute(
+        select(Product, Store, totals.c.quantity)
+        .join(totals, totals.c.product_id == Product.id)
+        .join(Store, Store.id == totals.c.store_id)
+        .options(lazyload(Product.category))
+        .order_by(Product.name, Product.id)
+    )
+    return basis, rows.all()
+
+
+async def run_stock_snapshots(
+    session_factory: Callable[[], AsyncSession],
+    check_interval_seconds: float = 600,
+) -> None:
+    """스냅샷 경계가 지날 때마다 스냅샷 생성 (앱 수명주기 동안 백그라운드 태스크로 실행)"""
+    while True:
+        try:
+            async with session_factory() as db:
+                await take_stock_snapshot(db)
+        except Exception as e:
+            logger.warning("Stock snapshot failed", error=str(e))
+        await asyncio.sleep(check_interval_seconds)
@@ -1,87 +1,125 @@
-from typing import List, Optional
+from typing import Dict, Optional
+from uuid import UUID
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
+from app.core.logging import get_logger
 from app.models.user import User
 from app.models.transaction import InventoryTransaction, TransactionType
-from app.schemas.sync import SyncRequest, SyncResponse, SyncedItem, FailedItem
-from app.services import inventory as inventory_service
-from app.schemas.transaction import (
-    InboundTransactionCreate, OutboundTransactionCreate, AdjustTransactionCreate
+from app.schemas.sync import (
+    SyncRequest, SyncResponse, SyncedItem, FailedItem, SyncTransactionItem
 )
+from app.services import inventory as inventory_service
+from app.services import snapshot as snapshot_service
+from app.services.inventory import StockMutation
+
+logger = get_logger(__name__)
+
+
+def _to_mutation(tx_item: SyncTransactionItem, synced_at: datetime) -> StockMutation:
+    """동기화 항목 검증 후 StockMutation으로 변환 (검증 실패 시 ValueError)"""
+    if tx_item.type in (TransactionType.INBOUND, TransactionType.OUTBOUND):
+        if tx_item.quantity <= 0:
+            raise ValueError(f"Quantity must be positive for {tx_item.type.value}")
+        delta = tx_item.quantity if tx_item.type == TransactionType.INBOUND else -tx_item.quantity
+    elif tx_item.type == TransactionType.ADJUST:
+        if not tx_item.reason:
+            raise ValueError("Reason is required for ADJUST")
+        delta = tx_item.quantity
+    else:
+        raise ValueError("Unknown transaction type")
+
+    return StockMutation(
+        product_id=tx_item.product_id,
+        store_id=tx_item.store_id,
+        type=tx_item.type,
+        quantity=delta,
+        reason=tx_item.reason,
+        note=tx_item.note,
+        local_id=tx_item.local_id,
+        created_at=tx_item.created_at,
+        synced_at=synced_at,
+    )
+
 
 async def sync_transactions(
-    db: AsyncSession, 
-    request: SyncRequest, 
-    user: Optional[User] = None  # TODO: 인증 구현 후 필수로 변경
+    db: AsyncSession,
+    request: SyncRequest,
+    user: Optional[User] = None,  # TODO: 인증 구현 후 필수로 변경
+    commit: bool = True,
 ) -> SyncResponse:
-    
-    synced_items = []
-    failed_items = []
-    
-    for tx_item in request.transactions:
-        # 1. 중복 체크 (local_id)
-        stmt = select(InventoryTransaction).where(InventoryTransaction.local_id == tx_item.local_id)
-        result = await db.execute(stmt)
-        existing_tx = result.scalar_one_or_none()
-        
-        if existing_tx:
-            synced_items.append(SyncedItem(localId=tx_item.local_id, serverId=existing_tx.id))
+    """
+    오프라인 트랜잭션 일괄 동기화 (Set-based)
+
+    1. 배치 전체의 local_id를 한 번의 쿼리로 중복 체크
+    2. 신규 항목은 inventory_service.apply_mutation_batch로 일괄 적용
+       (최신 재고 스냅샷 이전 시각의 항목은 이후 스냅샷에도 반영)
+    3. 한 번만 커밋 (commit=False면 호출자가 자신의 변경과 함께 커밋.
+       단, 배치 적용이 DB 오류로 실패하면 롤백된 상태로 돌아옵니다)
+
+    항목별 synced/failed 판정은 건별 처리 방식과 동일하며, 응답은 입력 순서를 유지합니다.
+    """
+    items = request.transactions
+    if not items:
+        return SyncResponse(synced=[], failed=[], syncedAt=datetime.utcnow())
+
+    # 1. 중복 체크 (local_id, 배치 전체 1회)
+    local_ids = {item.local_id for item in items}
+    stmt = select(InventoryTransaction.local_id, InventoryTransaction.id).where(
+        InventoryTransaction.local_id.in_(local_ids)
+    )
+    existing: Dict[UUID, UUID] = {
+        row.local_id: row.id for row in await db.execute(stmt)
+    }
+
+    # 2. 검증 및 변환 (배치 내 중복 local_id는 첫 항목만 처리)
+    synced_at = datetime.utcnow()
+    errors: Dict[UUID, str] = {}
+    mutations: Dict[UUID, StockMutation] = {}
+    for tx_item in items:
+        local_id = tx_item.local_id
+        if local_id in existing or local_id in errors or local_id in mutations:
             continue
-            
-        # 2. 트랜잭션 처리
         try:
-            tx = None
-            if tx_item.type == TransactionType.INBOUND:
-                data = InboundTransactionCreate(
-                    product_id=str(tx_item.product_id),
-                    store_id=str(tx_item.store_id),
-                    quantity=tx_item.quantity,
-                    note=tx_item.note
-                )
-                tx, _, _ = await inventory_service.process_inbound(db, data, user)
-                
-            elif tx_item.type == TransactionType.OUTBOUND:
-                data = OutboundTransactionCreate(
-                    product_id=str(tx_item.product_id),
-                    store_id=str(tx_item.store_id),
-                    quantity=tx_item.quantity,
-                    note=tx_item.note
-                )
-                tx, _, _ = await inventory_service.process_outbound(db, data, user)
-                
-            elif tx_item.type == TransactionType.ADJUST:
-                if not tx_item.reason:
-                    raise ValueError("Reason is required for ADJUST")
-                    
-                data = AdjustTransactionCreate(
-                    product_id=str(tx_item.product_id),
-                    store_id=str(tx_item.store_id),
-                    quantity=tx_item.quantity,
-                    reason=tx_item.reason,
-                    note=tx_item.note
-                )
-                tx, _, _ = await inventory_service.process_adjust(db, data, user)
-            
-            # 3. 추가 메타데이터 업데이트
-            if tx:
-                tx.local_id = tx_item.local_id
-                tx.created_at = tx_item.created_at
-                tx.synced_at = datetime.utcnow()
-                
-                db.add(tx)
-                await db.commit()
-                
-                synced_items.append(SyncedItem(localId=tx_item.local_id, serverId=tx.id))
-            else:
-                raise ValueError("Unknown transaction type")
-            
-        except Exception as e:
-            # 트랜잭션 처리 중 오류 발생 시 롤백
-            await db.rollback()
-            failed_items.append(FailedItem(localId=tx_item.local_id, error=str(e)))
-            
+            mutations[local_id] = _to_mutation(tx_item, synced_at)
+        except ValueError as e:
+            errors[local_id] = str(e)
+
+    # 3. 일괄 적용 + 단일 커밋
+    try:
+        results = await inventory_service.apply_mutation_batch(
+            db, list(mutations.values()), user
+        )
+        await snapshot_service.adjust_snapshots(db, [r.mutation for r in results if r.ok])
+        if commit:
+            await db.commit()
+    except SQLAlchemyError as e:
+        # 동시 동기화로 local_id가 충돌하는 등 배치 전체가 실패한 경우
+        # 적용 대상 항목을 모두 실패로 돌려주고, 클라이언트 재시도 시 중복 체크로 정리됩니다.
+        await db.rollback()
+        logger.warning("Bulk sync apply failed", error=str(e), batch_size=len(mutations))
+        results = [
+            inventory_service.MutationResult(m, error=str(e)) for m in mutations.values()
+        ]
+
+    for result in results:
+        if result.ok:
+            existing[result.mutation.local_id] = result.transaction_id
+        else:
+            errors[result.mutation.local_id] = result.error
+
+    # 4. 응답 구성 (입력 순서 유지)
+    synced_items = []
+    failed_items = []
+    for tx_item in items:
+        local_id = tx_item.local_id
+        if local_id in existing:
+            synced_items.append(SyncedItem(localId=local_id, serverId=existing[local_id]))
+        else:
+            failed_items.append(FailedItem(localId=local_id, error=errors[local_id]))
+
     return SyncResponse(
         synced=synced_items,
         failed=failed_items,
@@ -0,0 +1,208 @@
+"""
+변경분 조회 (Delta Pull)
+
+클라이언트가 로컬 캐시(제품, 재고, 트랜잭션)를 최신으로 유지하도록 마지막 조회 이후
+바뀐 행만 돌려줍니다.
+
+    GET /sync/changes              → 전체 제품/재고 (+ 이후부터의 트랜잭션), nextToken
+    GET /sync/changes?since=토큰   → 토큰 이후 변경분만, nextToken
+
+- 변경 시각: 제품 COALESCE(updated_at, created_at), 재고 updated_at,
+  트랜잭션 COALESCE(synced_at, created_at) (각각 인덱스가 있음)
+- 토큰은 종류별 마지막 위치(변경 시각 + 키)를 담은 불투명 문자열입니다 (app.core.pagination)
+- 변경 시각은 커밋 전에(앱에서) 기록되므로, 조회 상한(until)은 아직 커밋되지 않은 쓰기가
+  나중에 기록할 수 있는 가장 이른 시각보다 앞서야 합니다 (_commit_horizon 참고)
+- 상한은 이 앱(DB_APPLICATION_NAME)의 진행 중인 트랜잭션만 고려하며,
+  SYNC_CHANGES_MAX_HORIZON_LAG_SECONDS보다 오래된 트랜잭션은 무시합니다
+- 종류별로 limit건까지 돌려주며, 넘치면 hasMore=true와 이어서 조회할 토큰을 돌려줍니다
+- 같은 행이 여러 번 올 수 있으므로 클라이언트는 키 기준으로 덮어씁니다
+"""
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.core.logging import get_logger
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.product import Product
+from app.models.stock import CurrentStock
+from app.models.transaction import InventoryTransaction
+
+logger = get_logger(__name__)
+
+# 종류별 위치: [변경 시각 ISO, 키 hex...] (키가 없으면 해당 시각 이하는 모두 받은 상태)
+Position = List[str]
+
+
+def _decode_position(value: Any, key_count: int) -> Optional[Tuple[datetime, List[UUID]]]:
+    if value is None:
+        return None
+    try:
+        changed_at, *keys = value
+        if len(keys) not in (0, key_count):
+            raise ValueError
+        return datetime.fromisoformat(changed_at), [UUID(k) for k in keys]
+    except (TypeError, ValueError):
+        raise BadRequestException("Invalid sync token")
+
+
+def _decode_token(token: Optional[str]):
+    if not token:
+        return None
+    products, stocks, transactions = decode_cursor(token, 3)
+    return (
+        _decode_position(products, 1),
+        _decode_position(stocks, 2),
+        _decode_position(transactions, 1),
+    )
+
+
+async def _oldest_open_transaction(db: AsyncSession) -> Optional[datetime]:
+    """
+    이 앱의 다른 연결에서 진행 중인 트랜잭션 중 가장 먼저 시작한 시각 (UTC, PostgreSQL 전용)
+
+    - 같은 application_name의 클라이언트 연결만 (psql, 백업, autovacuum 등 제외)
+    - 유휴(idle) 연결 제외, SYNC_CHANGES_MAX_HORIZON_LAG_SECONDS보다 오래된 트랜잭션 제외
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    return await db.scalar(
+        text("""
+            SELECT min(xact_start) AT TIME ZONE 'UTC'
+            FROM pg_stat_activity
+            WHERE datname = current_database()
+              AND pid <> pg_backend_pid()
+              AND backend_type = 'client backend'
+              AND application_name = :application_name
+              AND state <> 'idle'
+              AND xact_start IS NOT NULL
+              AND xact_start > now() - make_interval(secs => :max_lag)
+        """),
+        {
+            "application_name": settings.DB_APPLICATION_NAME,
+            "max_lag": settings.SYNC_CHANGES_MAX_HORIZON_LAG_SECONDS,
+        },
+    )
+
+
+async def _commit_horizon(db: AsyncSession) -> datetime:
+    """
+    변경분 조회 상한: 이 시각 이하의 변경은 이미 커밋되었거나 앞으로 생기지 않음
+
+    변경 시각은 트랜잭션 안에서 기록되므로 진행 중인 트랜잭션은 자기 시작 시각 이후의
+    값만 커밋할 수 있습니다. 따라서 상한을 (현재, 가장 오래된 진행 중 트랜잭션 시작) 중
+    이른 쪽으로 잡으면, 트랜잭션이 오래 걸려도 그 변경은 다음 조회에 포함됩니다.
+    SYNC_CHANGES_LAG_SECONDS는 앱 서버와 DB 서버의 시계 차이를 흡수하는 여유입니다.
+
+    상한이 그 여유보다 더 붙잡히면 경고를 남깁니다 (오래 걸리는 트랜잭션 확인용).
+    """
+    now = datetime.utcnow()
+    horizon = now
+    oldest = await _oldest_open_transaction(db)
+    if oldest is not None and oldest < now:
+        horizon = oldest
+        pinned_seconds = (now - oldest).total_seconds()
+        if pinned_seconds > settings.SYNC_CHANGES_LAG_SECONDS:
+            logger.warning(
+                "Sync changes horizon pinned by open transaction",
+                oldest_transaction_start=oldest.isoformat(),
+                pinned_seconds=round(pinned_seconds, 1),
+            )
+    return horizon - timedelta(seconds=settings.SYNC_CHANGES_LAG_SECONDS)
+
+
+async def _fetch(
+    db: AsyncSession,
+    stmt,
+    changed,
+    keys: Sequence,
+    position: Optional[Tuple[datetime, List[UUID]]],
+    until: datetime,
+    limit: int,
+):
+    """(changed, *keys) 순으로 position 다음부터 until까지 limit건 조회"""
+    stmt = stmt.where(changed <= until)
+    if position is not None:
+        after, after_keys = position
+        if after_keys:
+            stmt = stmt.where(tuple_(changed, *keys) > tuple_(after, *after_keys))
+        else:
+            stmt = stmt.where(changed > after)
+    stmt = stmt.order_by(changed, *keys).limit(limit)
+    return (await db.execute(stmt)).all()
+
+
+def _next_position(rows, changed_of, keys_of, limit: int, until: datetime) -> Tuple[Position, bool]:
+    if len(rows) < limit:
+        return [until.isoformat()], False
+    last = rows[-1]
+    return [changed_of(last).isoformat(), *(k.hex for k in keys_of(last))], True
+
+
+async def get_changes(
+    db: AsyncSession,
+    since: Optional[str] = None,
+    store_id: Optional[UUID] = None,
+    limit: int = 500,
+) -> Tuple[List[Product], list, list, str, bool]:
+    """
+    since 토큰 이후 변경분 조회
+
+    Args:
+        since: 이전 응답의 nextToken (없으면 전체 제품/재고, 트랜잭션은 지금부터)
+        store_id: 재고/트랜잭션을 해당 매장으로 제한 (제품은 항상 전체)
+        limit: 종류별 최대 건수
+
+    Returns:
+        (제품, 재고 행, 트랜잭션 행, nextToken, hasMore)
+    """
+    until = await _commit_horizon(db)
+    positions = _decode_token(since)
+    if positions is None:
+        # 첫 조회: 제품/재고는 처음부터, 트랜잭션 이력은 받지 않음 (현재 재고로 충분)
+        positions = (None, None, (until, []))
+    product_pos, stock_pos, tx_pos = positions
+
+    # 제품
+    product_changed = func.coalesce(Product.updated_at, Product.created_at)
+    products = [
+        row[0] for row in await _fetch(
+            db, select(Product), product_changed, [Product.id], product_pos, until, limit
+        )
+    ]
+    next_products, more_products = _next_position(
+        products, lambda p: p.updated_at or p.created_at, lambda p: [p.id], limit, until
+    )
+
+    # 재고
+    cs = CurrentStock
+    stock_stmt = select(cs.product_id, cs.store_id, cs.quantity, cs.status, cs.updated_at)
+    if store_id:
+        stock_stmt = stock_stmt.where(cs.store_id == store_id)
+    stocks = await _fetch(
+        db, stock_stmt, cs.updated_at, [cs.product_id, cs.store_id], stock_pos, until, limit
+    )
+    next_stocks, more_stocks = _next_position(
+        stocks, lambda s: s.updated_at, lambda s: [s.product_id, s.store_id], limit, until
+    )
+
+    # 트랜잭션
+    tx = InventoryTransaction
+    tx_changed = func.coalesce(tx.synced_at, tx.created_at)
+    tx_stmt = select(
+        tx.id, tx.local_id, tx.product_id, tx.store_id, tx.type, tx.quantity,
+        tx.reason, tx.note, tx.created_at, tx.synced_at,
+    )
+    if store_id:
+        tx_stmt = tx_stmt.where(tx.store_id == store_id)
+    transactions = await _fetch(db, tx_stmt, tx_changed, [tx.id], tx_pos, until, limit)
+    next_transactions, more_transactions = _next_position(
+        transactions, lambda t: t.synced_at or t.created_at, lambda t: [t.id], limit, until
+    )
+
+    token = encode_cursor([next_products, next_stocks, next_transactions])
+    return products, stocks, transactions, token, more_products or more_stocks or more_transactions
@@ -0,0 +1,289 @@
+"""
+비동기 동기화 작업 (Sync Jobs)
+
+POST /sync/transactions는 배치 전체를 HTTP 요청 안에서 처리하므로, 주말 내내 오프라인이던
+기기의 대용량 배치는 프록시 타임아웃을 넘길 수 있습니다. 작업 모드에서는
+
+    POST /sync/jobs      → sync_jobs에 저장 후 즉시 작업 ID 반환 (202)
+    백그라운드 워커       → sync_service.sync_transactions로 처리, 결과를 sync_jobs에 기록
+    GET /sync/jobs/{id}  → 상태/결과 조회 (wait 파라미터로 완료까지 대기 가능)
+
+- 외부 브로커 없이 DB 테이블이 큐입니다. 접수한 프로세스가 바로 처리하고, 재시작/다른
+  워커의 장애로 남은 작업은 앱 시작 시 recover_sync_jobs가 다시 맡습니다
+- 작업 선점은 조건부 UPDATE(status PENDING → RUNNING) 한 문장이라 여러 프로세스가
+  같은 작업을 중복 처리하지 않습니다
+- 처리 중에는 SYNC_JOB_HEARTBEAT_SECONDS마다 heartbeat_at을 갱신하고, 복구는 이 값으로
+  죽은 작업을 판단합니다 (오래 걸리는 작업을 처리 중에 빼앗지 않음)
+- 반영 결과와 완료 상태는 한 트랜잭션으로 커밋하되, 선점 토큰(claim_id)이 그대로일 때만
+  커밋합니다. 그 사이 복구되어 다른 실행이 맡았다면 이 실행의 반영은 롤백됩니다
+- 동시 처리 수: 프로세스당 SYNC_JOB_MAX_CONCURRENCY, 매장당 SYNC_JOB_STORE_CONCURRENCY
+  (같은 매장 재고 행의 잠금 경합을 줄이고 도착 순서대로 반영)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session
+from app.models.sync_job import SyncJob
+from app.schemas.sync import SyncRequest
+from app.services import sync as sync_service
+
+logger = get_logger(__name__)
+
+FINISHED_STATUSES = ("DONE", "FAILED")
+
+
+async def create_sync_job(db: AsyncSession, request: SyncRequest) -> SyncJob:
+    """동기화 요청을 작업으로 저장 (커밋 포함)"""
+    job = SyncJob(
+        status="PENDING",
+        item_count=len(request.transactions),
+        payload=request.model_dump(mode="json", by_alias=True),
+        created_at=datetime.utcnow(),
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def get_sync_job(db: AsyncSession, job_id: UUID) -> Optional[SyncJob]:
+    return await db.get(SyncJob, job_id, populate_existing=True)
+
+
+async def wait_for_sync_job(
+    db: AsyncSession,
+    job_id: UUID,
+    wait_seconds: float = 0,
+    poll_interval: float = 1.0,
+) -> Optional[SyncJob]:
+    """
+    작업 조회 (wait_seconds > 0 이면 완료되거나 시간이 다 될 때까지 대기)
+
+    이 프로세스가 처리 중인 작업은 완료 이벤트로 바로 깨어나고,
+    다른 프로세스가 처리 중인 작업은 poll_interval마다 다시 조회합니다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+    while True:
+        job = await get_sync_job(db, job_id)
+        remaining = deadline - loop.time()
+        if job is None or job.status in FINISHED_STATUSES or remaining <= 0:
+            return job
+        # 대기 중에는 트랜잭션(연결)을 잡고 있지 않음
+        await db.rollback()
+        await get_sync_job_runner().wait(job_id, min(poll_interval, remaining))
+
+
+class SyncJobRunner:
+    """
+    프로세스 내 동기화 작업 실행기
+
+    - submit(job_id)로 작업을 맡기면 매장 세마포어 → 전체 세마포어 순으로 자리를 얻은 뒤 처리
+    - 이벤트 루프가 바뀌면(테스트 등) 세마포어를 새로 만듦
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        max_concurrency: Optional[int] = None,
+        store_concurrency: Optional[int] = None,
+    ):
+        self._session_factory = session_factory
+        self.max_concurrency = settings.SYNC_JOB_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        self.store_concurrency = (
+            settings.SYNC_JOB_STORE_CONCURRENCY if store_concurrency is None else store_concurrency
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._store_slots: Dict[UUID, asyncio.Semaphore] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._finished: Dict[UUID, asyncio.Event] = {}
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._store_slots = {}
+            self._tasks = set()
+            self._finished = {}
+        return loop
+
+    def submit(self, job_id: UUID) -> None:
+        loop = self._bind_loop()
+        self._finished.setdefault(job_id, asyncio.Event())
+        task = loop.create_task(self._run(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait(self, job_id: UUID, timeout: float) -> None:
+        """완료 또는 timeout까지 대기 (이 프로세스가 맡은 작업이 아니면 timeout만큼 대기)"""
+        self._bind_loop()
+        event = self._finished.get(job_id)
+        if event is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def drain(self) -> None:
+        """맡은 작업이 모두 끝날 때까지 대기 (테스트용)"""
+        if self._tasks and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """대기/처리 중인 작업 취소 (DB에 남은 작업은 다음 시작 시 복구됨)"""
+        tasks = list(self._tasks) if self._loop is asyncio.get_running_loop() else []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _store_slot(self, store_id: UUID) -> asyncio.Semaphore:
+        if store_id not in self._store_slots:
+            self._store_slots[store_id] = asyncio.Semaphore(self.store_concurrency)
+        return self._store_slots[store_id]
+
+    async def _run(self, job_id: UUID) -> None:
+        try:
+            async with self._session_factory() as db:
+                job = await db.get(SyncJob, job_id)
+                if job is None or job.status != "PENDING":
+                    return
+                request = SyncRequest.model_validate(job.payload)
+
+            # 자리를 기다리는 동안 DB 연결을 잡고 있지 않도록 세션을 닫은 뒤 대기
+            # 여러 매장을 담은 배치는 정렬된 순서로 잠가 교착을 피함
+            store_ids = sorted({item.store_id for item in request.transactions})
+            store_slots = [self._store_slot(s) for s in store_ids]
+            for slot in store_slots:
+                await slot.acquire()
+            try:
+                async with self._slots:
+                    async with self._session_factory() as db:
+                        await self._process(db, job_id, request)
+            finally:
+                for slot in reversed(store_slots):
+                    slot.release()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Sync job crashed", job_id=str(job_id), error=str(e))
+        finally:
+            event = self._finished.pop(job_id, None)
+            if event is not None:
+                event.set()
+
+    async def _process(self, db: AsyncSession, job_id: UUID, request: SyncRequest) -> None:
+        # 선점: 다른 프로세스가 먼저 가져갔으면 아무것도 하지 않음
+        claim_id = uuid4()
+        now = datetime.utcnow()
+        claimed = await db.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id, SyncJob.status == "PENDING")
+            .values(status="RUNNING", claim_id=claim_id, started_at=now, heartbeat_at=now)
+            .returning(SyncJob.id)
+        )
+        if claimed.first() is None:
+            await db.rollback()
+            return
+        await db.commit()
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, claim_id))
+        try:
+            try:
+                response = await sync_service.sync_transactions(db, request, user=None, commit=False)
+                values = {"status": "DONE", "result": response.model_dump(mode="json", by_alias=True)}
+            except Exception as e:
+                await db.rollback()
+                logger.error("Sync job failed", job_id=str(job_id), error=str(e))
+                values = {"status": "FAILED", "error": str(e)}
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        values["finished_at"] = datetime.utcnow()
+
+        # 반영 결과와 완료 상태를 함께 커밋 (선점을 잃었으면 둘 다 버림)
+        finished = await db.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id, SyncJob.claim_id == claim_id)
+            .values(**values)
+            .returning(SyncJob.id)
+        )
+        if finished.first() is None:
+            await db.rollback()
+            logger.warning("Sync job claim lost, result discarded", job_id=str(job_id))
+            return
+        await db.commit()
+        logger.info("Sync job finished", job_id=str(job_id), status=values["status"], items=len(request.transactions))
+
+    async def _heartbeat(self, job_id: UUID, claim_id: UUID) -> None:
+        """처리 중 SYNC_JOB_HEARTBEAT_SECONDS마다 heartbeat_at 갱신 (별도 세션, 선점을 잃으면 중단)"""
+        while True:
+            await asyncio.sleep(settings.SYNC_JOB_HEARTBEAT_SECONDS)
+            try:
+                async with self._session_factory() as db:
+                    beat = await db.execute(
+                        update(SyncJob)
+                        .where(SyncJob.id == job_id, SyncJob.claim_id == claim_id)
+                        .values(heartbeat_at=datetime.utcnow())
+                        .returning(SyncJob.id)
+                    )
+                    owned = beat.first() is not None
+                    await db.commit()
+            except Exception as e:
+                logger.warning("Sync job heartbeat failed", job_id=str(job_id), error=str(e))
+                continue
+            if not owned:
+                return
+
+
+_runner: Optional[SyncJobRunner] = None
+
+
+def get_sync_job_runner() -> SyncJobRunner:
+    """프로세스 전역 실행기 (첫 사용 시 생성)"""
+    global _runner
+    if _runner is None:
+        _runner = SyncJobRunner()
+    return _runner
+
+
+async def shutdown_sync_jobs() -> None:
+    if _runner is not None:
+        await _runner.stop()
+
+
+async def recover_sync_jobs(session_factory: Callable[[], AsyncSession] = async_session) -> List[UUID]:
+    """
+    남은 작업 다시 맡기 (앱 시작 시)
+
+    RUNNING인데 heartbeat_at이 SYNC_JOB_STALE_MINUTES 넘게 갱신되지 않은 작업은 처리하던
+    프로세스가 죽은 것으로 보고 PENDING으로 되돌린 뒤(선점 토큰도 해제),
+    PENDING 작업을 모두 이 프로세스 실행기에 맡깁니다.
+    """
+    stale_before = datetime.utcnow() - timedelta(minutes=settings.SYNC_JOB_STALE_MINUTES)
+    async with session_factory() as db:
+        await db.execute(
+            update(SyncJob)
+            .where(SyncJob.status == "RUNNING", SyncJob.heartbeat_at < stale_before)
+            .values(status="PENDING", claim_id=None, started_at=None, heartbeat_at=None)
+        )
+        await db.commit()
+        job_ids = (await db.execute(
+            select(SyncJob.id).where(SyncJob.status == "PENDING").order_by(SyncJob.created_at)
+        )).scalars().all()
+
+    runner = get_sync_job_runner()
+    for job_id in job_ids:
+        runner.submit(job_id)
+    if job_ids:
+        logger.info("Sync jobs recovered", count=len(job_ids))
+    return list(job_ids)
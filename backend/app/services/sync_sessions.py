@@ -0,0 +1,135 @@
+"""
+재개 가능한 동기화 세션 (Chunked Sync Sessions)
+
+POST /sync/transactions는 배치 전체가 한 요청이라, 연결이 끊기면 전부 다시 올리고
+서버는 전부 다시 중복 체크해야 합니다. 세션 모드에서는
+
+    POST /sync/sessions                      → 세션 생성 (ackedChunk=0)
+    PUT  /sync/sessions/{id}/chunks/{seq}    → seq = ackedChunk + 1 인 청크를 받아 즉시 반영
+    GET  /sync/sessions/{id}                 → 재시도 시 ackedChunk를 확인하고 다음 청크부터 이어서
+    POST /sync/sessions/{id}/complete        → 세션 종료
+
+- 청크 반영과 acked_chunk 갱신은 한 트랜잭션으로 커밋되므로, ackedChunk까지는 반드시 반영된 것입니다
+- 청크 크기는 SYNC_CHUNK_MAX_ITEMS로 제한되어 요청 본문과 서버 메모리가 일정하게 유지됩니다
+- 응답을 받지 못한 마지막 청크를 다시 보내면 저장된 결과를 그대로 돌려줍니다 (재반영 없음)
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import (
+    BadRequestException, ConflictException, NotFoundException, SyncChunkOutOfOrderException
+)
+from app.core.logging import get_logger
+from app.models.sync_session import SyncSession
+from app.models.user import User
+from app.schemas.sync import SyncRequest, SyncResponse
+from app.services import sync as sync_service
+
+logger = get_logger(__name__)
+
+
+async def create_sync_session(db: AsyncSession, total_chunks: Optional[int] = None) -> SyncSession:
+    now = datetime.utcnow()
+    session = SyncSession(
+        total_chunks=total_chunks,
+        acked_chunk=0,
+        synced_count=0,
+        failed_count=0,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(session)
+    await db.commit()
+    await db.refresh(session)
+    return session
+
+
+async def get_sync_session(db: AsyncSession, session_id: UUID, for_update: bool = False) -> SyncSession:
+    stmt = select(SyncSession).where(SyncSession.id == session_id).execution_options(populate_existing=True)
+    if for_update:
+        stmt = stmt.with_for_update()
+    session = await db.scalar(stmt)
+    if session is None:
+        raise NotFoundException("Sync session not found")
+    return session
+
+
+async def upload_sync_chunk(
+    db: AsyncSession,
+    session_id: UUID,
+    seq: int,
+    request: SyncRequest,
+    user: Optional[User] = None,  # TODO: 인증 구현 후 필수로 변경
+) -> Tuple[SyncSession, SyncResponse, bool]:
+    """
+    청크 반영
+
+    Returns:
+        (세션, 청크 처리 결과, 재전송 여부) - 재전송이면 결과는 저장된 마지막 청크 결과
+    Raises:
+        SyncChunkOutOfOrderException: seq가 다음 청크 번호가 아닌 경우 (details.nextChunk 참고)
+    """
+    if len(request.transactions) > settings.SYNC_CHUNK_MAX_ITEMS:
+        raise BadRequestException(f"Chunk exceeds {settings.SYNC_CHUNK_MAX_ITEMS} transactions")
+
+    # 같은 세션의 청크가 동시에 들어와도 한 번에 하나씩 반영 (PostgreSQL 행 잠금)
+    session = await get_sync_session(db, session_id, for_update=True)
+    acked = session.acked_chunk
+
+    if seq == acked and session.last_result is not None:
+        return session, SyncResponse.model_validate(session.last_result), True
+    if session.completed_at is not None:
+        raise ConflictException("Sync session already completed")
+    if seq != acked + 1:
+        raise SyncChunkOutOfOrderException(acked)
+    if session.total_chunks is not None and seq > session.total_chunks:
+        raise BadRequestException(f"Sync session has only {session.total_chunks} chunks")
+
+    response = await sync_service.sync_transactions(db, request, user, commit=False)
+
+    # 배치 적용이 DB 오류로 롤백됐으면 잠금도 풀렸으므로 acked_chunk를 조건으로 갱신
+    now = datetime.utcnow()
+    acknowledged = await db.execute(
+        update(SyncSession)
+        .where(SyncSession.id == session_id, SyncSession.acked_chunk == acked)
+        .values(
+            acked_chunk=seq,
+            synced_count=SyncSession.synced_count + len(response.synced),
+            failed_count=SyncSession.failed_count + len(response.failed),
+            last_result=response.model_dump(mode="json", by_alias=True),
+            updated_at=now,
+        )
+        .returning(SyncSession.id)
+    )
+    if acknowledged.first() is None:
+        # 다른 요청이 먼저 같은 청크를 반영함 - 이번 반영은 버림
+        await db.rollback()
+        raise SyncChunkOutOfOrderException((await get_sync_session(db, session_id)).acked_chunk)
+    await db.commit()
+
+    session = await get_sync_session(db, session_id)
+    logger.info(
+        "Sync chunk applied",
+        session_id=str(session_id),
+        chunk=seq,
+        synced=len(response.synced),
+        failed=len(response.failed),
+    )
+    return session, response, False
+
+
+async def complete_sync_session(db: AsyncSession, session_id: UUID) -> SyncSession:
+    """세션 종료 (전체 청크 수를 알렸다면 모두 반영된 뒤에만 가능)"""
+    session = await get_sync_session(db, session_id, for_update=True)
+    if session.completed_at is None:
+        if session.total_chunks is not None and session.acked_chunk < session.total_chunks:
+            raise SyncChunkOutOfOrderException(session.acked_chunk, "Sync session has pending chunks")
+        session.completed_at = datetime.utcnow()
+        await db.commit()
+        await db.refresh(session)
+    return session
@@ -0,0 +1,145 @@
+"""
+트랜잭션 원장 콜드 보관 (Cold Archive)
+
+오래된 월별 파티션(inventory_transactions_pYYYYMM)을 gzip CSV로 내보낸 뒤
+원장에서 분리(DETACH)합니다. 분리된 파티션은 목록/건수/내보내기 조회에서 제외됩니다.
+
+사용 예:
+    python scripts/archive_transactions.py --dry-run
+    python scripts/archive_transactions.py --older-than-months 12 --output-dir /mnt/archive
+    python scripts/archive_transactions.py --drop   # 분리 후 테이블까지 삭제
+
+각 파티션은 (잠금 → 내보내기 → 분리 → 커밋) 순서로 한 트랜잭션에서 처리되므로 중간에
+실패해도 이미 처리된 파티션만 분리됩니다. 파일 쓰기가 끝나기 전에는 분리하지 않습니다.
+
+잠금:
+    내보내기 전에 파티션을 SHARE 모드로 잠가, COPY 이후 분리 전에 커밋되는 쓰기(해당 월로
+    뒤늦게 동기화된 트랜잭션 등)가 파일에 빠진 채 분리/삭제되지 않게 합니다. 잠금은 진행 중인
+    쓰기의 커밋을 기다리며, 그동안 그 월에 대한 새 쓰기는 대기합니다 (다른 월은 영향 없음).
+    분리(DETACH) 자체는 원장 부모 테이블을 잠그므로 드물게 그 월에 쓰던 트랜잭션과 교착이
+    감지되어 한쪽이 실패할 수 있습니다. 보관이 실패하면 해당 파티션은 분리되지 않으니 다시
+    실행하면 됩니다.
+
+기본 파티션(inventory_transactions_default):
+    월별 파티션이 없는 시각의 행(이미 보관한 월이나 첫 파티션 이전 시각으로 뒤늦게 동기화된
+    트랜잭션)은 기본 파티션에 쌓이며, 이 스크립트는 기본 파티션을 보관하지 않습니다.
+    이 행들은 원장에 그대로 남아 목록/합계/재고 대사에 계속 포함되므로 유실되지는 않지만,
+    보관 기준보다 오래된 행이 있으면 건수를 경고로 출력합니다 (필요하면 수동으로 정리).
+
+재고 대사와의 관계:
+    분리한 파티션은 archived_partitions에 기록됩니다. 이후 원장 합계는 전체 이력이 아니므로
+    scripts/reconcile_stocks.py --full(전체 원장 합산)은 거부되고, 스냅샷 기준 대사도
+    보관 구간 끝 이후의 재고 스냅샷이 있어야 실행됩니다. 그래서 보관 전에 그 시점 이후
+    스냅샷이 있는지 확인하고, 없으면 해당 파티션을 보관하지 않습니다.
+"""
+import argparse
+import asyncio
+import gzip
+import os
+import sys
+from datetime import datetime
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+import app.main  # noqa: F401  모든 모델 매퍼 등록
+from app.core.config import settings
+from app.db.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    detach_partition,
+    ensure_transaction_partitions,
+    list_transaction_partitions,
+    record_archived_partition,
+)
+from app.db.session import async_session
+from app.services.snapshot import latest_snapshot_at
+
+
+async def export_partition(db, name: str, path: str) -> None:
+    """파티션 전체를 COPY로 gzip CSV 파일에 기록 (헤더 포함, 세션의 현재 트랜잭션에서 실행)"""
+    conn = await db.connection()
+    raw = (await conn.get_raw_connection()).driver_connection
+    tmp_path = f"{path}.part"
+    with gzip.open(tmp_path, "wb") as f:
+        await raw.copy_from_query(f"SELECT * FROM {name} ORDER BY created_at, id", output=f, format="csv", header=True)
+    os.replace(tmp_path, path)
+
+
+async def count_default_rows_before(db, cutoff) -> int:
+    """기본 파티션에서 cutoff 이전 시각의 행 수 (보관 대상이 아닌 오래된 행)"""
+    return await db.scalar(
+        text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"),
+        {"cutoff": cutoff},
+    )
+
+
+async def archive(older_than_months: int, output_dir: str, drop: bool, dry_run: bool) -> None:
+    async with async_session() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            print("Partition archive requires PostgreSQL. Nothing to do.")
+            return
+
+        # 보관과 함께 미래 파티션도 점검
+        created = await ensure_transaction_partitions(db)
+        for name in created:
+            print(f"Created partition {name}")
+
+        cutoff = add_months(datetime.utcnow().date(), -older_than_months)
+        stray = await count_default_rows_before(db, cutoff)
+        if stray:
+            print(
+                f"Warning: {stray} rows older than {cutoff.isoformat()} are in {DEFAULT_PARTITION} "
+                "and will not be archived"
+            )
+
+        targets = [p for p in await list_transaction_partitions(db) if p.end <= cutoff]
+        if not targets:
+            print(f"No partitions older than {cutoff.isoformat()}")
+            return
+
+        # 보관 후 재고 대사의 기준이 될 스냅샷이 보관 구간 끝 이후에 있어야 함
+        latest = await latest_snapshot_at(db)
+        covered = [p for p in targets if latest is not None and p.end <= latest.date()]
+        for partition in targets[len(covered):]:
+            print(f"Skipping {partition.name}: no stock snapshot at or after {partition.end.isoformat()}")
+        targets = covered
+
+        os.makedirs(output_dir, exist_ok=True)
+        for partition in targets:
+            path = os.path.join(output_dir, f"{partition.name}.csv.gz")
+            if dry_run:
+                print(f"[dry-run] {partition.name} ({partition.start} ~ {partition.end}) -> {path}")
+                continue
+
+            # COPY ~ DETACH 사이에 그 월로 커밋되는 쓰기가 파일에서 빠지지 않도록 쓰기를 막음
+            await db.execute(text(f"LOCK TABLE {partition.name} IN SHARE MODE"))
+            await export_partition(db, partition.name, path)
+            await detach_partition(db, partition.name)
+            if drop:
+                await db.execute(text(f"DROP TABLE {partition.name}"))
+            await record_archived_partition(db, partition, path, drop)
+            await db.commit()
+            print(f"Archived {partition.name} -> {path}{' (dropped)' if drop else ' (detached)'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old inventory transaction partitions")
+    parser.add_argument(
+        "--older-than-months", type=int, default=settings.TRANSACTION_HOT_MONTHS,
+        help="이번 달 기준 이보다 오래된 월을 보관 (기본: TRANSACTION_HOT_MONTHS)",
+    )
+    parser.add_argument(
+        "--output-dir", default=settings.TRANSACTION_ARCHIVE_DIR,
+        help="gzip CSV 저장 위치 (기본: TRANSACTION_ARCHIVE_DIR)",
+    )
+    parser.add_argument("--drop", action="store_true", help="분리 후 파티션 테이블 삭제")
+    parser.add_argument("--dry-run", action="store_true", help="대상만 출력")
+    args = parser.parse_args()
+
+    asyncio.run(archive(args.older_than_months, args.output_dir, args.drop, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+미들웨어 요청당 오버헤드 측정 (BaseHTTPMiddleware vs 순수 ASGI)
+
+사용 예:
+    python scripts/bench_middleware.py                   # 기본 5000회
+    python scripts/bench_middleware.py -n 20000 --with-logging
+
+RequestIdMiddleware + LoggingMiddleware 스택을 예전 BaseHTTPMiddleware 방식과
+현재 순수 ASGI 방식으로 각각 구성하고, 미들웨어 없는 앱과 비교한 요청당 추가 시간을 출력합니다.
+- 경로: /health (로깅 제외 경로), /api/v1/products/barcode/{barcode} (로깅 대상)
+- 엔드포인트는 고정 응답을 돌려주는 스텁이라 DB 없이 미들웨어 비용만 측정됩니다
+- HTTP 클라이언트 없이 ASGI 앱을 직접 호출합니다
+- 기본적으로 로그 출력은 버립니다 (두 방식의 로그 비용은 같음, --with-logging으로 포함)
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.logging import bind_contextvars, clear_contextvars
+from app.middleware import LoggingMiddleware, RequestIdMiddleware
+from app.middleware.request_id import request_id_ctx
+
+BARCODE_PAYLOAD = (
+    b'{"id":"550e8400-e29b-41d4-a716-446655440000","barcode":"8801234567890",'
+    b'"name":"\xed\x95\x98\xec\x9d\xb4\xeb\x93\x9c\xeb\x9d\xbc \xec\x97\x90\xec\x84\xbc\xec\x8a\xa4 100ml",'
+    b'"categoryId":"660e8400-e29b-41d4-a716-446655440000","safetyStock":20,"imageUrl":null,'
+    b'"memo":null,"isActive":true,"createdAt":"2026-01-01T09:00:00","updatedAt":null}'
+)
+
+
+class LegacyRequestIdMiddleware(BaseHTTPMiddleware):
+    """예전 구현 (BaseHTTPMiddleware)"""
+    async def dispatch(self, request: Request, call_next):
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request_id_ctx.set(request_id)
+        clear_contextvars()
+        bind_contextvars(request_id=request_id, path=request.url.path, method=request.method)
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """예전 구현 (BaseHTTPMiddleware) - 로그 형식은 LoggingMiddleware와 같음"""
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in LoggingMiddleware.EXCLUDE_PATHS:
+            return await call_next(request)
+        start_time = time.perf_counter()
+        logger = structlog.get_logger("app.middleware.logging_middleware")
+        logger.info("Request started", client_ip=request.client.host if request.client else "Unknown")
+        response = await call_next(request)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.info("Request completed", status_code=response.status_code, duration_ms=round(duration_ms, 2))
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/v1/products/barcode/{barcode}")
+    async def barcode(barcode: str):
+        return Response(content=BARCODE_PAYLOAD, media_type="application/json")
+
+    # 마지막 등록이 먼저 실행 (main.py와 같은 순서)
+    if stack == "legacy":
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyRequestIdMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RequestIdMiddleware)
+    return app
+
+
+async def call(app, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    # 서버처럼: 본문 1회 전달 후에는 응답이 끝날 때까지 기다렸다가 disconnect
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            done.set()
+
+    await app(scope, receive, send)
+
+
+async def measure(app, path: str, n: int, rounds: int = 5) -> float:
+    """요청당 시간 (µs, rounds회 중 중앙값)"""
+    for _ in range(min(n, 500)):  # 워밍업 (미들웨어 스택 생성 등)
+        await call(app, path)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(n):
+            await call(app, path)
+        samples.append((time.perf_counter() - start) / n * 1e6)
+    return statistics.median(samples)
+
+
+async def bench(n: int) -> None:
+    apps = {stack: build_app(stack) for stack in ("none", "legacy", "asgi")}
+    paths = ["/health", "/api/v1/products/barcode/8801234567890"]
+
+    print(f"{n} requests x 5 rounds (median, µs/request)")
+    print(f"{'path':<42}{'none':>9}{'legacy':>10}{'asgi':>9}{'legacy+':>10}{'asgi+':>9}")
+    for path in paths:
+        t = {stack: await measure(app, path, n) for stack, app in apps.items()}
+        print(
+            f"{path:<42}{t['none']:>9.1f}{t['legacy']:>10.1f}{t['asgi']:>9.1f}"
+            f"{t['legacy'] - t['none']:>10.1f}{t['asgi'] - t['none']:>9.1f}"
+        )
+    print("legacy+/asgi+: 미들웨어 없는 앱 대비 요청당 추가 시간")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-request middleware overhead")
+    parser.add_argument("-n", "--requests", type=int, default=5000, help="라운드당 요청 수 (기본: 5000)")
+    parser.add_argument("--with-logging", action="store_true", help="로그 출력 비용 포함")
+    args = parser.parse_args()
+
+    if not args.with_logging:
+        def drop(logger, method_name, event_dict):
+            raise structlog.DropEvent
+        structlog.configure(processors=[drop], cache_logger_on_first_use=False)
+
+    asyncio.run(bench(args.requests))
+
+
+if __name__ == "__main__":
+    main()
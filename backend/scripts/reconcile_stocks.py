@@ -0,0 +1,65 @@
+"""
+재고 대사 (current_stocks ↔ 원장 합계)
+
+사용 예:
+    python scripts/reconcile_stocks.py              # 보고만 (최신 스냅샷 이후 원장만 읽음)
+    python scripts/reconcile_stocks.py --repair     # 불일치를 원장 기준으로 보정
+    python scripts/reconcile_stocks.py --full       # 스냅샷 없이 전체 원장과 비교
+
+중단되면 다시 실행 시 마지막 체크포인트부터 이어서 처리합니다.
+불일치가 있으면 종료 코드 1을 반환합니다 (보정 모드에서 모두 보정되면 0).
+
+원장 보관(scripts/archive_transactions.py) 이후:
+    분리된 파티션의 원장은 합계에 포함되지 않으므로 --full은 거부됩니다 (종료 코드 2).
+    전체 합산 대신 보관 구간 끝 이후의 스냅샷을 기준으로 하는 기본 모드를 사용하세요.
+    기준 스냅샷이 보관 구간보다 오래된 경우에도 같은 이유로 거부됩니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app.main  # noqa: F401  모든 모델 매퍼 등록
+from app.core.config import settings
+from app.db.session import async_session
+from app.services.reconciliation import LedgerArchivedError, reconcile_stocks
+
+
+async def reconcile(repair: bool, full: bool, chunk_size: int) -> int:
+    async with async_session() as db:
+        try:
+            run, drifts = await reconcile_stocks(db, repair=repair, full=full, chunk_size=chunk_size)
+        except LedgerArchivedError as e:
+            print(f"Refusing to reconcile: {e}")
+            return 2
+
+    basis = run.basis_at.isoformat() if run.basis_at else "full ledger"
+    print(f"Checked {run.checked_count} stocks (basis: {basis})")
+    print(f"Drift: {run.drift_count}, repaired: {run.repaired_count}")
+    for drift in drifts:
+        print(f"  product={drift.product_id} store={drift.store_id} cached={drift.cached} expected={drift.expected}")
+    if run.drift_count > len(drifts):
+        print(f"  ... and {run.drift_count - len(drifts)} more (see logs)")
+
+    unresolved = run.drift_count - run.repaired_count if repair else run.drift_count
+    return 1 if unresolved else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile current_stocks against the transaction ledger")
+    parser.add_argument("--repair", action="store_true", help="불일치를 원장 기준으로 보정")
+    parser.add_argument("--full", action="store_true", help="스냅샷 없이 전체 원장 합계와 비교")
+    parser.add_argument(
+        "--chunk-size", type=int, default=settings.STOCK_RECONCILE_CHUNK_SIZE,
+        help="한 번에 확인할 재고 행 수 (기본: STOCK_RECONCILE_CHUNK_SIZE)",
+    )
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(reconcile(args.repair, args.full, args.chunk_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,8 @@ from app.main import app
 from app.db.base import Base
 from app.db.session import get_db
 from app.core.config import settings
+from app.core.counting import count_cache
+from app.services.product import barcode_cache
 
 # ========== 테스트 DB 설정 ==========
 
@@ -109,6 +111,10 @@ async def db_session():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+    # 4. 프로세스 내 캐시 초기화 (테스트 간 캐시된 응답이 남지 않도록)
+    barcode_cache.clear()
+    count_cache.clear()
+
 
 # ========== HTTP 클라이언트 Fixture ==========
 
@@ -0,0 +1,175 @@
+"""
+동시 트랜잭션 잠금 테스트 (PostgreSQL 전용)
+
+목적:
+    advisory lock / 행 잠금이 필요한 만큼만 직렬화하는지 실제 세션 두 개로 확인합니다.
+    변경분 조회 상한(pg_stat_activity 기반)이 어떤 트랜잭션을 따르는지도 확인합니다.
+    (SQLite에서는 잠금 함수가 생략되므로 기본 테스트로는 검증할 수 없음)
+
+실행:
+    CONCURRENCY_TEST_DATABASE_URL=postgresql+asyncpg://user:pw@localhost:5432/donedone_locks \\
+        pytest tests/integration/test_concurrency.py
+
+    - CONCURRENCY_TEST_DATABASE_URL이 없으면 모두 건너뜁니다
+    - 주의: 해당 DB의 public 스키마를 지우고 모델 정의(create_all)로 다시 만듭니다.
+      반드시 전용 DB를 지정하세요.
+"""
+import asyncio
+import os
+from unittest.mock import patch
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.partitions import DEFAULT_PARTITION, PARENT_TABLE
+from app.models.category import Category
+from app.models.product import Product
+from app.models.stock_snapshot import StockSnapshot
+from app.models.store import Store
+from app.schemas.sync import SyncRequest, SyncTransactionItem
+from app.services import snapshot as snapshot_service
+from app.services import sync_changes
+from app.services.sync import sync_transactions
+
+LOCK_DATABASE_URL = os.environ.get("CONCURRENCY_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not LOCK_DATABASE_URL, reason="CONCURRENCY_TEST_DATABASE_URL (PostgreSQL) not set"
+)
+
+# 다른 세션이 막히지 않았다고 판단하는 대기 한도 (초)
+NOT_BLOCKED_TIMEOUT = 5
+# 막혀 있는지 확인할 때 기다리는 시간 (초)
+BLOCKED_PROBE = 0.5
+
+SNAPSHOT_AT = datetime(2026, 1, 10)
+
+
+@pytest.fixture
+async def lock_engine():
+    engine = create_async_engine(
+        LOCK_DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"server_settings": {"application_name": settings.DB_APPLICATION_NAME}},
+    )
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        # 원장은 월별 파티션 테이블 (마이그레이션과 같이 기본 파티션만 둠)
+        await conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def snapshot_keys(lock_engine):
+    """스냅샷 행이 있는 (제품, 매장) 두 쌍 - 각 동기화 세션이 서로 다른 행을 갱신하도록"""
+    keys = []
+    async with AsyncSession(lock_engine) as db:
+        store = Store(code="LCK01", name="Lock Store")
+        category = Category(code="LCK", name="Lock Category")
+        db.add_all([store, category])
+        await db.flush()
+        for i in range(2):
+            product = Product(
+                barcode=f"88000000000{i}", name=f"Lock Product {i}", category_id=category.id, safety_stock=0
+            )
+            db.add(product)
+            await db.flush()
+            db.add(StockSnapshot(product_id=product.id, store_id=store.id, taken_at=SNAPSHOT_AT, quantity=10))
+            keys.append((product.id, store.id))
+        await db.commit()
+    return keys
+
+
+def _backdated_request(product_id, store_id) -> SyncRequest:
+    return SyncRequest(transactions=[
+        SyncTransactionItem(
+            localId=uuid4(),
+            type="INBOUND",
+            productId=product_id,
+            storeId=store_id,
+            quantity=3,
+            createdAt=SNAPSHOT_AT - timedelta(days=1),
+        )
+    ])
+
+
+async def test_concurrent_syncs_do_not_block_each_other(lock_engine, snapshot_keys):
+    """스냅샷 이전 시각 항목을 반영하는 두 동기화 세션은 공유 잠금이라 서로 기다리지 않는다"""
+    (product_a, store), (product_b, _) = snapshot_keys
+    async with AsyncSession(lock_engine) as first, AsyncSession(lock_engine) as second:
+        # 첫 세션은 커밋 전 (스냅샷 잠금 유지 중)
+        result = await sync_transactions(first, _backdated_request(product_a, store), commit=False)
+        assert len(result.synced) == 1
+
+        result = await asyncio.wait_for(
+            sync_transactions(second, _backdated_request(product_b, store), commit=False),
+            timeout=NOT_BLOCKED_TIMEOUT,
+        )
+        assert len(result.synced) == 1
+
+        await first.commit()
+        await second.commit()
+
+    async with AsyncSession(lock_engine) as db:
+        quantities = (await db.execute(select(StockSnapshot.quantity))).scalars().all()
+    assert sorted(quantities) == [13, 13]
+
+
+async def test_snapshot_waits_for_in_flight_sync(lock_engine, snapshot_keys):
+    """새 스냅샷(배타 잠금)은 커밋 전 동기화(공유 잠금)가 끝난 뒤 그 원장을 포함해 만들어진다"""
+    (product, store), _ = snapshot_keys
+    async with AsyncSession(lock_engine) as syncing, AsyncSession(lock_engine) as snapshotting:
+        await sync_transactions(syncing, _backdated_request(product, store), commit=False)
+
+        taking = asyncio.create_task(
+            snapshot_service.take_stock_snapshot(snapshotting, SNAPSHOT_AT + timedelta(days=1))
+        )
+        await asyncio.sleep(BLOCKED_PROBE)
+        assert not taking.done()
+
+        await syncing.commit()
+        assert await asyncio.wait_for(taking, timeout=NOT_BLOCKED_TIMEOUT) == 2
+
+    async with AsyncSession(lock_engine) as db:
+        later = await db.scalar(
+            select(StockSnapshot.quantity).where(
+                StockSnapshot.product_id == product,
+                StockSnapshot.taken_at == SNAPSHOT_AT + timedelta(days=1),
+            )
+        )
+    assert later == 13
+
+
+async def test_sync_horizon_ignores_foreign_and_stale_transactions(lock_engine):
+    """변경분 조회 상한은 이 앱의 진행 중인 트랜잭션만, 최대 지연 이내에서만 따른다"""
+    other_engine = create_async_engine(
+        LOCK_DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"server_settings": {"application_name": "psql"}},
+    )
+    try:
+        # 다른 애플리케이션의 idle in transaction 세션은 상한을 붙잡지 않음
+        async with AsyncSession(other_engine) as foreign, AsyncSession(lock_engine) as polling:
+            await foreign.execute(text("SELECT 1"))
+            assert await sync_changes._oldest_open_transaction(polling) is None
+
+        async with AsyncSession(lock_engine) as writing, AsyncSession(lock_engine) as polling:
+            started = await writing.scalar(text("SELECT now() AT TIME ZONE 'UTC'"))
+            assert await sync_changes._oldest_open_transaction(polling) == started
+
+            # 최대 지연보다 오래 열린 트랜잭션은 무시
+            await polling.rollback()
+            with patch.object(settings, "SYNC_CHANGES_MAX_HORIZON_LAG_SECONDS", 0):
+                assert await sync_changes._oldest_open_transaction(polling) is None
+    finally:
+        await other_engine.dispose()
@@ -0,0 +1,405 @@
+"""
+쿼리 실행 계획 회귀 테스트 (PostgreSQL 전용)
+
+목적:
+    목록/필터 API가 실제로 실행하는 쿼리가 인덱스를 계속 타는지 확인합니다.
+    인덱스(예: 2b423957f08f의 idx_transactions_store_created / idx_transactions_product_created)는
+    쿼리 형태가 바뀌면 조용히 쓰이지 않게 되므로, 계획이 Seq Scan으로 바뀌거나
+    예상 비용이 기준선보다 크게 늘면 실패시킵니다.
+
+실행:
+    PLAN_TEST_DATABASE_URL=postgresql+asyncpg://user:pw@localhost:5432/donedone_plans \\
+        pytest tests/integration/test_query_plans.py
+
+    - PLAN_TEST_DATABASE_URL이 없으면 모두 건너뜁니다 (기본 테스트는 SQLite)
+    - 주의: 해당 DB의 public 스키마를 지우고 init-db/*.sql + 마이그레이션(alembic upgrade head)으로
+      다시 만듭니다 (docker-compose의 DB 초기화와 같은 순서).
+      반드시 전용 DB를 지정하세요.
+    - 기준선 갱신: PLAN_BASELINE_UPDATE=1 을 함께 지정하면 query_plan_baseline.json을 다시 씁니다
+
+절차:
+    1. 초기 스키마 + 마이그레이션 적용 → generate_series로 대량 데이터 적재 → VACUUM ANALYZE
+    2. 서비스 함수를 실제로 호출하며 실행된 SELECT(드라이버 SQL + 파라미터)를 엔진 이벤트로 수집
+    3. 수집한 문장마다 EXPLAIN (FORMAT JSON) (ANALYZE 없음 → 플래너 예상 비용으로 비교)
+       - 큰 테이블에 Seq Scan이 있으면 실패 (사례별 허용 목록 제외)
+       - 사례가 기대하는 인덱스(파티션 인덱스는 부모 인덱스 이름으로)가 계획에 없으면 실패
+       - 예상 비용이 기준선 × PLAN_COST_TOLERANCE를 넘으면 실패 (기준선은 쿼리 지문별)
+       - 기준선에 없는 지문(새 쿼리, 쿼리 형태 변경)도 실패 → PLAN_BASELINE_UPDATE=1로 다시 기록해 커밋
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.query_analyzer import get_index_usage, get_missing_indexes, query_fingerprint
+from app.db.partitions import PARENT_TABLE, add_months, month_start, partition_name
+from app.services import inventory as inventory_service
+from app.services import product as product_service
+from app.services import report as report_service
+from app.services.inventory import transaction_cursor
+from app.services.sync_changes import get_changes
+
+PLAN_DATABASE_URL = os.environ.get("PLAN_TEST_DATABASE_URL")
+UPDATE_BASELINE = os.environ.get("PLAN_BASELINE_UPDATE") == "1"
+
+pytestmark = pytest.mark.skipif(
+    not PLAN_DATABASE_URL, reason="PLAN_TEST_DATABASE_URL (PostgreSQL) not set"
+)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+INIT_DB_DIR = BACKEND_DIR / "init-db"
+BASELINE_PATH = Path(__file__).with_name("query_plan_baseline.json")
+
+# 예상 비용이 기준선의 이 배수를 넘으면 실패 (통계 표본 차이로 인한 흔들림 허용)
+PLAN_COST_TOLERANCE = 1.5
+
+# Seq Scan을 허용하지 않는 큰 테이블 (파티션은 이름 접두어로 판단)
+LARGE_TABLES = ("products", "current_stocks", "inventory_transactions")
+
+# 적재 규모
+STORES = 5
+CATEGORIES = 20
+PRODUCTS = 50_000
+TRANSACTIONS = 200_000
+TRANSACTION_DAYS = 90
+
+COMPOSITE_INDEXES = {"idx_transactions_store_created", "idx_transactions_product_created"}
+
+
+# ========== 스키마 / 데이터 준비 ==========
+
+SEED_SQL = [
+    # init-db/02-sample-data.sql의 예시 데이터 제거 (적재 규모를 고정)
+    "TRUNCATE users, stores, categories, products CASCADE",
+    f"""
+    INSERT INTO stores (id, code, name, is_active, created_at)
+    SELECT gen_random_uuid(), 'ST' || lpad(i::text, 3, '0'), 'Store ' || i, true, now() AT TIME ZONE 'utc'
+    FROM generate_series(1, {STORES}) AS i
+    """,
+    f"""
+    INSERT INTO categories (id, code, name, sort_order, created_at)
+    SELECT gen_random_uuid(), 'CAT' || lpad(i::text, 3, '0'), 'Category ' || i, i, now() AT TIME ZONE 'utc'
+    FROM generate_series(1, {CATEGORIES}) AS i
+    """,
+    f"""
+    INSERT INTO products (id, barcode, name, category_id, safety_stock, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(),
+           '880' || lpad(i::text, 10, '0'),
+           'Product ' || i,
+           (SELECT id FROM categories ORDER BY sort_order OFFSET (i % {CATEGORIES}) LIMIT 1),
+           10,
+           true,
+           (now() AT TIME ZONE 'utc') - (i || ' minutes')::interval,
+           CASE WHEN i % 10 = 0 THEN now() AT TIME ZONE 'utc' END
+    FROM generate_series(1, {PRODUCTS}) AS i
+    """,
+    """
+    INSERT INTO current_stocks (product_id, store_id, quantity, status, updated_at)
+    SELECT p.id, s.id, q.quantity,
+           CASE WHEN q.quantity < 10 THEN 'LOW' WHEN q.quantity < 20 THEN 'NORMAL' ELSE 'GOOD' END,
+           (now() AT TIME ZONE 'utc') - (abs(hashtext(p.id::text || s.id::text)) % 100000 || ' seconds')::interval
+    FROM products p
+    CROSS JOIN stores s
+    CROSS JOIN LATERAL (SELECT abs(hashtext(p.barcode || s.code)) % 60 AS quantity) q
+    """,
+    f"""
+    WITH p AS (SELECT id, row_number() OVER (ORDER BY barcode) - 1 AS n FROM products),
+         s AS (SELECT id, row_number() OVER (ORDER BY code) - 1 AS n FROM stores)
+    INSERT INTO inventory_transactions (id, product_id, store_id, type, quantity, created_at, synced_at)
+    SELECT gen_random_uuid(), p.id, s.id,
+           (ARRAY['INBOUND', 'OUTBOUND'])[1 + i % 2]::transaction_type,
+           CASE WHEN i % 2 = 0 THEN 5 ELSE -1 END,
+           (now() AT TIME ZONE 'utc') - ((i % ({TRANSACTION_DAYS} * 1440)) || ' minutes')::interval,
+           CASE WHEN i % 20 = 0 THEN now() AT TIME ZONE 'utc' END
+    FROM generate_series(1, {TRANSACTIONS}) AS i
+    JOIN p ON p.n = i % {PRODUCTS}
+    JOIN s ON s.n = i % {STORES}
+    """,
+]
+
+
+def _history_partition_sql() -> list:
+    """적재할 과거 기간의 월별 파티션 (마이그레이션 시점에는 이번 달부터만 있음 → 기본 파티션에 쌓이지 않도록)"""
+    today = datetime.utcnow().date()
+    month = month_start(today - timedelta(days=TRANSACTION_DAYS))
+    statements = []
+    while month < month_start(today):
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        )
+        month = add_months(month, 1)
+    return statements
+
+
+async def _seed(url: str) -> None:
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        for sql in _history_partition_sql() + SEED_SQL:
+            await conn.execute(text(sql))
+    # 운영 DB와 같은 상태로: GIN 대기 목록(fastupdate) 반영 + 가시성 맵 + 통계
+    # (대량 적재 직후에는 GIN 인덱스 비용이 과대 추정되어 계획이 달라짐)
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
+    await engine.dispose()
+
+
+async def _reset_schema(url: str) -> None:
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+        # 마이그레이션은 초기 스크립트(docker-entrypoint-initdb.d) 결과 위에서 시작함
+        raw = (await conn.get_raw_connection()).driver_connection
+        for script in sorted(INIT_DB_DIR.glob("*.sql")):
+            await raw.execute(script.read_text(encoding="utf-8"))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def plan_database():
+    """전용 DB를 마이그레이션 최신 상태로 만들고 데이터 적재 (모듈당 1회)"""
+    asyncio.run(_reset_schema(PLAN_DATABASE_URL))
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "DATABASE_URL": PLAN_DATABASE_URL},
+        check=True,
+    )
+    asyncio.run(_seed(PLAN_DATABASE_URL))
+
+    # 갱신 모드는 처음부터 다시 기록 (사라진 쿼리의 지문이 남지 않도록)
+    baseline = {} if UPDATE_BASELINE or not BASELINE_PATH.exists() else json.loads(BASELINE_PATH.read_text())
+    yield baseline
+
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True, ensure_ascii=False) + "\n")
+
+
+@pytest.fixture
+async def plan_engine(plan_database):
+    engine = create_async_engine(PLAN_DATABASE_URL, poolclass=NullPool)
+    yield engine
+    await engine.dispose()
+
+
+# ========== 계획 분석 ==========
+
+async def _empty_relations(conn) -> set:
+    """통계상 행이 없는 테이블 (아직 데이터가 없는 미래 월 파티션 등 - Seq Scan 비용이 0)"""
+    rows = await conn.execute(text(
+        "SELECT relname FROM pg_class WHERE relkind = 'r' AND relpages = 0 AND reltuples <= 0"
+    ))
+    return {name for (name,) in rows}
+
+
+def _nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+async def _root_index_names(conn, names) -> dict:
+    """파티션 인덱스 → 부모(파티션 테이블) 인덱스 이름 (부모가 없으면 자기 자신)"""
+    roots = {}
+    for name in names:
+        parent = (await conn.execute(text(
+            "SELECT inhparent::regclass::text FROM pg_inherits WHERE inhrelid = to_regclass(:name)"
+        ), {"name": name})).scalar()
+        roots[name] = parent or name
+    return roots
+
+
+async def _explain_statements(engine, statements):
+    """(SQL, 파라미터)마다 EXPLAIN (FORMAT JSON) → (지문, SQL, 최상위 Plan)"""
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()[0]["Plan"]
+            plans.append((query_fingerprint(statement), statement, plan))
+    return plans
+
+
+async def _capture(engine, call):
+    """서비스 호출 중 실행된 SELECT 문장 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await call(db)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+# ========== 검사 대상 (서비스가 실행하는 목록/필터 쿼리) ==========
+
+async def _first_id(db, sql: str):
+    return (await db.execute(text(sql))).scalar()
+
+
+async def _store(db):
+    return await _first_id(db, "SELECT id FROM stores ORDER BY code LIMIT 1")
+
+
+async def _category(db):
+    return await _first_id(db, "SELECT id FROM categories ORDER BY sort_order LIMIT 1")
+
+
+async def _product(db):
+    return await _first_id(db, "SELECT id FROM products ORDER BY barcode OFFSET 100 LIMIT 1")
+
+
+async def _barcode_lookup(db):
+    await product_service.get_product_by_barcode(db, "8800000000123")
+
+
+async def _products_by_category(db):
+    await product_service.list_products(db, category_id=await _category(db), count="none")
+
+
+async def _products_barcode_prefix(db):
+    await product_service.list_products(db, search="88000000012", count="none")
+
+
+async def _products_barcode_substring(db):
+    await product_service.list_products(db, search="000001234", count="none")
+
+
+async def _stocks_by_store(db):
+    await inventory_service.get_current_stocks(db, store_id=await _store(db), count="none")
+
+
+async def _low_stocks_by_store(db):
+    await inventory_service.get_current_stocks(db, store_id=await _store(db), status="LOW", count="none")
+
+
+async def _transactions_by_store(db):
+    store_id = await _store(db)
+    items, _ = await inventory_service.list_transactions(db, store_id=store_id, count="none")
+    await inventory_service.list_transactions(
+        db, store_id=store_id, cursor=transaction_cursor(items[-1]), count="none"
+    )
+
+
+async def _transactions_by_product(db):
+    product_id = await _product(db)
+    items, _ = await inventory_service.list_transactions(db, product_id=product_id, count="none")
+    await inventory_service.list_transactions(
+        db, product_id=product_id, cursor=transaction_cursor(items[-1]), count="none"
+    )
+
+
+async def _transactions_by_store_period(db):
+    end = datetime.utcnow()
+    await inventory_service.list_transactions(
+        db, store_id=await _store(db), start=end - timedelta(days=7), end=end, count="none"
+    )
+
+
+async def _low_stock_report(db):
+    await report_service.get_low_stock_items(db, store_id=await _store(db), limit=50)
+
+
+async def _changes_since(db):
+    _, _, _, token, _ = await get_changes(db, limit=100)
+    await get_changes(db, since=token, limit=100)
+
+
+# (이름, 호출, Seq Scan 허용 테이블, 계획에 있어야 할 인덱스)
+PLAN_CASES = [
+    ("barcode_lookup", _barcode_lookup, set(), set()),
+    ("products_by_category", _products_by_category, set(), {"idx_products_category_id"}),
+    ("products_barcode_prefix", _products_barcode_prefix, set(), {"idx_products_barcode_prefix"}),
+    ("products_barcode_substring", _products_barcode_substring, set(), {"idx_products_barcode_trgm"}),
+    ("stocks_by_store", _stocks_by_store, set(), set()),
+    ("low_stocks_by_store", _low_stocks_by_store, set(), set()),
+    ("transactions_by_store", _transactions_by_store, set(), {"idx_transactions_store_created"}),
+    ("transactions_by_product", _transactions_by_product, set(), {"idx_transactions_product_created"}),
+    ("transactions_by_store_period", _transactions_by_store_period, set(), {"idx_transactions_store_created"}),
+    # 매장의 LOW 재고 행(전체 제품의 약 15%)에 제품을 붙이므로 products는 해시 조인용 전체 읽기가 더 싸다
+    ("low_stock_report", _low_stock_report, {"products"}, {"idx_current_stocks_low"}),
+    ("changes_since", _changes_since, set(), set()),
+]
+
+
+@pytest.mark.parametrize(
+    "name, call, allowed_seq_scans, expected_indexes",
+    PLAN_CASES,
+    ids=[case[0] for case in PLAN_CASES],
+)
+async def test_query_plan(plan_engine, plan_database, name, call, allowed_seq_scans, expected_indexes):
+    statements = await _capture(plan_engine, call)
+    assert statements, f"{name}: no SELECT captured"
+    plans = await _explain_statements(plan_engine, statements)
+
+    baseline = plan_database.setdefault(name, {})
+    async with plan_engine.connect() as conn:
+        empty = await _empty_relations(conn)
+    used_indexes = set()
+    problems = []
+    for fingerprint, statement, plan in plans:
+        nodes = list(_nodes(plan))
+        for node in nodes:
+            relation = node.get("Relation Name", "")
+            if (
+                node["Node Type"] == "Seq Scan"
+                and relation.startswith(LARGE_TABLES)
+                and relation not in empty
+                and not any(relation.startswith(t) for t in allowed_seq_scans)
+            ):
+                problems.append(f"Seq Scan on {relation}: {statement[:200]}")
+        used_indexes |= {node["Index Name"] for node in nodes if "Index Name" in node}
+
+        cost = plan["Total Cost"]
+        if UPDATE_BASELINE:
+            baseline[fingerprint] = cost
+        elif fingerprint not in baseline:
+            problems.append(
+                f"no baseline cost (rerun with PLAN_BASELINE_UPDATE=1): {fingerprint} {statement[:200]}"
+            )
+        elif cost > baseline[fingerprint] * PLAN_COST_TOLERANCE:
+            problems.append(
+                f"cost {cost:.1f} > baseline {baseline[fingerprint]:.1f} x {PLAN_COST_TOLERANCE}: {statement[:200]}"
+            )
+
+    async with plan_engine.connect() as conn:
+        roots = set((await _root_index_names(conn, used_indexes)).values())
+    missing = expected_indexes - roots
+    if missing:
+        problems.append(f"expected indexes not used: {sorted(missing)} (used: {sorted(roots)})")
+
+    assert not problems, f"{name}:\n" + "\n".join(problems)
+
+
+async def test_composite_indexes_present_and_no_missing_index_hints(plan_engine):
+    """
+    2b423957f08f의 복합 인덱스가 (파티션마다) 존재하고,
+    위 쿼리들을 실행한 뒤 큰 테이블이 인덱스 추천(Seq Scan 과다) 대상이 아닌지 확인
+    """
+    async with AsyncSession(plan_engine) as db:
+        usage = await get_index_usage(db)
+        async with plan_engine.connect() as conn:
+            roots = await _root_index_names(conn, [row["indexname"] for row in usage])
+        assert COMPOSITE_INDEXES <= set(roots.values())
+
+        flagged = [
+            row["table_name"] for row in await get_missing_indexes(db)
+            if row["table_name"].startswith(LARGE_TABLES)
+        ]
+        assert not flagged, f"tables with seq scans outnumbering index scans: {flagged}"
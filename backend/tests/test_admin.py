@@ -40,7 +40,7 @@ async def admin_data(db_session, sample_category_data):
     
     await db_session.commit()
     
-    return {"admin": admin, "worker": worker, "low_product": p1}
+    return {"admin": admin, "worker": worker, "low_product": p1, "store": store}
 
 @pytest.mark.asyncio
 async def test_get_low_stock_admin(client: AsyncClient, db_session: AsyncSession, admin_data):
@@ -80,3 +80,107 @@ async def test_export_low_stock(client: AsyncClient, db_session: AsyncSession, a
     assert res.headers["content-type"] == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     
     app.dependency_overrides.pop(get_current_user)
+
+@pytest.mark.asyncio
+async def test_export_low_stock_content(client: AsyncClient, db_session: AsyncSession, admin_data):
+    """엑셀 파일에 헤더와 안전재고 미달 행만 기록된다"""
+    from io import BytesIO
+    from openpyxl import load_workbook
+
+    res = await client.get("/api/v1/exports/low-stock")
+    assert res.status_code == 200
+
+    ws = load_workbook(BytesIO(res.content)).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert rows == [
+        ("제품명", "바코드", "매장명", "현재고", "안전재고", "부족수량"),
+        ("LowP", "1", "Store1", 5, 10, 5),
+    ]
+
+@pytest.mark.asyncio
+async def test_export_low_stock_csv_and_ndjson(client: AsyncClient, db_session: AsyncSession, admin_data):
+    import json
+
+    res = await client.get("/api/v1/exports/low-stock", params={"format": "csv"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    assert res.text.splitlines() == [
+        "productName,barcode,storeName,currentStock,safetyStock,shortage",
+        "LowP,1,Store1,5,10,5",
+    ]
+
+    res = await client.get("/api/v1/exports/low-stock", params={"format": "ndjson"})
+    assert res.status_code == 200
+    assert [json.loads(line) for line in res.text.splitlines()] == [
+        {"productName": "LowP", "barcode": "1", "storeName": "Store1",
+         "currentStock": 5, "safetyStock": 10, "shortage": 5},
+    ]
+
+@pytest.mark.asyncio
+async def test_export_transactions_ledger_filters(client: AsyncClient, db_session: AsyncSession, admin_data):
+    """기간(start <= createdAt < end)과 매장 필터가 적용되고 시간순으로 내보낸다"""
+    import json
+    from datetime import datetime
+    from app.models.transaction import InventoryTransaction, TransactionType
+
+    product = admin_data["low_product"]
+    store1 = admin_data["store"]
+    store2 = Store(id=uuid4(), code="S2", name="Store2")
+    db_session.add(store2)
+    await db_session.flush()
+
+    def tx(store, day, qty):
+        return InventoryTransaction(
+            id=uuid4(), product_id=product.id, store_id=store.id,
+            type=TransactionType.INBOUND, quantity=qty, created_at=datetime(2026, 3, day, 9),
+        )
+    db_session.add_all([tx(store1, 2, 3), tx(store1, 1, 1), tx(store2, 1, 7), tx(store1, 5, 9)])
+    await db_session.commit()
+
+    res = await client.get("/api/v1/exports/transactions", params={
+        "start": "2026-03-01T00:00:00", "end": "2026-03-05T00:00:00",
+        "store_id": str(store1.id), "format": "ndjson",
+    })
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [r["quantity"] for r in rows] == [1, 3]
+    assert rows[0]["createdAt"] == "2026-03-01T09:00:00"
+    assert rows[0]["storeCode"] == "S1"
+    assert rows[0]["barcode"] == "1"
+    assert rows[0]["type"] == "INBOUND"
+
+    res = await client.get("/api/v1/exports/transactions")
+    assert res.status_code == 200
+    assert len(res.text.splitlines()) == 1 + 4  # 헤더 + 전체
+
+    res = await client.get("/api/v1/exports/transactions", params={
+        "start": "2026-03-05T00:00:00", "end": "2026-03-01T00:00:00",
+    })
+    assert res.status_code == 400
+
+@pytest.mark.asyncio
+async def test_get_low_stock_ordered_filtered_paginated(client: AsyncClient, db_session: AsyncSession, admin_data):
+    """부족 수량 큰 순 정렬, 매장 필터, limit/page 페이징"""
+    store1 = admin_data["store"]
+    store2 = Store(id=uuid4(), code="S2", name="Store2")
+    p3 = Product(id=uuid4(), barcode="3", name="VeryLowP",
+                 category_id=admin_data["low_product"].category_id, safety_stock=10)
+    db_session.add_all([store2, p3])
+    await db_session.flush()
+    db_session.add_all([
+        CurrentStock(product_id=p3.id, store_id=store1.id, quantity=1),   # 부족 9
+        CurrentStock(product_id=p3.id, store_id=store2.id, quantity=8),   # 부족 2
+    ])
+    await db_session.commit()
+
+    res = await client.get("/api/v1/alerts/low-stock")
+    assert [(i["product"]["name"], i["shortage"]) for i in res.json()] == [
+        ("VeryLowP", 9), ("LowP", 5), ("VeryLowP", 2),
+    ]
+
+    res = await client.get("/api/v1/alerts/low-stock", params={"store_id": str(store2.id)})
+    assert [i["store"]["code"] for i in res.json()] == ["S2"]
+
+    res = await client.get("/api/v1/alerts/low-stock", params={"limit": 2, "page": 2})
+    assert [i["shortage"] for i in res.json()] == [2]
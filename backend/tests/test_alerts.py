@@ -0,0 +1,100 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+from app.core.config import settings
+from app.models.product import Product
+from app.models.store import Store
+from app.models.category import Category
+from app.models.stock import CurrentStock
+from app.schemas.transaction import InboundTransactionCreate, OutboundTransactionCreate
+from app.services import alerts as alert_service
+from app.services import inventory as inventory_service
+from app.services.alerts import AlertDispatcher, InMemoryAlertSink, LowStockAlert
+from tests.conftest import TestSessionLocal
+
+@pytest.fixture
+async def setup_data(db_session, sample_category_data):
+    cat = Category(**sample_category_data)
+    db_session.add(cat)
+    await db_session.flush()
+
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    prod = Product(id=uuid4(), barcode="888", name="Prod", category_id=cat.id, safety_stock=10)
+    db_session.add_all([store, prod])
+    await db_session.flush()
+    db_session.add(CurrentStock(product_id=prod.id, store_id=store.id, quantity=12))
+    await db_session.commit()
+
+    return {"store": store, "product": prod}
+
+@pytest.fixture
+async def dispatcher():
+    dispatcher = AlertDispatcher(TestSessionLocal, sink=InMemoryAlertSink(), cooldown_minutes=60)
+    with patch.object(settings, "LOW_STOCK_ALERT_ENABLED", True), \
+            patch.object(alert_service, "_dispatcher", dispatcher):
+        yield dispatcher
+    await dispatcher.stop()
+
+def _outbound(data, qty):
+    return OutboundTransactionCreate(productId=data["product"].id, storeId=data["store"].id, quantity=qty)
+
+def _inbound(data, qty):
+    return InboundTransactionCreate(productId=data["product"].id, storeId=data["store"].id, quantity=qty)
+
+@pytest.mark.asyncio
+async def test_alert_sent_once_on_crossing_below_safety_stock(db_session: AsyncSession, setup_data, dispatcher):
+    """안전재고 미만으로 내려갈 때만 알림이 나가고, 재알림 간격 안에서는 다시 보내지 않는다"""
+    await inventory_service.process_outbound(db_session, _outbound(setup_data, 1))   # 11: 충분
+    await inventory_service.process_outbound(db_session, _outbound(setup_data, 3))   # 8: 미달 진입
+    await inventory_service.process_outbound(db_session, _outbound(setup_data, 2))   # 6: 이미 미달
+    await dispatcher.drain()
+
+    alerts = dispatcher.sink.alerts
+    assert [(a.product_id, a.quantity, a.safety_stock) for a in alerts] == [
+        (setup_data["product"].id, 8, 10),
+    ]
+    last_alerted_at = await db_session.scalar(
+        select(CurrentStock.last_alerted_at).where(CurrentStock.product_id == setup_data["product"].id)
+    )
+    assert last_alerted_at is not None
+
+    # 회복 후 다시 미달 진입 → 재알림 간격(60분) 안이므로 전달하지 않음
+    await inventory_service.process_inbound(db_session, _inbound(setup_data, 10))    # 16
+    await inventory_service.process_outbound(db_session, _outbound(setup_data, 10))  # 6
+    await dispatcher.drain()
+    assert len(dispatcher.sink.alerts) == 1
+
+@pytest.mark.asyncio
+async def test_rolled_back_change_is_not_alerted(db_session: AsyncSession, setup_data, dispatcher):
+    await inventory_service.apply_stock_delta(db_session, setup_data["product"].id, setup_data["store"].id, -5)
+    await db_session.rollback()
+    await dispatcher.drain()
+
+    assert dispatcher.sink.alerts == []
+
+@pytest.mark.asyncio
+async def test_dispatch_dedupes_and_releases_claim_on_sink_failure(db_session: AsyncSession, setup_data):
+    """배치 안 중복은 1건으로 합치고, 전달 실패 시 선점(last_alerted_at)을 해제한다"""
+    await inventory_service.apply_stock_delta(db_session, setup_data["product"].id, setup_data["store"].id, -5)
+    await db_session.commit()
+    key = (setup_data["product"].id, setup_data["store"].id)
+
+    class FailingSink:
+        async def send(self, alerts):
+            raise RuntimeError("webhook down")
+
+    failing = AlertDispatcher(TestSessionLocal, sink=FailingSink(), cooldown_minutes=60)
+    with pytest.raises(RuntimeError):
+        await failing.dispatch([LowStockAlert(*key, 7, 10)])
+
+    last_alerted_at = await db_session.scalar(
+        select(CurrentStock.last_alerted_at).where(CurrentStock.product_id == key[0])
+    )
+    assert last_alerted_at is None
+
+    ok = AlertDispatcher(TestSessionLocal, sink=InMemoryAlertSink(), cooldown_minutes=60)
+    sent = await ok.dispatch([LowStockAlert(*key, 9, 10), LowStockAlert(*key, 7, 10)])
+    assert len(sent) == 1
+    assert sent[0].quantity == 7  # 현재 재고 기준
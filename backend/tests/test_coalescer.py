@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+from app.models.product import Product
+from app.models.store import Store
+from app.models.category import Category
+from app.models.stock import CurrentStock
+from app.models.transaction import InventoryTransaction, TransactionType
+from app.services import inventory as inventory_service
+from app.services.coalescer import StockWriteCoalescer
+from app.services.inventory import StockMutation
+from tests.conftest import TestSessionLocal
+
+@pytest.fixture
+async def setup_data(db_session, sample_category_data):
+    cat = Category(**sample_category_data)
+    db_session.add(cat)
+    await db_session.flush()
+
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    prod = Product(id=uuid4(), barcode="888", name="Prod", category_id=cat.id, safety_stock=10)
+    db_session.add_all([store, prod])
+    db_session.add(CurrentStock(product_id=prod.id, store_id=store.id, quantity=12))
+    await db_session.commit()
+
+    return {"store": store, "product": prod}
+
+def _outbound(data, qty):
+    return StockMutation(
+        product_id=data["product"].id,
+        store_id=data["store"].id,
+        type=TransactionType.OUTBOUND,
+        quantity=-qty,
+    )
+
+@pytest.mark.asyncio
+async def test_coalescer_applies_window_as_one_batch(db_session: AsyncSession, setup_data):
+    """윈도우 안의 요청은 한 번의 배치로 반영되고, 각자 자신의 결과를 받는다"""
+    coalescer = StockWriteCoalescer(TestSessionLocal, window_ms=20, max_batch=100)
+
+    with patch.object(
+        inventory_service, "apply_mutation_batch", wraps=inventory_service.apply_mutation_batch
+    ) as batch_spy:
+        results = await asyncio.gather(
+            *(coalescer.submit(_outbound(setup_data, 3)) for _ in range(5))
+        )
+
+    assert batch_spy.call_count == 1
+    # 12 → 9 → 6 → 3 → 0 → 부족
+    assert [r.new_stock for r in results[:4]] == [9, 6, 3, 0]
+    assert [r.safety_alert for r in results[:4]] == [True, True, True, True]
+    assert results[4].error == "Not enough stock. Current: 0, Requested: 3"
+
+    qty = await db_session.scalar(
+        select(CurrentStock.quantity).where(CurrentStock.product_id == setup_data["product"].id)
+    )
+    tx_count = await db_session.scalar(select(func.count()).select_from(InventoryTransaction))
+    assert qty == 0
+    assert tx_count == 4
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_at_max_batch(db_session: AsyncSession, setup_data):
+    """버퍼가 max_batch에 도달하면 윈도우를 기다리지 않고 반영한다"""
+    coalescer = StockWriteCoalescer(TestSessionLocal, window_ms=60_000, max_batch=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(coalescer.submit(_outbound(setup_data, 1)) for _ in range(2))),
+        timeout=5,
+    )
+
+    assert [r.new_stock for r in results] == [11, 10]
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_buffered_writes(db_session: AsyncSession, setup_data):
+    """앱 종료 시 윈도우가 끝나기 전의 버퍼도 반영되고, 대기 중인 호출자는 결과를 받는다"""
+    from app.services import coalescer as coalescer_module
+    from app.services.coalescer import shutdown_coalescer
+
+    coalescer = StockWriteCoalescer(TestSessionLocal, window_ms=60_000, max_batch=100)
+    with patch.object(coalescer_module, "_coalescer", coalescer):
+        pending = asyncio.create_task(coalescer.submit(_outbound(setup_data, 2)))
+        await asyncio.sleep(0)
+        await shutdown_coalescer()
+        result = await asyncio.wait_for(pending, timeout=1)
+
+    assert result.new_stock == 10
+    qty = await db_session.scalar(
+        select(CurrentStock.quantity).where(CurrentStock.product_id == setup_data["product"].id)
+    )
+    assert qty == 10
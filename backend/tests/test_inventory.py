@@ -190,3 +190,193 @@ async def test_get_product_stock_detail(client: AsyncClient, db_session: AsyncSe
     assert data["totalQuantity"] == 35 # 5 + 30
 
     app.dependency_overrides.pop(get_current_user)
+
+@pytest.mark.asyncio
+async def test_list_stocks_cursor_pagination(client: AsyncClient, db_session: AsyncSession, sample_category_data):
+    # Given: 같은 매장, 제품 5개
+    cat = Category(**sample_category_data)
+    db_session.add(cat)
+    await db_session.flush()
+
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    db_session.add(store)
+    await db_session.flush()
+
+    products = [
+        Product(id=uuid4(), barcode=str(i), name=f"P{i}", category_id=cat.id, safety_stock=10)
+        for i in range(5)
+    ]
+    db_session.add_all(products)
+    await db_session.flush()
+    db_session.add_all([CurrentStock(product_id=p.id, store_id=store.id, quantity=1) for p in products])
+    await db_session.commit()
+
+    # When: 커서를 따라 2개씩 조회
+    seen = []
+    cursor = None
+    for _ in range(3):
+        url = "/api/v1/inventory/stocks?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        res = await client.get(url)
+        assert res.status_code == 200
+        body = res.json()
+        seen += [item["product"]["id"] for item in body["items"]]
+        assert body["pagination"]["total"] == 5
+        cursor = body["pagination"]["nextCursor"]
+
+    # Then: 중복/누락 없이 PK 순서대로, 마지막 페이지는 nextCursor 없음
+    assert seen == sorted(str(p.id) for p in products)
+    assert cursor is None
+
+    res = await client.get("/api/v1/inventory/stocks?cursor=not-a-cursor")
+    assert res.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_stocks_count_modes(client: AsyncClient, db_session: AsyncSession, sample_category_data):
+    cat = Category(**sample_category_data)
+    db_session.add(cat)
+    await db_session.flush()
+
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    prod = Product(id=uuid4(), barcode="888", name="Prod", category_id=cat.id, safety_stock=10)
+    db_session.add_all([store, prod])
+    await db_session.flush()
+    db_session.add(CurrentStock(product_id=prod.id, store_id=store.id, quantity=3))
+    await db_session.commit()
+
+    # none: 건수 생략
+    res = await client.get("/api/v1/inventory/stocks?count=none")
+    assert res.status_code == 200
+    pagination = res.json()["pagination"]
+    assert pagination["total"] is None
+    assert pagination["totalPages"] is None
+    assert len(res.json()["items"]) == 1
+
+    # estimate: 추정을 지원하지 않는 SQLite에서는 exact로 계산
+    res = await client.get("/api/v1/inventory/stocks?count=estimate")
+    assert res.json()["pagination"]["total"] == 1
+
+    res = await client.get("/api/v1/inventory/stocks?count=bogus")
+    assert res.status_code == 422
+
+@pytest.mark.asyncio
+async def test_stock_status_column_maintained(db_session: AsyncSession, sample_category_data):
+    """current_stocks.status는 재고 변경 문장과 안전재고 변경 시 함께 갱신된다"""
+    from sqlalchemy import select
+    from app.models.transaction import TransactionType
+    from app.services import inventory as inventory_service
+    from app.services.inventory import StockMutation
+
+    cat = Category(**sample_category_data)
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    db_session.add_all([cat, store])
+    await db_session.flush()
+    p1 = Product(id=uuid4(), barcode="1", name="P1", category_id=cat.id, safety_stock=10)
+    p2 = Product(id=uuid4(), barcode="2", name="P2", category_id=cat.id, safety_stock=10)
+    db_session.add_all([p1, p2])
+    await db_session.flush()
+    db_session.add(CurrentStock(product_id=p1.id, store_id=store.id, quantity=25))  # ORM 저장
+    await db_session.commit()
+
+    async def status_of(product):
+        return await db_session.scalar(
+            select(CurrentStock.status).where(CurrentStock.product_id == product.id)
+        )
+
+    assert await status_of(p1) == "GOOD"
+
+    # 단건 원자적 변경 (UPDATE / INSERT ... ON CONFLICT)
+    await inventory_service.apply_stock_delta(db_session, p1.id, store.id, -12)   # 13
+    await inventory_service.apply_stock_delta(db_session, p2.id, store.id, 4)     # 신규 4
+    assert await status_of(p1) == "NORMAL"
+    assert await status_of(p2) == "LOW"
+
+    # 배치 변경
+    await inventory_service.apply_mutation_batch(db_session, [
+        StockMutation(product_id=p1.id, store_id=store.id, type=TransactionType.OUTBOUND, quantity=-5),
+        StockMutation(product_id=p2.id, store_id=store.id, type=TransactionType.INBOUND, quantity=30),
+    ])
+    await db_session.commit()
+    assert await status_of(p1) == "LOW"     # 8 < 10
+    assert await status_of(p2) == "GOOD"    # 34 >= 20
+
+    # 안전재고 변경 → 해당 제품 재고 행 재계산
+    p1.safety_stock = 4
+    await db_session.commit()
+    assert await status_of(p1) == "GOOD"    # 8 >= 8
+
+@pytest.mark.asyncio
+async def test_stocks_as_of_matches_ledger(client: AsyncClient, db_session: AsyncSession, sample_category_data):
+    """과거 시점 재고는 스냅샷 기준으로 계산해도 원장 전체 합산과 같고, 뒤늦은 동기화도 반영된다"""
+    from datetime import datetime
+    from app.models.transaction import InventoryTransaction, TransactionType
+    from app.services import inventory as inventory_service
+    from app.services import snapshot as snapshot_service
+    from app.services.inventory import StockMutation
+
+    cat = Category(**sample_category_data)
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    db_session.add_all([cat, store])
+    await db_session.flush()
+    prod = Product(id=uuid4(), barcode="1", name="P1", category_id=cat.id, safety_stock=10)
+    db_session.add(prod)
+    await db_session.flush()
+
+    ledger = [(datetime(2026, 1, 1, 10), 10), (datetime(2026, 1, 2, 10), -3),
+              (datetime(2026, 1, 3, 10), 5), (datetime(2026, 1, 4, 10), -2)]
+    db_session.add_all([
+        InventoryTransaction(product_id=prod.id, store_id=store.id, type=TransactionType.ADJUST,
+                             quantity=qty, reason="CORRECTION", created_at=created_at)
+        for created_at, qty in ledger
+    ])
+    await db_session.commit()
+
+    assert await snapshot_service.take_stock_snapshot(db_session, datetime(2026, 1, 2)) == 1
+    assert await snapshot_service.take_stock_snapshot(db_session, datetime(2026, 1, 4)) == 1
+    assert await snapshot_service.take_stock_snapshot(db_session, datetime(2026, 1, 3)) == 0  # 과거로는 생성 안 함
+
+    # 스냅샷 이전 시각의 오프라인 트랜잭션이 뒤늦게 동기화됨
+    late = StockMutation(product_id=prod.id, store_id=store.id, type=TransactionType.INBOUND,
+                         quantity=4, created_at=datetime(2026, 1, 1, 12))
+    await inventory_service.apply_mutation_batch(db_session, [late])
+    assert await snapshot_service.adjust_snapshots(db_session, [late]) == 1
+    await db_session.commit()
+    ledger.append((late.created_at, late.quantity))
+
+    for at in [datetime(2026, 1, 1, 9), datetime(2026, 1, 1, 12), datetime(2026, 1, 2, 11),
+               datetime(2026, 1, 3, 12), datetime(2026, 1, 5)]:
+        _, rows = await snapshot_service.get_stocks_as_of(db_session, at, store.id)
+        assert [q for _, _, q in rows] == [sum(q for c, q in ledger if c <= at)], at
+
+    res = await client.get(
+        f"/api/v1/inventory/stocks/as-of?at=2026-01-03T12:00:00Z&store_id={store.id}&product_id={prod.id}"
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["snapshotAt"] == "2026-01-04T00:00:00"
+    assert [(i["product"]["id"], i["quantity"]) for i in body["items"]] == [(str(prod.id), 16)]
+
+@pytest.mark.asyncio
+async def test_snapshot_and_adjust_take_snapshot_lock(db_session: AsyncSession):
+    """스냅샷 생성(배타)과 뒤늦은 트랜잭션 반영(공유)은 스냅샷 최신 시각을 읽기 전에 같은 잠금을 잡는다"""
+    from datetime import datetime
+    from unittest.mock import patch
+    from app.models.transaction import TransactionType
+    from app.services import snapshot as snapshot_service
+    from app.services.inventory import StockMutation
+
+    calls = []
+
+    async def fake_lock(db, shared=False):
+        calls.append("shared" if shared else "exclusive")
+
+    async def fake_latest(db):
+        calls.append("latest")
+        return datetime(2026, 1, 2)
+
+    late = StockMutation(product_id=uuid4(), store_id=uuid4(), type=TransactionType.INBOUND,
+                         quantity=1, created_at=datetime(2026, 1, 3))
+    with patch.object(snapshot_service, "_lock_snapshots", fake_lock), \
+            patch.object(snapshot_service, "latest_snapshot_at", fake_latest):
+        assert await snapshot_service.take_stock_snapshot(db_session, datetime(2026, 1, 1)) == 0
+        assert await snapshot_service.adjust_snapshots(db_session, [late]) == 0
+    assert calls == ["exclusive", "latest", "shared", "latest"]
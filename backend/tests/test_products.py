@@ -33,6 +33,33 @@ async def test_get_product_by_barcode_success(client: AsyncClient, db_session: A
     assert data["barcode"] == product.barcode
     assert data["name"] == product.name
 
+@pytest.mark.asyncio
+async def test_get_product_by_barcode_cache_invalidated_on_update(client: AsyncClient, db_session: AsyncSession, sample_product_data, sample_category_data):
+    from app.services.product import barcode_cache
+
+    # Given: 한 번 조회하여 캐시된 제품
+    db_session.add(Category(**sample_category_data))
+    await db_session.flush()
+    product = Product(**sample_product_data)
+    db_session.add(product)
+    await db_session.commit()
+
+    url = f"/api/v1/products/barcode/{product.barcode}"
+    first = await client.get(url)
+    second = await client.get(url)
+    assert first.json() == second.json()
+    assert barcode_cache.stats()["hits"] == 1
+    assert first.json()["safetyStock"] == product.safety_stock
+
+    # When: 제품 수정 후 커밋
+    product.name = "이름 변경"
+    await db_session.commit()
+
+    # Then: 이전 응답이 아닌 변경된 값 반환
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.json()["name"] == "이름 변경"
+
 @pytest.mark.asyncio
 async def test_get_product_by_barcode_not_found(client: AsyncClient):
     # When: 존재하지 않는 바코드로 조회
@@ -94,6 +121,53 @@ async def test_list_products_filter(client: AsyncClient, db_session: AsyncSessio
     assert res2.status_code == 200
     assert len(res2.json()["items"]) == 2  # p1, p2
 
+@pytest.mark.asyncio
+async def test_list_products_search_barcode_prefix_and_rank(client: AsyncClient, db_session: AsyncSession):
+    """숫자 검색어는 바코드 접두어로 찾고, 바코드 일치 → 이름 접두어 일치 순으로 정렬한다"""
+    cat = Category(id=uuid4(), code="CAT1", name="카테고리1", sort_order=1)
+    db_session.add(cat)
+    await db_session.flush()
+
+    db_session.add_all([
+        Product(barcode="9990880", name="세럼 880", category_id=cat.id),      # 이름 중간 일치
+        Product(barcode="8801001", name="토너", category_id=cat.id),           # 바코드 접두어
+        Product(barcode="7770001", name="880 크림", category_id=cat.id),      # 이름 접두어
+        Product(barcode="5550001", name="50% 세일 세트", category_id=cat.id),
+    ])
+    await db_session.commit()
+
+    res = await client.get("/api/v1/products?search=880")
+    assert res.status_code == 200
+    assert [p["barcode"] for p in res.json()["items"]] == ["8801001", "7770001", "9990880"]
+    assert res.json()["pagination"]["total"] == 3
+
+    # LIKE 와일드카드는 문자 그대로 검색
+    res = await client.get("/api/v1/products", params={"search": "0%"})
+    assert [p["barcode"] for p in res.json()["items"]] == ["5550001"]
+
+
+@pytest.mark.asyncio
+async def test_list_products_search_barcode_substring(client: AsyncClient, db_session: AsyncSession):
+    """바코드 중간 일치와 숫자가 아닌 바코드도 검색된다"""
+    cat = Category(id=uuid4(), code="CAT1", name="카테고리1", sort_order=1)
+    db_session.add(cat)
+    await db_session.flush()
+
+    db_session.add_all([
+        Product(barcode="8801234567", name="토너", category_id=cat.id),
+        Product(barcode="SKU-ab-001", name="로션", category_id=cat.id),
+        Product(barcode="9990001", name="크림", category_id=cat.id),
+    ])
+    await db_session.commit()
+
+    # 숫자 검색어: 바코드 중간 자릿수 일치
+    res = await client.get("/api/v1/products?search=2345")
+    assert [p["barcode"] for p in res.json()["items"]] == ["8801234567"]
+
+    # 숫자가 아닌 바코드: 대소문자 무시 부분 일치
+    res = await client.get("/api/v1/products?search=AB-0")
+    assert [p["barcode"] for p in res.json()["items"]] == ["SKU-ab-001"]
+
 @pytest.mark.asyncio
 async def test_create_product_admin(client: AsyncClient, db_session: AsyncSession, sample_category_data):
     # Given: 관리자 권한 Mocking
@@ -173,3 +247,34 @@ async def test_create_product_duplicate_barcode(client: AsyncClient, db_session:
 
     # Clean up
     app.dependency_overrides.pop(get_current_user)
+
+@pytest.mark.asyncio
+async def test_get_products_by_barcodes_batch(client: AsyncClient, db_session: AsyncSession, sample_category_data):
+    from app.core.query_analyzer import QueryCounter
+
+    cat = Category(**sample_category_data)
+    db_session.add(cat)
+    await db_session.flush()
+    db_session.add_all([
+        Product(barcode=f"88000000000{i:02d}", name=f"제품{i}", category_id=cat.id)
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    # 캐시된 1건 + DB 조회 2건 + 없는 바코드 1건 (+ 중복)
+    await client.get("/api/v1/products/barcode/8800000000000")
+    barcodes = ["8800000000002", "8800000000000", "9999999999999", "8800000000001", "8800000000002"]
+
+    async with QueryCounter(db_session) as counter:
+        response = await client.post("/api/v1/products/barcode:batch", json={"barcodes": barcodes})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["barcode"] for item in data["items"]] == ["8800000000002", "8800000000000", "8800000000001"]
+    assert data["missing"] == ["9999999999999"]
+    assert counter.count == 1  # 캐시에 없는 바코드는 한 번의 IN 쿼리로 조회
+
+    # 빈 목록 / 상한 초과는 422
+    assert (await client.post("/api/v1/products/barcode:batch", json={"barcodes": []})).status_code == 422
+    too_many = {"barcodes": [str(i) for i in range(101)]}
+    assert (await client.post("/api/v1/products/barcode:batch", json=too_many)).status_code == 422
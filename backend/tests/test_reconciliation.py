@@ -0,0 +1,118 @@
+import pytest
+from datetime import date, datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+from app.models.product import Product
+from app.models.store import Store
+from app.models.category import Category
+from app.models.stock import CurrentStock
+from app.models.archived_partition import ArchivedPartition
+from app.models.reconciliation import ReconciliationRun
+from app.models.transaction import InventoryTransaction, TransactionType
+from app.services import snapshot as snapshot_service
+from app.services.reconciliation import LedgerArchivedError, reconcile_stocks
+
+@pytest.fixture
+async def ledger_data(db_session, sample_category_data):
+    """
+    p1: 원장 10+5, 캐시 15 (정상)
+    p2: 원장 20-4, 캐시 20 (불일치)
+    p3: 원장 7, 캐시 행 없음 (불일치)
+    스냅샷은 1/2 00:00 (p1의 +10, p2의 +20까지 반영)
+    """
+    cat = Category(**sample_category_data)
+    store = Store(id=uuid4(), code="S1", name="Store1")
+    db_session.add_all([cat, store])
+    await db_session.flush()
+    products = [
+        Product(id=uuid4(), barcode=str(i), name=f"P{i}", category_id=cat.id, safety_stock=5)
+        for i in range(1, 4)
+    ]
+    db_session.add_all(products)
+    await db_session.flush()
+    p1, p2, p3 = products
+
+    def tx(product, qty, day):
+        return InventoryTransaction(product_id=product.id, store_id=store.id, type=TransactionType.ADJUST,
+                                    quantity=qty, reason="CORRECTION", created_at=datetime(2026, 1, day, 10))
+
+    db_session.add_all([tx(p1, 10, 1), tx(p2, 20, 1), tx(p1, 5, 2), tx(p2, -4, 2), tx(p3, 7, 2)])
+    db_session.add_all([
+        CurrentStock(product_id=p1.id, store_id=store.id, quantity=15),
+        CurrentStock(product_id=p2.id, store_id=store.id, quantity=20),
+    ])
+    await db_session.commit()
+    await snapshot_service.take_stock_snapshot(db_session, datetime(2026, 1, 2))
+    return {"store": store, "products": products}
+
+async def _quantities(db_session, store):
+    rows = await db_session.execute(
+        select(CurrentStock.product_id, CurrentStock.quantity).where(CurrentStock.store_id == store.id)
+    )
+    return dict(rows.all())
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("full", [False, True])
+async def test_reconcile_reports_then_repairs_drift(db_session: AsyncSession, ledger_data, full):
+    """스냅샷 기준(증분)/전체 원장 모두 같은 불일치를 찾고, 보정 후 다시 돌리면 불일치가 없다"""
+    p1, p2, p3 = ledger_data["products"]
+
+    run, drifts = await reconcile_stocks(db_session, full=full, chunk_size=1)
+    assert run.basis_at == (None if full else datetime(2026, 1, 2))
+    assert run.checked_count == 2
+    assert run.finished_at is not None
+    assert {(d.product_id, d.cached, d.expected) for d in drifts} == {(p2.id, 20, 16), (p3.id, None, 7)}
+    assert await _quantities(db_session, ledger_data["store"]) == {p1.id: 15, p2.id: 20}  # 보고만
+
+    run, _ = await reconcile_stocks(db_session, repair=True, full=full, chunk_size=1)
+    assert (run.drift_count, run.repaired_count) == (2, 2)
+    assert await _quantities(db_session, ledger_data["store"]) == {p1.id: 15, p2.id: 16, p3.id: 7}
+
+    run, drifts = await reconcile_stocks(db_session, full=full)
+    assert run.drift_count == 0 and drifts == []
+
+@pytest.mark.asyncio
+async def test_reconcile_resumes_from_checkpoint(db_session: AsyncSession, ledger_data):
+    """중단된 실행이 있으면 마지막으로 확인한 키 다음부터 이어서 처리한다"""
+    keys = sorted((p.id.hex, p.id) for p in ledger_data["products"][:2])
+    first_id = keys[0][1]
+    interrupted = ReconciliationRun(
+        basis_at=datetime(2026, 1, 2), repair=False, checked_count=1, drift_count=0, repaired_count=0,
+        last_product_id=first_id, last_store_id=ledger_data["store"].id, started_at=datetime.utcnow(),
+    )
+    db_session.add(interrupted)
+    await db_session.commit()
+
+    run, _ = await reconcile_stocks(db_session, chunk_size=1)
+    assert run.id == interrupted.id
+    assert run.checked_count == 2  # 이전 1 + 남은 1
+    assert run.finished_at is not None
+
+@pytest.mark.asyncio
+async def test_reconcile_refuses_archived_ledger(db_session: AsyncSession, ledger_data):
+    """원장 파티션이 보관되면 full 모드와 보관 구간보다 오래된 스냅샷 기준 대사는 거부된다"""
+    store = ledger_data["store"]
+    p1, p2, _ = ledger_data["products"]
+    db_session.add(ArchivedPartition(
+        name="inventory_transactions_p202512", range_start=date(2025, 12, 1), range_end=date(2026, 1, 1),
+        path="/tmp/inventory_transactions_p202512.csv.gz", dropped=False,
+    ))
+    await db_session.commit()
+
+    with pytest.raises(LedgerArchivedError):
+        await reconcile_stocks(db_session, full=True, repair=True)
+    assert await _quantities(db_session, store) == {p1.id: 15, p2.id: 20}  # 보정 안 함
+
+    # 최신 스냅샷(1/2)은 보관 구간 끝(1/1) 이후이므로 증분 대사는 가능
+    run, drifts = await reconcile_stocks(db_session)
+    assert run.basis_at == datetime(2026, 1, 2)
+    assert run.drift_count == 2
+
+    db_session.add(ArchivedPartition(
+        name="inventory_transactions_p202601", range_start=date(2026, 1, 1), range_end=date(2026, 2, 1),
+        path="/tmp/inventory_transactions_p202601.csv.gz", dropped=True,
+    ))
+    await db_session.commit()
+    with pytest.raises(LedgerArchivedError):
+        await reconcile_stocks(db_session)
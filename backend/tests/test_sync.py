@@ -1,9 +1,10 @@
 import pytest
+from unittest.mock import patch
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.models.product import Product
 from app.models.store import Store
 from app.models.category import Category
@@ -11,7 +12,11 @@ from app.models.stock import CurrentStock
 from app.models.user import User, UserRole
 from app.models.user_store import UserStore
 from app.api.deps import get_current_user
+from app.core.config import settings
 from app.main import app
+from app.services import sync_jobs
+from app.services.sync_jobs import SyncJobRunner
+from tests.conftest import TestSessionLocal
 
 @pytest.fixture
 async def setup_data(db_session, sample_category_data):
@@ -35,6 +40,13 @@ async def setup_data(db_session, sample_category_data):
     
     return {"store": store, "product": prod, "user": worker}
 
+@pytest.fixture
+async def job_runner():
+    runner = SyncJobRunner(TestSessionLocal, max_concurrency=2, store_concurrency=1)
+    with patch.object(sync_jobs, "_runner", runner):
+        yield runner
+    await runner.stop()
+
 @pytest.mark.asyncio
 async def test_sync_batch_success(client: AsyncClient, db_session: AsyncSession, setup_data):
     data = setup_data
@@ -164,3 +176,348 @@ async def test_sync_partial_fail(client: AsyncClient, db_session: AsyncSession,
     assert stock.quantity == 15
     
     app.dependency_overrides.pop(get_current_user)
+
+@pytest.mark.asyncio
+async def test_sync_bulk_constant_round_trips(client: AsyncClient, db_session: AsyncSession, setup_data):
+    """배치 크기와 무관하게 고정된 수의 쿼리로 처리되어야 한다 (Set-based apply)"""
+    from app.core.query_analyzer import QueryCounter
+
+    data = setup_data
+    db_session.expunge(data["user"])
+
+    def make_batch(n):
+        return {
+            "transactions": [
+                {
+                    "localId": str(uuid4()), "type": "INBOUND", "productId": str(data["product"].id),
+                    "storeId": str(data["store"].id), "quantity": 1, "createdAt": datetime.utcnow().isoformat()
+                }
+                for _ in range(n)
+            ]
+        }
+
+    async with QueryCounter(db_session) as small:
+        res = await client.post("/api/v1/sync/transactions", json=make_batch(3))
+    assert len(res.json()["synced"]) == 3
+
+    async with QueryCounter(db_session) as large:
+        res = await client.post("/api/v1/sync/transactions", json=make_batch(60))
+    assert len(res.json()["synced"]) == 60
+
+    assert large.count == small.count
+
+    stmt = select(CurrentStock).where(CurrentStock.product_id == data["product"].id)
+    stock = (await db_session.execute(stmt)).scalar_one()
+    assert stock.quantity == 63
+
+@pytest.mark.asyncio
+async def test_sync_sequential_stock_check_within_batch(client: AsyncClient, db_session: AsyncSession, setup_data):
+    """같은 배치 안에서도 입력 순서대로 재고를 계산하고, 배치 내 중복 local_id는 한 번만 반영한다"""
+    data = setup_data
+    db_session.expunge(data["user"])
+
+    dup_id = str(uuid4())
+    base = {"productId": str(data["product"].id), "storeId": str(data["store"].id),
+            "createdAt": datetime.utcnow().isoformat()}
+    payload = {
+        "transactions": [
+            {**base, "localId": str(uuid4()), "type": "OUTBOUND", "quantity": 1},  # 재고 0 → 실패
+            {**base, "localId": dup_id, "type": "INBOUND", "quantity": 5},
+            {**base, "localId": dup_id, "type": "INBOUND", "quantity": 5},     # 배치 내 중복
+            {**base, "localId": str(uuid4()), "type": "OUTBOUND", "quantity": 5},  # 5 → 0
+            {**base, "localId": str(uuid4()), "type": "ADJUST", "quantity": -1, "reason": "DAMAGED"},
+        ]
+    }
+
+    res = await client.post("/api/v1/sync/transactions", json=payload)
+    body = res.json()
+
+    assert len(body["synced"]) == 3
+    assert len(body["failed"]) == 2
+    assert body["synced"][0]["serverId"] == body["synced"][1]["serverId"]
+    assert "Not enough stock" in body["failed"][0]["error"]
+    assert body["failed"][1]["error"] == "Cannot reduce stock below 0"
+
+    stmt = select(CurrentStock).where(CurrentStock.product_id == data["product"].id)
+    stock = (await db_session.execute(stmt)).scalar_one()
+    assert stock.quantity == 0
+
+@pytest.mark.asyncio
+async def test_sync_job_accepts_then_completes(client: AsyncClient, db_session: AsyncSession, setup_data, job_runner):
+    """작업 모드: 접수 즉시 202와 작업 ID, 완료 후 결과는 동기 응답과 같은 형태"""
+    data = setup_data
+    product_id = data["product"].id
+    base = {"productId": str(product_id), "storeId": str(data["store"].id),
+            "createdAt": datetime.utcnow().isoformat()}
+    payload = {
+        "transactions": [
+            {**base, "localId": str(uuid4()), "type": "INBOUND", "quantity": 20},
+            {**base, "localId": str(uuid4()), "type": "OUTBOUND", "quantity": 5},
+            {**base, "localId": str(uuid4()), "type": "OUTBOUND", "quantity": 100},  # 재고 부족
+        ]
+    }
+
+    res = await client.post("/api/v1/sync/jobs", json=payload)
+    assert res.status_code == 202
+    body = res.json()
+    assert body["status"] in ("PENDING", "RUNNING", "DONE")
+    assert body["itemCount"] == 3
+
+    res = await client.get(f"/api/v1/sync/jobs/{body['jobId']}", params={"wait": 5})
+    assert res.status_code == 200
+    job = res.json()
+    assert job["status"] == "DONE"
+    assert job["finishedAt"] is not None
+    assert len(job["result"]["synced"]) == 2
+    assert len(job["result"]["failed"]) == 1
+
+    stmt = select(CurrentStock).where(CurrentStock.product_id == product_id)
+    stock = (await db_session.execute(stmt)).scalar_one()
+    assert stock.quantity == 15
+
+@pytest.mark.asyncio
+async def test_sync_job_not_found(client: AsyncClient, job_runner):
+    res = await client.get(f"/api/v1/sync/jobs/{uuid4()}")
+    assert res.status_code == 404
+
+@pytest.mark.asyncio
+async def test_recover_sync_jobs_judges_staleness_by_heartbeat(db_session: AsyncSession, job_runner):
+    """오래전에 시작했어도 heartbeat가 최근이면 처리 중으로 보고 되돌리지 않는다"""
+    from app.models.sync_job import SyncJob
+
+    long_ago = datetime.utcnow() - timedelta(minutes=settings.SYNC_JOB_STALE_MINUTES + 60)
+    alive = SyncJob(status="RUNNING", item_count=0, payload={"transactions": []}, claim_id=uuid4(),
+                    started_at=long_ago, heartbeat_at=datetime.utcnow())
+    dead = SyncJob(status="RUNNING", item_count=0, payload={"transactions": []}, claim_id=uuid4(),
+                   started_at=long_ago, heartbeat_at=long_ago)
+    db_session.add_all([alive, dead])
+    await db_session.commit()
+
+    with patch.object(job_runner, "submit", lambda job_id: None):
+        recovered = await sync_jobs.recover_sync_jobs(TestSessionLocal)
+    assert recovered == [dead.id]
+
+    await db_session.refresh(alive)
+    await db_session.refresh(dead)
+    assert alive.status == "RUNNING"
+    assert (dead.status, dead.claim_id, dead.heartbeat_at) == ("PENDING", None, None)
+
+@pytest.mark.asyncio
+async def test_sync_job_result_discarded_when_claim_lost(db_session: AsyncSession, setup_data, job_runner):
+    """처리 중 복구되어 다른 실행이 선점하면 이 실행의 반영과 완료 기록을 함께 버린다"""
+    from app.models.sync_job import SyncJob
+    from app.models.transaction import InventoryTransaction
+    from app.schemas.sync import SyncRequest
+    from app.services import sync as sync_service
+
+    data = setup_data
+    request = SyncRequest.model_validate({"transactions": [{
+        "localId": str(uuid4()), "type": "INBOUND", "quantity": 5,
+        "productId": str(data["product"].id), "storeId": str(data["store"].id),
+        "createdAt": datetime.utcnow().isoformat(),
+    }]})
+    job = await sync_jobs.create_sync_job(db_session, request)
+    real_sync = sync_service.sync_transactions
+
+    async def sync_then_lose_claim(db, request, **kwargs):
+        response = await real_sync(db, request, **kwargs)
+        # 다른 프로세스가 복구 후 다시 선점한 상황
+        await db.execute(update(SyncJob).where(SyncJob.id == job.id).values(claim_id=uuid4()))
+        return response
+
+    with patch.object(sync_service, "sync_transactions", sync_then_lose_claim):
+        async with TestSessionLocal() as db:
+            await job_runner._process(db, job.id, request)
+
+    await db_session.refresh(job)
+    assert job.status == "RUNNING"
+    assert job.result is None
+    ledger = (await db_session.execute(select(InventoryTransaction))).scalars().all()
+    assert ledger == []
+
+@pytest.mark.asyncio
+async def test_sync_session_chunks_resume(client: AsyncClient, db_session: AsyncSession, setup_data):
+    """청크 세션: 순서대로 즉시 반영, 순서가 틀리면 409와 다음 청크 번호, 마지막 청크 재전송은 재반영 없음"""
+    data = setup_data
+    product_id = data["product"].id
+    base = {"productId": str(product_id), "storeId": str(data["store"].id),
+            "createdAt": datetime.utcnow().isoformat()}
+
+    def chunk(qty):
+        return {"transactions": [{**base, "localId": str(uuid4()), "type": "INBOUND", "quantity": qty}]}
+
+    res = await client.post("/api/v1/sync/sessions", json={"totalChunks": 3})
+    assert res.status_code == 201
+    session_id = res.json()["sessionId"]
+    assert res.json()["nextChunk"] == 1
+
+    res = await client.put(f"/api/v1/sync/sessions/{session_id}/chunks/1", json=chunk(10))
+    assert res.status_code == 200
+    assert res.json()["session"]["ackedChunk"] == 1
+    assert len(res.json()["result"]["synced"]) == 1
+
+    # 2번을 건너뛰고 3번 전송
+    res = await client.put(f"/api/v1/sync/sessions/{session_id}/chunks/3", json=chunk(1))
+    assert res.status_code == 409
+    assert res.json()["error"]["details"]["nextChunk"] == 2
+
+    second = chunk(5)
+    res = await client.put(f"/api/v1/sync/sessions/{session_id}/chunks/2", json=second)
+    first_result = res.json()["result"]
+    # 응답을 못 받은 클라이언트의 재전송 (다른 내용이어도 재반영하지 않음)
+    res = await client.put(f"/api/v1/sync/sessions/{session_id}/chunks/2", json=chunk(99))
+    assert res.status_code == 200
+    assert res.json()["replayed"] is True
+    assert res.json()["result"]["synced"] == first_result["synced"]
+
+    # 3번이 남아 있어 완료 불가
+    res = await client.post(f"/api/v1/sync/sessions/{session_id}/complete")
+    assert res.status_code == 409
+
+    res = await client.get(f"/api/v1/sync/sessions/{session_id}")
+    assert res.json()["nextChunk"] == 3
+    await client.put(f"/api/v1/sync/sessions/{session_id}/chunks/3", json=chunk(1))
+    res = await client.post(f"/api/v1/sync/sessions/{session_id}/complete")
+    assert res.status_code == 200
+    assert res.json()["syncedCount"] == 3
+    assert res.json()["completedAt"] is not None
+
+    stmt = select(CurrentStock).where(CurrentStock.product_id == product_id)
+    stock = (await db_session.execute(stmt)).scalar_one()
+    assert stock.quantity == 16
+
+@pytest.mark.asyncio
+async def test_sync_changes_returns_only_new_rows(client: AsyncClient, db_session: AsyncSession, setup_data):
+    """변경분 조회: 첫 조회는 전체 제품/재고, 이후에는 토큰 이후 변경만 (오프라인 과거 시각 항목 포함)"""
+    data = setup_data
+    product_id, store_id = data["product"].id, data["store"].id
+    db_session.add(CurrentStock(product_id=product_id, store_id=store_id, quantity=3))
+    await db_session.commit()
+
+    with patch.object(settings, "SYNC_CHANGES_LAG_SECONDS", 0):
+        res = await client.get("/api/v1/sync/changes", params={"store_id": str(store_id)})
+        assert res.status_code == 200
+        body = res.json()
+        assert [p["id"] for p in body["products"]] == [str(product_id)]
+        assert [s["quantity"] for s in body["stocks"]] == [3]
+        assert body["transactions"] == []
+        assert body["hasMore"] is False
+
+        # 오프라인에서 어제 발생한 입고가 지금 동기화됨
+        payload = {"transactions": [{
+            "localId": str(uuid4()), "type": "INBOUND", "productId": str(product_id),
+            "storeId": str(store_id), "quantity": 4,
+            "createdAt": (datetime.utcnow() - timedelta(days=1)).isoformat(),
+        }]}
+        await client.post("/api/v1/sync/transactions", json=payload)
+
+        res = await client.get("/api/v1/sync/changes", params={"since": body["nextToken"]})
+        body = res.json()
+        assert body["products"] == []
+        assert [s["quantity"] for s in body["stocks"]] == [7]
+        assert [t["quantity"] for t in body["transactions"]] == [4]
+
+        res = await client.get("/api/v1/sync/changes", params={"since": body["nextToken"]})
+        body = res.json()
+        assert (body["products"], body["stocks"], body["transactions"]) == ([], [], [])
+
+        res = await client.get("/api/v1/sync/changes", params={"since": "not-a-token"})
+        assert res.status_code == 400
+
+@pytest.mark.asyncio
+async def test_sync_changes_pages_with_limit(client: AsyncClient, db_session: AsyncSession, setup_data):
+    data = setup_data
+    db_session.add(Product(id=uuid4(), barcode="889", name="Prod2", category_id=data["product"].category_id))
+    await db_session.commit()
+
+    seen = []
+    token = None
+    with patch.object(settings, "SYNC_CHANGES_LAG_SECONDS", 0):
+        for _ in range(3):
+            params = {"limit": 1, **({"since": token} if token else {})}
+            body = (await client.get("/api/v1/sync/changes", params=params)).json()
+            seen += [p["barcode"] for p in body["products"]]
+            token = body["nextToken"]
+            if not body["hasMore"]:
+                break
+    assert sorted(seen) == ["888", "889"]
+
+@pytest.mark.asyncio
+async def test_sync_changes_includes_write_committed_after_poll(
+    client: AsyncClient, db_session: AsyncSession, setup_data
+):
+    """조회 시점에 진행 중이던 트랜잭션이 더 이른 변경 시각으로 나중에 커밋해도 다음 조회에 포함된다"""
+    from structlog.testing import capture_logs
+    from app.services import sync_changes
+
+    data = setup_data
+    product_id, store_id = data["product"].id, data["store"].id
+    # 1분 전에 시작해 아직 커밋하지 않은 쓰기 트랜잭션
+    started = datetime.utcnow() - timedelta(minutes=1)
+
+    async def in_flight(db):
+        return started
+
+    with patch.object(settings, "SYNC_CHANGES_LAG_SECONDS", 0), \
+            patch.object(sync_changes, "_oldest_open_transaction", in_flight), capture_logs() as logs:
+        body = (await client.get("/api/v1/sync/changes", params={"store_id": str(store_id)})).json()
+        assert body["stocks"] == []
+    # 상한이 붙잡힌 것은 경고로 남긴다
+    assert any(log["event"] == "Sync changes horizon pinned by open transaction" for log in logs)
+
+    # 그 트랜잭션이 조회 이후에 커밋됨 (변경 시각은 시작 직후, 조회 시각보다 이전)
+    db_session.add(CurrentStock(product_id=product_id, store_id=store_id, quantity=5,
+                                updated_at=started + timedelta(seconds=1)))
+    await db_session.commit()
+
+    with patch.object(settings, "SYNC_CHANGES_LAG_SECONDS", 0):
+        res = await client.get("/api/v1/sync/changes", params={"since": body["nextToken"]})
+    assert [s["quantity"] for s in res.json()["stocks"]] == [5]
+
+@pytest.mark.asyncio
+async def test_sync_batch_locks_only_touched_stock_rows(db_session: AsyncSession, setup_data):
+    """잠금 조회는 배치가 건드리는 (제품, 매장) 쌍만, 키 순서로 수행한다 (곱집합 잠금 금지)"""
+    from sqlalchemy import event
+    from app.models.transaction import TransactionType
+    from app.services.inventory import StockMutation, apply_mutation_batch
+    from tests.conftest import test_engine
+
+    data = setup_data
+    store2 = Store(id=uuid4(), code="S2", name="Store2")
+    prod2 = Product(id=uuid4(), barcode="999", name="Prod2", category_id=data["product"].category_id, safety_stock=10)
+    db_session.add_all([store2, prod2])
+    await db_session.flush()
+    p1, p2, s1, s2 = data["product"].id, prod2.id, data["store"].id, store2.id
+    for p_id in (p1, p2):
+        for s_id in (s1, s2):
+            db_session.add(CurrentStock(product_id=p_id, store_id=s_id, quantity=10, status="NORMAL"))
+    await db_session.commit()
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT current_stocks.product_id"):
+            statements.append((statement, parameters))
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        results = await apply_mutation_batch(db_session, [
+            StockMutation(p2, s2, TransactionType.OUTBOUND, -3),
+            StockMutation(p1, s1, TransactionType.INBOUND, 5),
+        ])
+        await db_session.commit()
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+    assert [r.new_stock for r in results] == [7, 15]
+    [(statement, parameters)] = statements
+    assert "ORDER BY current_stocks.product_id, current_stocks.store_id" in statement
+    assert "(current_stocks.product_id, current_stocks.store_id) IN" in statement
+    assert len(parameters) == 4  # 건드린 2쌍의 (product_id, store_id)
+
+    rows = (await db_session.execute(
+        select(CurrentStock.product_id, CurrentStock.store_id, CurrentStock.quantity)
+    )).all()
+    assert {(r.product_id, r.store_id): r.quantity for r in rows} == {
+        (p1, s1): 15, (p1, s2): 10, (p2, s1): 10, (p2, s2): 7,
+    }
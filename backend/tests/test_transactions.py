@@ -178,3 +178,88 @@ async def test_adjust_stock(client: AsyncClient, db_session: AsyncSession, setup
     assert res_data["type"] == "ADJUST"
     
     app.dependency_overrides.pop(get_current_user)
+
+@pytest.mark.asyncio
+async def test_apply_stock_delta_is_conditional(db_session: AsyncSession, setup_data):
+    """재고 변경은 DB 한 문장으로 처리: 첫 입고는 upsert, 부족한 차감은 변경 없이 None"""
+    from sqlalchemy import select
+    from app.services.inventory import apply_stock_delta
+
+    p_id, s_id = setup_data["product"].id, setup_data["store"].id
+
+    # 행이 없으면 생성
+    assert await apply_stock_delta(db_session, p_id, s_id, 7) == (7, 10)
+    # 있으면 누적
+    assert await apply_stock_delta(db_session, p_id, s_id, 3) == (10, 10)
+    # 차감 후 0 미만이 되면 거부
+    assert await apply_stock_delta(db_session, p_id, s_id, -11) is None
+    assert await apply_stock_delta(db_session, p_id, s_id, -10) == (0, 10)
+    await db_session.commit()
+
+    qty = await db_session.scalar(
+        select(CurrentStock.quantity).where(
+            CurrentStock.product_id == p_id, CurrentStock.store_id == s_id
+        )
+    )
+    assert qty == 0
+
+@pytest.mark.asyncio
+async def test_list_transactions_cursor_matches_offset(db_session: AsyncSession, setup_data):
+    """커서 페이지네이션은 OFFSET과 같은 순서로, created_at이 같은 행도 id로 구분하여 넘긴다"""
+    from datetime import datetime, timedelta
+    from app.models.transaction import InventoryTransaction, TransactionType
+    from app.services.inventory import list_transactions, transaction_cursor
+
+    data = setup_data
+    base = datetime(2026, 1, 1, 9, 0, 0)
+    db_session.add_all([
+        InventoryTransaction(
+            id=uuid4(), product_id=data["product"].id, store_id=data["store"].id,
+            user_id=data["user"].id, type=TransactionType.INBOUND, quantity=1,
+            created_at=base + timedelta(minutes=i // 2),  # 2건씩 같은 시각
+        )
+        for i in range(7)
+    ])
+    await db_session.commit()
+
+    offset_pages = [
+        (await list_transactions(db_session, page=page, limit=3, store_id=data["store"].id))[0]
+        for page in (1, 2, 3)
+    ]
+
+    cursor_pages = []
+    cursor = None
+    for _ in range(3):
+        items, total = await list_transactions(
+            db_session, limit=3, store_id=data["store"].id, cursor=cursor
+        )
+        assert total == 7
+        cursor_pages.append(items)
+        cursor = transaction_cursor(items[-1])
+
+    assert [[tx.id for tx in p] for p in cursor_pages] == [[tx.id for tx in p] for p in offset_pages]
+    assert sum(len(p) for p in cursor_pages) == 7
+
+@pytest.mark.asyncio
+async def test_list_transactions_date_range(db_session: AsyncSession, setup_data):
+    """start/end는 [start, end) 범위만 조회하고 건수도 같은 범위로 계산한다"""
+    from datetime import datetime, timezone
+    from app.models.transaction import InventoryTransaction, TransactionType
+    from app.services.inventory import list_transactions
+
+    data = setup_data
+    months = [datetime(2026, 1, 15), datetime(2026, 2, 1), datetime(2026, 2, 28, 23, 59), datetime(2026, 3, 1)]
+    db_session.add_all([
+        InventoryTransaction(
+            id=uuid4(), product_id=data["product"].id, store_id=data["store"].id,
+            user_id=data["user"].id, type=TransactionType.INBOUND, quantity=1, created_at=created_at,
+        )
+        for created_at in months
+    ])
+    await db_session.commit()
+
+    items, total = await list_transactions(
+        db_session, limit=10, start=datetime(2026, 2, 1), end=datetime(2026, 3, 1, tzinfo=timezone.utc)
+    )
+    assert total == 2
+    assert [tx.created_at for tx in items] == [months[2], months[1]]
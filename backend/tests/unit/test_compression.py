@@ -0,0 +1,142 @@
+"""
+압축 미들웨어 단위 테스트 (요청 본문 해제 / 응답 협상 압축)
+"""
+import gzip
+import tracemalloc
+import zlib
+
+import pytest
+import zstandard
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.compression import CompressionMiddleware, _Decoder, negotiate_encoding
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100, max_decoded_bytes=10_000)
+
+    @app.post("/echo-size")
+    async def echo_size(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.get("/text/{size}")
+    async def text(size: int):
+        return PlainTextResponse("a" * size)
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            for i in range(3):
+                yield f'{{"row": {i}}}\n'
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        yield client
+
+
+class TestNegotiation:
+    def test_prefers_accepted_and_skips_q0(self):
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("br") is None
+        assert negotiate_encoding("") is None
+
+
+class TestRequestDecoding:
+    async def test_gzip_body_is_decoded(self, client):
+        body = b"x" * 5000
+        res = await client.post(
+            "/echo-size", content=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+        )
+        assert res.json() == {"size": 5000}
+
+    async def test_decoded_size_limit(self, client):
+        res = await client.post(
+            "/echo-size", content=gzip.compress(b"x" * 20_000), headers={"Content-Encoding": "gzip"}
+        )
+        assert res.status_code == 413
+
+    async def test_corrupt_and_unknown_encoding(self, client):
+        res = await client.post("/echo-size", content=b"not gzip", headers={"Content-Encoding": "gzip"})
+        assert res.status_code == 400
+        res = await client.post("/echo-size", content=b"x", headers={"Content-Encoding": "br"})
+        assert res.status_code == 415
+
+
+class TestZstdRequestDecoding:
+    async def test_zstd_round_trip(self, client):
+        body = b"x" * 5000
+        res = await client.post(
+            "/echo-size", content=zstandard.ZstdCompressor().compress(body), headers={"Content-Encoding": "zstd"}
+        )
+        assert res.json() == {"size": 5000}
+
+        async with client.stream("GET", "/text/5000", headers={"Accept-Encoding": "zstd"}) as large:
+            raw = b"".join([chunk async for chunk in large.aiter_raw()])
+        assert large.headers["content-encoding"] == "zstd"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(raw) == b"a" * 5000
+
+    async def test_zstd_bomb_is_rejected(self, client):
+        # 수십 KB로 압축되는 100MB 본문 - 한도(10KB)를 넘는 즉시 413
+        bomb = zstandard.ZstdCompressor(level=19).compress(b"\0" * (100 * 1024 * 1024))
+        assert len(bomb) < 100_000
+        res = await client.post("/echo-size", content=bomb, headers={"Content-Encoding": "zstd"})
+        assert res.status_code == 413
+
+    def test_zstd_bomb_is_not_inflated_in_memory(self):
+        # 한도를 넘는 순간 멈추므로 100MB 전체를 메모리에 풀지 않음
+        bomb = zstandard.ZstdCompressor(level=19).compress(b"\0" * (100 * 1024 * 1024))
+        decoder = _Decoder("zstd", limit=10_000)
+        tracemalloc.start()
+        try:
+            with pytest.raises(HTTPException) as exc:
+                decoder.decode(bomb, final=True)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert exc.value.status_code == 413
+        assert peak < 10 * 1024 * 1024
+
+    async def test_zstd_truncated_and_trailing_data(self, client):
+        frame = zstandard.ZstdCompressor().compress(b"x" * 5000)
+        res = await client.post("/echo-size", content=frame[:-4], headers={"Content-Encoding": "zstd"})
+        assert res.status_code == 400
+        res = await client.post("/echo-size", content=frame + b"garbage", headers={"Content-Encoding": "zstd"})
+        assert res.status_code == 400
+
+
+class TestResponseCompression:
+    async def test_threshold(self, client):
+        small = await client.get("/text/50", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+
+        async with client.stream("GET", "/text/5000", headers={"Accept-Encoding": "gzip"}) as large:
+            raw = b"".join([chunk async for chunk in large.aiter_raw()])
+        assert large.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in large.headers["vary"]
+        assert int(large.headers["content-length"]) == len(raw) < 5000
+        assert gzip.decompress(raw) == b"a" * 5000
+
+    async def test_not_accepted(self, client):
+        res = await client.get("/text/5000", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in res.headers
+        assert res.text == "a" * 5000
+
+    async def test_streaming_response_is_compressed_per_chunk(self, client):
+        async with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as res:
+            chunks = [chunk async for chunk in res.aiter_raw()]
+        assert res.headers["content-encoding"] == "gzip"
+        assert "content-length" not in res.headers
+        # 청크마다 flush되므로 앞 청크만으로도 해당 행까지 풀림
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decoder.decompress(chunks[0]).startswith(b'{"row": 0}')
+        decoded = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(b"".join(chunks))
+        assert decoded.decode().splitlines() == ['{"row": 0}', '{"row": 1}', '{"row": 2}']
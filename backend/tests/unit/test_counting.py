@@ -0,0 +1,90 @@
+"""
+목록 건수 계산 / TTL 캐시 단위 테스트
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.cache import TTLCache
+from app.core.counting import count_rows
+
+
+class TestTTLCache:
+    """LRU + TTL 캐시"""
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")          # a를 최근 사용으로
+        cache.set("c", 3)       # b 제거
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats() == {
+            "size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1,
+        }
+
+    def test_expired_entry_is_miss(self):
+        cache = TTLCache(maxsize=10, ttl_seconds=5)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("k", 42)
+        with patch("app.core.cache.time.monotonic", return_value=104.0):
+            assert cache.get("k") == 42
+        with patch("app.core.cache.time.monotonic", return_value=105.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TTLCache(maxsize=10, ttl_seconds=0)
+        cache.set("k", 1)
+        assert cache.get("k") is None
+
+
+class TestCountRows:
+    """count 모드별 동작"""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.get_bind = MagicMock()
+        db.get_bind.return_value.dialect.name = "sqlite"
+        result = MagicMock()
+        result.scalar_one.return_value = 7
+        db.execute.return_value = result
+        return db
+
+    @pytest.fixture
+    def query(self):
+        from sqlalchemy import select
+        from app.models.product import Product
+        return select(Product)
+
+    @pytest.mark.asyncio
+    async def test_none_skips_query(self, mock_db, query):
+        assert await count_rows(mock_db, query, "none") is None
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_exact_count_is_cached_per_key(self, mock_db, query):
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        with patch("app.core.counting.count_cache", cache):
+            assert await count_rows(mock_db, query, "exact", cache_key=("p", None)) == 7
+            assert await count_rows(mock_db, query, "exact", cache_key=("p", None)) == 7
+            assert mock_db.execute.await_count == 1
+
+            # 다른 필터 조합은 별도로 계산
+            await count_rows(mock_db, query, "exact", cache_key=("p", "x"))
+            assert mock_db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_estimate_falls_back_to_exact_without_planner_stats(self, mock_db, query):
+        assert await count_rows(mock_db, query, "estimate") == 7
+        mock_db.execute.assert_awaited_once()
+
+    def test_explain_statement_compiles_for_postgresql(self, query):
+        from sqlalchemy.dialects import postgresql
+        from app.core.query_analyzer import ExplainStatement
+
+        sql = str(ExplainStatement(query).compile(dialect=postgresql.dialect()))
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
@@ -21,6 +21,16 @@ from app.models.product import Product
 from app.models.transaction import TransactionType
 
 
+def _atomic_delta(stock):
+    """apply_stock_delta 대체: Mock 재고에 조건부 UPDATE와 같은 규칙으로 증감 적용"""
+    async def _apply(db, product_id, store_id, delta):
+        if stock.quantity + delta < 0:
+            return None
+        stock.quantity += delta
+        return stock.quantity, stock.product.safety_stock
+    return _apply
+
+
 class TestGetStockStatus:
     """재고 상태 계산 테스트"""
 
@@ -96,13 +106,11 @@ class TestProcessInbound:
             note="테스트 입고"
         )
 
-        # Mock _get_or_create_stock
+        # Mock apply_stock_delta (DB의 조건부 UPDATE 동작 재현)
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = mock_stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(mock_stock)
+        ):
             # When
             tx, new_qty, alert = await process_inbound(mock_db, data, mock_user)
 
@@ -166,11 +174,9 @@ class TestProcessOutbound:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = mock_stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(mock_stock)
+        ):
             # When
             tx, new_qty, alert = await process_outbound(mock_db, data, mock_user)
 
@@ -200,15 +206,19 @@ class TestProcessOutbound:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = stock
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(stock)
+        ):
+            mock_db.scalar.return_value = stock.quantity
 
             # When & Then
-            with pytest.raises(InsufficientStockException):
+            with pytest.raises(InsufficientStockException) as exc_info:
                 await process_outbound(mock_db, data, mock_user)
 
+            assert "Current: 5" in exc_info.value.message
+            # 재고는 변경되지 않아야 함
+            assert stock.quantity == 5
+
             # 커밋이 호출되지 않아야 함
             mock_db.commit.assert_not_called()
 
@@ -233,11 +243,9 @@ class TestProcessOutbound:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(stock)
+        ):
             # When
             tx, new_qty, alert = await process_outbound(mock_db, data, mock_user)
 
@@ -299,11 +307,9 @@ class TestProcessAdjust:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = mock_stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(mock_stock)
+        ):
             tx, new_qty, alert = await process_adjust(mock_db, data, mock_user)
 
             assert mock_stock.quantity == initial_quantity + adjust_qty
@@ -327,11 +333,9 @@ class TestProcessAdjust:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = mock_stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(mock_stock)
+        ):
             tx, new_qty, alert = await process_adjust(mock_db, data, mock_user)
 
             assert mock_stock.quantity == initial_quantity + adjust_qty
@@ -359,10 +363,8 @@ class TestProcessAdjust:
         )
 
         with patch(
-            'app.services.inventory._get_or_create_stock',
-            new_callable=AsyncMock
-        ) as mock_get_stock:
-            mock_get_stock.return_value = stock
-
+            'app.services.inventory.apply_stock_delta',
+            side_effect=_atomic_delta(stock)
+        ):
             with pytest.raises(InsufficientStockException):
                 await process_adjust(mock_db, data, mock_user)
@@ -0,0 +1,55 @@
+"""
+메트릭 레지스트리 / 미들웨어 / GET /metrics 테스트
+"""
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+BARCODE_ROUTE = "/api/v1/products/barcode/{barcode}"
+
+
+def _sample(text: str, prefix: str) -> float:
+    """prefix로 시작하는 시계열 값 (없으면 0)"""
+    for line in text.splitlines():
+        if line.startswith(prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_histogram_and_gauge_exposition():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "latency", ("route",), buckets=(0.1, 1.0))
+    registry.gauge("pool_size", "pool", callback=lambda: [((), 5)])
+    latency.observe(0.05, ("/a",))
+    latency.observe(0.5, ("/a",))
+    latency.observe(3.0, ("/a",))
+
+    text = registry.render()
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert "pool_size 5" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_template_and_queries(client):
+    before = (await client.get("/metrics")).text
+    queries_before = _sample(before, f'db_queries_per_request_sum{{route="{BARCODE_ROUTE}"}}')
+
+    await client.get("/api/v1/products/barcode/9999999999999")
+    await client.get("/api/v1/products/barcode/8888888888888")
+
+    res = await client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = res.text
+
+    # 경로 값이 아니라 템플릿으로 집계
+    assert f'http_request_duration_seconds_count{{method="GET",route="{BARCODE_ROUTE}",status="404"}}' in text
+    assert "9999999999999" not in text
+    assert "http_requests_in_flight 0" in text
+    assert _sample(text, f'db_queries_per_request_sum{{route="{BARCODE_ROUTE}"}}') >= queries_before + 2
+    assert "db_pool_checked_out" in text
+    assert 'cache_misses{cache="barcode"}' in text
@@ -0,0 +1,51 @@
+"""
+Request ID / 로깅 미들웨어 단위 테스트 (순수 ASGI)
+"""
+import pytest
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import LoggingMiddleware, RequestIdMiddleware
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/context")
+    async def context():
+        # 미들웨어에서 바인딩한 로그 컨텍스트가 앱 코드에서도 보여야 함
+        return structlog.contextvars.get_contextvars()
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            for i in range(3):
+                yield f"{i}\n"
+        return StreamingResponse(rows(), media_type="text/plain")
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        yield client
+
+
+async def test_request_id_propagated_and_bound(client):
+    res = await client.get("/context", headers={"X-Request-ID": "req-123"})
+    assert res.headers["X-Request-ID"] == "req-123"
+    assert res.json() == {"request_id": "req-123", "path": "/context", "method": "GET"}
+
+    res = await client.get("/context")
+    assert len(res.headers["X-Request-ID"]) == 36  # 새 UUID
+
+
+async def test_streaming_response_passes_through(client):
+    res = await client.get("/stream")
+    assert res.text == "0\n1\n2\n"
+    assert "X-Request-ID" in res.headers
@@ -0,0 +1,38 @@
+"""
+트랜잭션 원장 월별 파티션 헬퍼 단위 테스트
+"""
+import pytest
+from datetime import date
+
+from app.db.partitions import (
+    add_months,
+    detach_partition,
+    ensure_transaction_partitions,
+    list_transaction_partitions,
+    partition_name,
+)
+
+
+class TestMonthHelpers:
+    def test_add_months_crosses_year(self):
+        assert add_months(date(2026, 11, 20), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 31), -1) == date(2025, 12, 1)
+        assert add_months(date(2026, 5, 9), 0) == date(2026, 5, 1)
+
+    def test_partition_name(self):
+        assert partition_name(date(2026, 3, 1)) == "inventory_transactions_p202603"
+
+
+@pytest.mark.asyncio
+async def test_non_postgres_is_noop(db_session):
+    """PostgreSQL이 아니면(테스트 SQLite) 파티션 작업은 아무것도 하지 않는다"""
+    assert await ensure_transaction_partitions(db_session, months_ahead=2) == []
+    assert await list_transaction_partitions(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_detach_rejects_non_partition_names(db_session):
+    with pytest.raises(ValueError):
+        await detach_partition(db_session, "inventory_transactions; DROP TABLE products")
+    with pytest.raises(ValueError):
+        await detach_partition(db_session, "inventory_transactions_default")
@@ -0,0 +1,60 @@
+"""
+요청 단위 쿼리 추적 / 쿼리 예산 / N+1 감지 테스트
+"""
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text
+from structlog.testing import capture_logs
+
+from app.middleware import QueryBudgetMiddleware, RequestIdMiddleware
+from app.models.product import Product
+from tests.conftest import TestSessionLocal
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryBudgetMiddleware, budget=5, repeat_threshold=3, server_timing=True)
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/items/{count}")
+    async def items(count: int):
+        # 목록을 돌며 한 건씩 조회하는 N+1 형태
+        async with TestSessionLocal() as session:
+            for i in range(count):
+                await session.execute(select(Product).where(Product.barcode == f"{i:013d}"))
+            await session.execute(text("SELECT 1"))
+        return {"count": count}
+
+    return app
+
+
+@pytest.fixture
+async def client(db_session):
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        yield client
+
+
+async def test_server_timing_reports_request_queries(client):
+    res = await client.get("/items/2")
+    timing = res.headers["server-timing"]
+    assert 'desc="3 queries"' in timing
+    assert timing.startswith("db;dur=") and "app;dur=" in timing
+
+
+async def test_budget_and_repeated_statement_warnings(client):
+    with capture_logs() as logs:
+        await client.get("/items/2", headers={"X-Request-ID": "ok-1"})
+    assert not [log for log in logs if log["log_level"] == "warning"]
+
+    with capture_logs() as logs:
+        await client.get("/items/6", headers={"X-Request-ID": "nplus1"})
+    events = {log["event"]: log for log in logs if log["log_level"] == "warning"}
+
+    budget = events["Query budget exceeded"]
+    assert budget["route"] == "/items/{count}"
+    assert budget["query_count"] == 7 and budget["budget"] == 5
+
+    repeated = events["Repeated query detected (possible N+1)"]
+    assert repeated["repeat_count"] == 6
+    assert repeated["statement"].startswith("SELECT products.id")
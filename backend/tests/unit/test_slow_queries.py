@@ -0,0 +1,96 @@
+"""
+느린 쿼리 실행 계획 수집 (SlowQuerySampler) 테스트
+
+실제 EXPLAIN은 PostgreSQL에서만 가능하므로 엔진/커넥션을 흉내 내고 _explain은 기록만 채웁니다.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import query_analyzer
+from app.core.query_analyzer import SlowQuerySampler, query_fingerprint
+
+SELECT_BY_CATEGORY = "SELECT products.id FROM products WHERE products.category_id = $1"
+
+
+def _fake_engine():
+    sync_engine = object()
+    conn = SimpleNamespace(engine=sync_engine, dialect=SimpleNamespace(name="postgresql"))
+    return SimpleNamespace(sync_engine=sync_engine), conn
+
+
+@pytest.fixture
+async def sampler(monkeypatch):
+    engine, conn = _fake_engine()
+    sampler = SlowQuerySampler()
+    sampler.install(engine, threshold_ms=100, capacity=2, explain_interval=300)
+    explained = []
+
+    async def fake_explain(fingerprint, statement, parameters):
+        explained.append(fingerprint)
+        sampler._records[fingerprint]["plan"] = {"Plan": {"Node Type": "Seq Scan"}}
+
+    monkeypatch.setattr(sampler, "_explain", fake_explain)
+    sampler.conn = conn
+    sampler.explained = explained
+    yield sampler
+    await sampler.shutdown()
+
+
+async def _drain(sampler):
+    await asyncio.gather(*sampler._pending)
+
+
+def test_fingerprint_ignores_values_and_in_list_length():
+    assert query_fingerprint("SELECT a FROM t WHERE id IN ($1, $2, $3) LIMIT 10") == \
+        query_fingerprint("SELECT a  FROM t\nWHERE id IN ($1) LIMIT 50")
+    assert query_fingerprint("SELECT a FROM t") != query_fingerprint("SELECT b FROM t")
+
+
+async def test_dedup_by_fingerprint_and_bounded_buffer(sampler):
+    conn = sampler.conn
+    sampler.observe(conn, SELECT_BY_CATEGORY, ("c1",), 0.2, False)
+    sampler.observe(conn, SELECT_BY_CATEGORY, ("c2",), 0.9, False)
+    await _drain(sampler)
+
+    [record] = sampler.records()
+    assert record["count"] == 2
+    assert record["max_duration_ms"] == 900.0 and record["last_duration_ms"] == 900.0
+    assert record["parameter_types"] == ["str"]
+    assert "c2" not in repr(record)  # 파라미터 값은 기록하지 않음
+    assert record["plan"] == {"Plan": {"Node Type": "Seq Scan"}}
+    assert len(sampler.explained) == 1  # 재수집 간격 안에서는 한 번만 EXPLAIN
+
+    # 용량(2)을 넘으면 가장 오래 관측되지 않은 지문부터 제거
+    sampler.observe(conn, "SELECT stores.id FROM stores", (), 0.2, False)
+    sampler.observe(conn, "SELECT categories.id FROM categories", (), 0.2, False)
+    await _drain(sampler)
+    statements = [r["statement"] for r in sampler.records()]
+    assert statements == ["SELECT categories.id FROM categories", "SELECT stores.id FROM stores"]
+
+
+async def test_ignores_other_engines_and_non_explainable(sampler):
+    _, other_conn = _fake_engine()
+    sampler.observe(other_conn, SELECT_BY_CATEGORY, (), 1.0, False)
+    sampler.observe(sampler.conn, "EXPLAIN (FORMAT JSON) SELECT 1", (), 1.0, False)
+    sampler.observe(sampler.conn, "INSERT INTO t VALUES ($1)", [(1,), (2,)], 1.0, True)
+    assert sampler.records() == []
+
+
+async def test_admin_endpoint_lists_and_clears(client, sampler, monkeypatch):
+    monkeypatch.setattr(query_analyzer, "slow_query_sampler", sampler)
+    monkeypatch.setattr("app.api.v1.admin.slow_query_sampler", sampler)
+    sampler.observe(sampler.conn, SELECT_BY_CATEGORY, ("c1",), 0.5, False)
+    await _drain(sampler)
+
+    res = await client.get("/api/v1/diagnostics/slow-queries")
+    assert res.status_code == 200
+    [item] = res.json()
+    assert item["statement"] == SELECT_BY_CATEGORY
+    assert item["maxDurationMs"] == 500.0
+    assert item["plan"]["Plan"]["Node Type"] == "Seq Scan"
+    assert item["parameterTypes"] == ["str"] and "c1" not in res.text
+
+    assert (await client.delete("/api/v1/diagnostics/slow-queries")).status_code == 204
+    assert (await client.get("/api/v1/diagnostics/slow-queries")).json() == []